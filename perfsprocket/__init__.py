@@ -1,35 +1,164 @@
 # "noqa" setting stops flake8 from flagging unused imports in __init__
 
+import sys
+
 from ._version import __version__  # noqa
-from ._file_name import (
-    Braces,
-    BRACKET,
-    PAREN,
-    CURLY,
-    ARROW,
-    SeqName,
-    FileName,
-    NameABC,
-    KEEP,
-)
-from ._file_abc import FileABC
-from perfsprocket._class_file_base import FileBase
-from ._class_file import File
-from ._class_file_sequence import FileSequence
-
-
-(
-    Braces,
-    BRACKET,
-    PAREN,
-    CURLY,
-    ARROW,
-    NameABC,
-    FileName,
-    SeqName,
-    KEEP,
-    FileABC,
-    FileBase,
-    File,
-    FileSequence,
-)
+
+# Importing typing costs more than the rest of this module, so it is only imported
+#   for type checkers, which treat any name 'TYPE_CHECKING' as true.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, List
+
+    from ._file_name import (
+        Braces,
+        BRACKET,
+        PAREN,
+        CURLY,
+        ARROW,
+        SeqName,
+        FileName,
+        NameABC,
+        KEEP,
+    )
+    from ._name_patterns import NamePatterns, PatternMatch, SEQ_PATTERNS
+    from ._frame_set import FrameSet
+    from ._file_abc import FileABC
+    from ._copy_engine import CopyEngine, ShutilEngine, BufferedEngine, LinkEngine
+    from ._durability import Durability
+    from ._rate_limit import RateLimit
+    from ._storage import Storage, LocalStorage
+    from ._memory_storage import MemoryStorage
+    from ._object_storage import ObjectStorage
+    from ._transaction import Transaction
+    from ._operations import Operation, WorkerPool
+    from ._class_file_base import FileBase
+    from ._class_file import File
+    from ._class_file_sequence import FileSequence
+    from ._class_sampled_sequence import SampledSequence
+    from ._frame_access import FrameAccessor
+    from ._frame_reader import FrameBuffer, MappingPool
+    from ._sync import SyncAction
+    from ._parallel import ProcessBackend
+    from ._usage import Usage
+    from ._discovery import find_sequences, usage, usage_iter
+    from ._serialize import encode_files, decode_files
+    from ._duplicates import find_duplicates
+    from ._archive import unpack
+
+    (
+        Braces,
+        BRACKET,
+        PAREN,
+        CURLY,
+        ARROW,
+        NameABC,
+        FileName,
+        SeqName,
+        KEEP,
+        NamePatterns,
+        PatternMatch,
+        SEQ_PATTERNS,
+        FrameSet,
+        FileABC,
+        CopyEngine,
+        ShutilEngine,
+        BufferedEngine,
+        LinkEngine,
+        Durability,
+        RateLimit,
+        Storage,
+        LocalStorage,
+        MemoryStorage,
+        ObjectStorage,
+        Transaction,
+        Operation,
+        WorkerPool,
+        FileBase,
+        File,
+        FileSequence,
+        SampledSequence,
+        FrameAccessor,
+        FrameBuffer,
+        MappingPool,
+        SyncAction,
+        ProcessBackend,
+        Usage,
+        find_sequences,
+        usage,
+        usage_iter,
+        encode_files,
+        decode_files,
+        find_duplicates,
+        unpack,
+    )
+
+
+# Public names are loaded from their module on first access (PEP 562), so importing
+#   perfsprocket only imports the modules a process actually uses. Keep in step with
+#   the imports above.
+_MODULES = {
+    "_file_name": (
+        "Braces",
+        "BRACKET",
+        "PAREN",
+        "CURLY",
+        "ARROW",
+        "SeqName",
+        "FileName",
+        "NameABC",
+        "KEEP",
+    ),
+    "_name_patterns": ("NamePatterns", "PatternMatch", "SEQ_PATTERNS"),
+    "_frame_set": ("FrameSet",),
+    "_file_abc": ("FileABC",),
+    "_copy_engine": ("CopyEngine", "ShutilEngine", "BufferedEngine", "LinkEngine"),
+    "_durability": ("Durability",),
+    "_rate_limit": ("RateLimit",),
+    "_storage": ("Storage", "LocalStorage"),
+    "_memory_storage": ("MemoryStorage",),
+    "_object_storage": ("ObjectStorage",),
+    "_transaction": ("Transaction",),
+    "_operations": ("Operation", "WorkerPool"),
+    "_class_file_base": ("FileBase",),
+    "_class_file": ("File",),
+    "_class_file_sequence": ("FileSequence",),
+    "_class_sampled_sequence": ("SampledSequence",),
+    "_frame_access": ("FrameAccessor",),
+    "_frame_reader": ("FrameBuffer", "MappingPool"),
+    "_sync": ("SyncAction",),
+    "_parallel": ("ProcessBackend",),
+    "_usage": ("Usage",),
+    "_discovery": ("find_sequences", "usage", "usage_iter"),
+    "_serialize": ("encode_files", "decode_files"),
+    "_duplicates": ("find_duplicates",),
+    "_archive": ("unpack",),
+}
+
+_EXPORTS = {name: module for module, names in _MODULES.items() for name in names}
+
+__all__ = ["__version__", *_EXPORTS]
+
+
+def __getattr__(name: str) -> "Any":
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    module_path = f"{__name__}.{module}"
+    __import__(module_path)
+    value = getattr(sys.modules[module_path], name)
+    # Cached as a real module attribute, so later lookups skip this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> "List[str]":
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # Modules cannot define __getattr__ before python 3.7.
+    for _name in _EXPORTS:
+        globals()[_name] = __getattr__(_name)
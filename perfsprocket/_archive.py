@@ -0,0 +1,440 @@
+import errno
+import gzip
+import io
+import os
+import shutil
+import stat
+import sys
+import tarfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import IO, Deque, Dict, Generator, Iterable, List, Optional, Tuple, Union
+
+from ._helpers_private import _init_path
+from ._name_patterns import NamePatterns
+from ._storage import LOCAL_STORAGE, Storage
+
+
+TAR = "tar"
+ZIP = "zip"
+FORMATS = (TAR, ZIP)
+
+# Compression for each format. Tar members are compressed one frame at a time into
+#   a multi-member gzip stream, which any gzip reader treats as one stream.
+GZIP = "gzip"
+DEFLATE = "deflate"
+COMPRESSIONS = {TAR: (None, GZIP), ZIP: (None, DEFLATE)}
+
+ArchiveType = Union[str, Path, IO[bytes]]
+
+# Bytes copied at a time where frames are not sent with os.sendfile.
+COPY_BLOCK_SIZE = 1 << 20
+
+_BLOCK = tarfile.BLOCKSIZE
+_RECORD = tarfile.RECORDSIZE
+# os.sendfile only copies between regular files on linux.
+_SENDFILE = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+_ZIP_MAGIC = b"PK\x03\x04"
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def pack_iter(
+    paths: Iterable[Path],
+    dst: ArchiveType,
+    format: str = TAR,
+    compression: Optional[str] = None,
+    level: int = 6,
+    workers: int = 4,
+    arcdir: Optional[str] = None,
+    storage: Optional[Storage] = None,
+) -> Generator[Path, None, None]:
+    """
+    Writes ``paths`` into an archive, yielding each path *after* it is written. See
+    :func:`FileBase.pack_iter`. Files, and ``dst`` when it is a path, are opened
+    through ``storage``.
+    """
+    _check_format(format, compression)
+    arcdir = _clean_arcdir(arcdir)
+    if storage is None:
+        storage = LOCAL_STORAGE
+
+    owned = not hasattr(dst, "write")
+    out: IO[bytes] = dst  # type: ignore
+    if owned:
+        out = storage.open(_init_path(dst), "wb")  # type: ignore
+    try:
+        if format == ZIP:
+            yield from _zip_iter(paths, out, compression, level, arcdir, storage)
+        elif compression == GZIP:
+            yield from _tar_gzip_iter(paths, out, level, workers, arcdir, storage)
+        else:
+            yield from _tar_iter(paths, out, arcdir, storage)
+    finally:
+        if owned:
+            out.close()
+
+
+def unpack(
+    src: ArchiveType,
+    dst: Union[str, Path],
+    patterns: Optional[NamePatterns] = None,
+    storage: Optional[Storage] = None,
+) -> list:
+    """
+    Extracts an archive written by :func:`FileBase.pack` into ``dst``, and returns the
+    :class:`File` and :class:`FileSequence` objects of the extracted files.
+
+    The format and compression are read from the archive itself. Tar archives are read
+    front to back, so can come from a pipe or socket. Zip archives must be seekable.
+
+    Permission bits and modification times of members are restored where the storage
+    keeps them.
+
+    :param src: path or binary file object of the archive.
+    :param dst: folder to extract into. Created if it does not exist. Folders stored
+        in the archive are re-created below it.
+    :param patterns: naming conventions to group sequences with. Defaults to
+        ``perfsprocket.SEQ_PATTERNS``.
+    :param storage: :class:`Storage` to extract to, and to read ``src`` from when it
+        is a path. Defaults to local files.
+
+    :return: extracted files and sequences, sorted by path.
+
+    :raises ValueError: when a member would be extracted outside of ``dst``, or a zip
+        archive is not seekable.
+    """
+    # imported here, as discovery depends on the file classes that pack archives.
+    from ._discovery import catalog_names, _build_files
+    from ._parallel import conventions_of
+
+    if storage is None:
+        storage = LOCAL_STORAGE
+    dst = _init_path(dst)
+    storage.makedirs(dst)
+
+    owned = not hasattr(src, "read")
+    reader: IO[bytes] = src  # type: ignore
+    if owned:
+        reader = storage.open(_init_path(src))  # type: ignore
+    try:
+        names = _extract(reader, dst, storage)
+    finally:
+        if owned:
+            reader.close()
+
+    conventions = conventions_of(patterns)
+    found: list = list()
+    for folder, folder_names in names.items():
+        catalog = catalog_names(conventions, folder_names)
+        found.extend(_build_files(folder, catalog, storage))
+
+    found.sort(key=lambda item: str(item.path))
+    return found
+
+
+def _check_format(format: str, compression: Optional[str]) -> None:
+    if format not in COMPRESSIONS:
+        raise ValueError(f"archive format must be one of {FORMATS}, got {format!r}")
+    if compression not in COMPRESSIONS[format]:
+        raise ValueError(f"{format} archives cannot be compressed with {compression!r}")
+
+
+def _clean_arcdir(arcdir: Optional[str]) -> str:
+    if not arcdir:
+        return ""
+    member = _safe_member(arcdir)
+    return "/".join(member.parts) + "/"
+
+
+def _safe_member(name: str) -> PurePosixPath:
+    """member name as a relative path, refusing names that would escape the folder"""
+    member = PurePosixPath(name.replace("\\", "/"))
+    if member.is_absolute() or ".." in member.parts or not member.parts:
+        raise ValueError(f"archive member {name!r} is outside of the archive folder")
+    return member
+
+
+# Tar.
+
+
+def _stat_of(path: Path, source: IO[bytes], storage: Storage) -> os.stat_result:
+    """
+    stat of an open source file, from its handle where it has one, so the size read
+    matches the file opened
+    """
+    fd = _os_fd(source)
+    return storage.stat(path) if fd is None else os.fstat(fd)
+
+
+def _tar_info(
+    path: Path, source: IO[bytes], arcname: str, storage: Storage
+) -> tarfile.TarInfo:
+    """tar header of an open source file"""
+    info = tarfile.TarInfo(arcname)
+    file_stat = _stat_of(path, source, storage)
+    info.size = file_stat.st_size
+    info.mtime = int(file_stat.st_mtime)
+    info.mode = stat.S_IMODE(file_stat.st_mode)
+    return info
+
+
+def _tar_header(info: tarfile.TarInfo) -> bytes:
+    return info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+
+
+def _tar_end(offset: int) -> bytes:
+    """two empty blocks closing the archive, padded out to a whole record"""
+    end = offset + _BLOCK * 2
+    return bytes(_BLOCK * 2 + (-end % _RECORD))
+
+
+def _tar_iter(
+    paths: Iterable[Path], out: IO[bytes], arcdir: str, storage: Storage
+) -> Generator[Path, None, None]:
+    out_fd = _os_fd(out)
+    offset = 0
+
+    for path in paths:
+        with storage.open(path) as source:
+            info = _tar_info(path, source, arcdir + path.name, storage)
+            header = _tar_header(info)
+            out.write(header)
+            _copy_frame(path, source, out, out_fd, info.size)
+
+        padding = -info.size % _BLOCK
+        out.write(bytes(padding))
+        offset += len(header) + info.size + padding
+        yield path
+
+    out.write(_tar_end(offset))
+    out.flush()
+
+
+def _tar_member(
+    path: Path, arcname: str, level: int, storage: Storage
+) -> Tuple[int, bytes]:
+    """uncompressed size and gzip member of a frame's header, data and padding"""
+    with storage.open(path) as source:
+        info = _tar_info(path, source, arcname, storage)
+        data = source.read(info.size)
+
+    if len(data) != info.size:
+        raise OSError(f"{path} changed size while it was archived")
+
+    member = b"".join((_tar_header(info), data, bytes(-info.size % _BLOCK)))
+    return len(member), gzip.compress(member, level, mtime=0)
+
+
+def _tar_gzip_iter(
+    paths: Iterable[Path],
+    out: IO[bytes],
+    level: int,
+    workers: int,
+    arcdir: str,
+    storage: Storage,
+) -> Generator[Path, None, None]:
+    """
+    compresses frames on a pool of threads, keeping at most twice as many frames in
+    memory as there are workers.
+    """
+    offset = 0
+    pending: Deque[Tuple[Path, Future]] = deque()
+
+    def write_next() -> Path:
+        nonlocal offset
+        path, future = pending.popleft()
+        size, member = future.result()
+        out.write(member)
+        offset += size
+        return path
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for path in paths:
+            arcname = arcdir + path.name
+            future = executor.submit(_tar_member, path, arcname, level, storage)
+            pending.append((path, future))
+            if len(pending) >= workers * 2:
+                yield write_next()
+
+        while pending:
+            yield write_next()
+
+    out.write(gzip.compress(_tar_end(offset), level, mtime=0))
+    out.flush()
+
+
+def _os_fd(handle: IO[bytes]) -> Optional[int]:
+    """
+    descriptor of a plain or buffered OS file, ``None`` for other file objects, like
+    those of non-local storages.
+    """
+    if not isinstance(handle, (io.FileIO, io.BufferedReader, io.BufferedWriter)):
+        return None
+    try:
+        return handle.fileno()
+    except (OSError, ValueError):
+        return None
+
+
+def _copy_frame(
+    path: Path, source: IO[bytes], out: IO[bytes], out_fd: Optional[int], size: int
+) -> None:
+    """copies exactly ``size`` bytes of ``source``, in the kernel where possible"""
+    copied = 0
+    source_fd = _os_fd(source)
+
+    if _SENDFILE and out_fd is not None and source_fd is not None:
+        # buffered headers must reach the descriptor before the frame does.
+        out.flush()
+        try:
+            while copied < size:
+                sent = os.sendfile(out_fd, source_fd, copied, size - copied)
+                if not sent:
+                    break
+                copied += sent
+        except OSError:
+            if copied:
+                raise
+        source.seek(copied)
+
+    while copied < size:
+        block = source.read(min(COPY_BLOCK_SIZE, size - copied))
+        if not block:
+            break
+        out.write(block)
+        copied += len(block)
+
+    if copied != size:
+        raise OSError(f"{path} changed size while it was archived")
+
+
+# Zip.
+
+
+def _zip_iter(
+    paths: Iterable[Path],
+    out: IO[bytes],
+    compression: Optional[str],
+    level: int,
+    arcdir: str,
+    storage: Storage,
+) -> Generator[Path, None, None]:
+    compress_type = zipfile.ZIP_STORED if compression is None else zipfile.ZIP_DEFLATED
+    compresslevel = None if compression is None else level
+
+    with zipfile.ZipFile(
+        out, "w", compression=compress_type, compresslevel=compresslevel
+    ) as archive:
+        for path in paths:
+            info = _zip_info(storage.stat(path), arcdir + path.name)
+            info.compress_type = compress_type
+            large = info.file_size >= zipfile.ZIP64_LIMIT
+            with storage.open(path) as source, archive.open(
+                info, "w", force_zip64=large
+            ) as member:
+                shutil.copyfileobj(source, member, COPY_BLOCK_SIZE)
+            yield path
+
+    out.flush()
+
+
+def _zip_info(file_stat: os.stat_result, arcname: str) -> zipfile.ZipInfo:
+    """zip header of a file, as ``ZipInfo.from_file`` makes from a stat"""
+    date_time = time.localtime(file_stat.st_mtime)[:6]
+    info = zipfile.ZipInfo(arcname, date_time)  # type: ignore
+    info.external_attr = (file_stat.st_mode & 0xFFFF) << 16
+    info.file_size = file_stat.st_size
+    return info
+
+
+# Unpacking.
+
+
+def _extract(reader: IO[bytes], dst: Path, storage: Storage) -> Dict[Path, List[str]]:
+    """extracts every regular file, returning the names extracted to each folder"""
+    if not hasattr(reader, "peek"):
+        reader = io.BufferedReader(reader)  # type: ignore
+    magic = reader.peek(4)[:4]  # type: ignore
+
+    if magic == _ZIP_MAGIC:
+        if not reader.seekable():
+            raise ValueError("zip archives must be seekable to unpack")
+        return _extract_zip(reader, dst, storage)
+
+    if magic[:2] == _GZIP_MAGIC:
+        # GzipFile reads multi-member streams, which tarfile's own stream does not.
+        reader = gzip.GzipFile(fileobj=reader, mode="rb")  # type: ignore
+    with tarfile.open(fileobj=reader, mode="r|") as archive:
+        return _extract_tar(archive, dst, storage)
+
+
+def _extract_tar(
+    archive: tarfile.TarFile, dst: Path, storage: Storage
+) -> Dict[Path, List[str]]:
+    names: Dict[Path, List[str]] = dict()
+    for info in archive:
+        if not info.isfile():
+            continue
+        source = archive.extractfile(info)
+        assert source is not None
+        path = _extract_member(source, dst, info.name, info.mode, info.mtime, storage)
+        names.setdefault(path.parent, list()).append(path.name)
+    return names
+
+
+def _extract_zip(
+    reader: IO[bytes], dst: Path, storage: Storage
+) -> Dict[Path, List[str]]:
+    names: Dict[Path, List[str]] = dict()
+    with zipfile.ZipFile(reader) as archive:
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            mode = info.external_attr >> 16
+            mtime = _zip_mtime(info)
+            with archive.open(info) as source:
+                path = _extract_member(source, dst, info.filename, mode, mtime, storage)
+            names.setdefault(path.parent, list()).append(path.name)
+    return names
+
+
+def _zip_mtime(info: zipfile.ZipInfo) -> float:
+    return time.mktime(info.date_time + (0, 0, -1))
+
+
+def _extract_member(
+    source: IO[bytes],
+    dst: Path,
+    name: str,
+    mode: int,
+    mtime: float,
+    storage: Storage,
+) -> Path:
+    path = dst.joinpath(*_safe_member(name).parts)
+    storage.makedirs(path.parent)
+
+    with storage.open(path, "wb") as target:
+        shutil.copyfileobj(source, target, COPY_BLOCK_SIZE)
+
+    _restore_metadata(path, mode, mtime, storage)
+    return path
+
+
+def _restore_metadata(path: Path, mode: int, mtime: float, storage: Storage) -> None:
+    """
+    restores permission bits and mtime of an extracted member, skipping those the
+    storage does not keep, like object stores.
+    """
+    mtime_ns = round(mtime * 1e9)
+    try:
+        if stat.S_IMODE(mode):
+            storage.chmod(path, stat.S_IMODE(mode))
+        storage.utime(path, (mtime_ns, mtime_ns))
+    except NotImplementedError:
+        pass
+    except OSError as error:
+        if error.errno != errno.ENOTSUP:
+            raise
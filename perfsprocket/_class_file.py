@@ -1,22 +1,38 @@
 from pathlib import Path, PurePath
-from typing import Union, Generator, Tuple, TypeVar
+from typing import Any, Dict, Optional, Union, Generator, Tuple, Type, TypeVar
 
 from ._class_file_base import FileBase
 from ._helpers_private import _init_path
 from ._file_name import FileName, NameABC
+from ._storage import Storage, LOCAL_STORAGE
+from ._transaction import Transaction
 
 
 SelfType = TypeVar("SelfType", bound="File")
 
 
 class File(FileBase):
-    def __init__(self, path: Union[str, PurePath]):
+    def __init__(self, path: Union[str, PurePath], storage: Optional[Storage] = None):
         """
         :param path: to file
+        :param storage: :class:`Storage` the file lives on. Defaults to local files.
         """
         path = _init_path(path)
         self._path: Path = path
         self._name: FileName = FileName.from_path(path)
+        self._storage = LOCAL_STORAGE if storage is None else storage
+
+    @classmethod
+    def from_dict(cls: Type[SelfType], data: Dict[str, Any]) -> SelfType:
+        """New file from :func:`File.to_dict`. Does not touch disk."""
+        return cls(data["path"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """File as a JSON friendly dict, with the class name under ``'type'``."""
+        return {"type": type(self).__name__, "path": str(self._path)}
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self._path,)
 
     def __iter__(self) -> Generator[Path, None, None]:
         """Yields 1 path"""
@@ -39,13 +55,23 @@ class File(FileBase):
         return self._path
 
     def init_new(self: SelfType, path_new: Path) -> SelfType:
-        return type(self)(path_new)
+        return type(self)(path_new, self._storage)
 
     def rename_iter(
-        self: SelfType, name: Union[str, NameABC]
+        self: SelfType,
+        name: Union[str, NameABC],
+        transaction: Optional[Transaction] = None,
     ) -> Generator[Union[Tuple[Path, Path], SelfType], None, None]:
-        """Renames file. Yields new `File` as last object"""
+        """
+        Renames file. Yields new `File` as last object
+
+        :param name: new file name.
+        :param transaction: :class:`Transaction` to log each completed step to, so
+            the operation can be rolled back.
+        """
         new_path = self.path.with_name(str(name))
-        self.path.rename(new_path)
+        self._storage.rename(self.path, new_path)
+        if transaction is not None:
+            transaction.record(self.path, new_path, self._storage)
         yield self.path, new_path
-        yield type(self)(new_path)
+        yield self.init_new(new_path)
@@ -1,16 +1,29 @@
-import os
-import shutil
+from functools import partial
 from pathlib import Path
-from typing import Generator, Union, Optional, cast, Tuple, TypeVar, Any
+from typing import Generator, Union, Optional, cast, Tuple, TypeVar, Any, IO
 
-from perfsprocket import FileABC, NameABC
+from perfsprocket._file_abc import FileABC
+from perfsprocket._file_name import NameABC
 from perfsprocket._helpers_private import _init_path
+from perfsprocket._copy_engine import CopyEngine, LinkEngine
+from perfsprocket._durability import Durability, NO_DURABILITY
+from perfsprocket._rate_limit import (
+    RateLimit,
+    acquire_size,
+    limits_for,
+    throttle_pairs,
+)
+from perfsprocket._storage import Storage, LocalStorage
+from perfsprocket._transaction import Transaction
+from perfsprocket._usage import Usage
 
 
 SelfType = TypeVar("SelfType", bound="FileBase")
 
 
 class FileBase(FileABC):
+    _storage: Storage
+
     def __init__(self, path: Union[str, Path], *args: Any):
         raise NotImplementedError
 
@@ -32,21 +45,53 @@ class FileBase(FileABC):
     def name(self) -> NameABC:
         raise NotImplementedError
 
+    @property
+    def storage(self) -> Storage:
+        """
+        :class:`Storage` the files live on, which file operations go through. Not
+        carried over by ``to_dict`` or pickling, which always describe local files.
+        """
+        return self._storage
+
     def init_new(self: SelfType, path_new: Path) -> SelfType:
         """initialize new object at end of copy or move."""
         raise NotImplementedError
 
-    def move_iter(self: SelfType, dst_folder: Union[str, Path]) -> "BaseIterType":
+    def move_iter(
+        self: SelfType,
+        dst_folder: Union[str, Path],
+        durability: Optional[Durability] = None,
+        transaction: Optional[Transaction] = None,
+        rate_limit: Optional[RateLimit] = None,
+    ) -> "BaseIterType":
         """
-        Iterates through self, moving files to root level of dst_folder
+        Iterates through self, moving files to root level of dst_folder. Files are
+        renamed, or copied then deleted where dst_folder is on another device.
+
+        :param dst_folder: folder to move to.
+        :param durability: :class:`Durability` policy for flushing the source and
+            destination folders. Defaults to leaving flushing to the OS.
+        :param transaction: :class:`Transaction` to log each completed step to, so
+            the operation can be rolled back.
+        :param rate_limit: :class:`RateLimit` to pace files by, on top of any limit
+            applied to dst_folder or set globally.
         """
         dst_folder = _init_path(dst_folder)
         first: Optional[Path] = None
 
-        for path in self:
-            dst = dst_folder / path.name
-            path.rename(dst)
+        if durability is None:
+            durability = NO_DURABILITY
 
+        # Renames only change folder entries. Files copied between devices are synced
+        #   by the storage before their sources are deleted.
+        moved = durability.flush_iter(
+            self._rename_to(dst_folder, transaction, rate_limit),
+            data=False,
+            folders=[self.path.parent],
+            storage=self.storage,
+        )
+
+        for dst in moved:
             if first is None:
                 first = dst
 
@@ -55,27 +100,85 @@ class FileBase(FileABC):
         first = cast(Path, first)
         yield self.init_new(first)
 
-    def move(self: SelfType, dst_folder: Union[str, Path]) -> SelfType:
+    def _rename_to(
+        self,
+        dst_folder: Path,
+        transaction: Optional[Transaction] = None,
+        rate_limit: Optional[RateLimit] = None,
+    ) -> Generator[Path, None, None]:
+        pairs = ((path, dst_folder / path.name) for path in self)
+        limits = limits_for(dst_folder, rate_limit)
+        before_copy = None
+        if limits:
+            pairs = throttle_pairs(pairs, limits)
+            # moves between devices copy data, which counts towards limits on bytes.
+            before_copy = partial(acquire_size, limits, self._size_of)
+
+        for src, dst in self.storage.move_pairs(pairs, before_copy):
+            if transaction is not None:
+                transaction.record(src, dst, self.storage)
+            yield dst
+
+    def move(
+        self: SelfType,
+        dst_folder: Union[str, Path],
+        durability: Optional[Durability] = None,
+        transaction: Optional[Transaction] = None,
+        rate_limit: Optional[RateLimit] = None,
+    ) -> SelfType:
         """
         Executes :func:`FileBase.move_iter` and yield final item.
         """
-        for item in self.move_iter(dst_folder):
+        for item in self.move_iter(dst_folder, durability, transaction, rate_limit):
             pass
 
         item = cast(SelfType, item)
         return item
 
-    def copy_iter(self: SelfType, dst_folder: Union[str, Path]) -> "BaseIterType":
+    def copy_iter(
+        self: SelfType,
+        dst_folder: Union[str, Path],
+        engine: Optional[CopyEngine] = None,
+        durability: Optional[Durability] = None,
+        link: Optional[str] = None,
+        rate_limit: Optional[RateLimit] = None,
+    ) -> "BaseIterType":
         """
         Iterates through self, copying files to root level of dst_folder
+
+        :param dst_folder: folder to copy to.
+        :param engine: :class:`CopyEngine` that does the copying. Defaults to the copy
+            method of the storage, which is :class:`ShutilEngine` for local files.
+        :param durability: :class:`Durability` policy for flushing copies to disk.
+            Defaults to leaving flushing to the OS.
+        :param link: ``'hard'``, ``'sym'`` or ``'reflink'`` to link files rather than
+            copy them, see :class:`LinkEngine`. ``engine`` then copies only the files
+            that cannot be linked.
+        :param rate_limit: :class:`RateLimit` to pace files by, on top of any limit
+            applied to dst_folder or set globally.
         """
         dst_folder = _init_path(dst_folder)
         first: Optional[Path] = None
 
-        for path in self:
-            dst = dst_folder / path.name
-            shutil.copy(str(path), str(dst))
-
+        if link is not None:
+            engine = LinkEngine(link, fallback=engine)
+        if engine is not None and not isinstance(self.storage, LocalStorage):
+            raise ValueError("copy engines and links only copy local files")
+        if durability is None:
+            durability = NO_DURABILITY
+
+        pairs = ((path, dst_folder / path.name) for path in self)
+        limits = limits_for(dst_folder, rate_limit)
+        if limits:
+            pairs = throttle_pairs(pairs, limits, self._size_of)
+
+        if engine is None:
+            copied = self.storage.copy_pairs(pairs)
+        else:
+            copied = engine.copy_pairs(pairs)
+        copied = durability.flush_iter(copied, storage=self.storage)
+
+        for dst in copied:
             if first is None:
                 first = dst
 
@@ -84,36 +187,61 @@ class FileBase(FileABC):
         first = cast(Path, first)
         yield self.init_new(first)
 
-    def copy(self: SelfType, dst_folder: Union[str, Path]) -> "SelfType":
+    def _size_of(self, path: Path) -> int:
+        return self.storage.stat(path).st_size
+
+    def copy(
+        self: SelfType,
+        dst_folder: Union[str, Path],
+        engine: Optional[CopyEngine] = None,
+        durability: Optional[Durability] = None,
+        link: Optional[str] = None,
+        rate_limit: Optional[RateLimit] = None,
+    ) -> "SelfType":
         """
         Executes :func:`FileBase.copy_iter` and yields final item.
         """
-        for item in self.copy_iter(dst_folder):
+        copied = self.copy_iter(dst_folder, engine, durability, link, rate_limit)
+        for item in copied:
             pass
 
         item = cast(SelfType, item)
         return item
 
     def rename_iter(
-        self: SelfType, name: Union[str, NameABC]
+        self: SelfType,
+        name: Union[str, NameABC],
+        transaction: Optional[Transaction] = None,
     ) -> Generator[Union[Tuple[Path, Path], SelfType], None, None]:
         raise NotImplementedError
 
-    def rename(self: SelfType, name: Union[str, NameABC]) -> SelfType:
+    def rename(
+        self: SelfType,
+        name: Union[str, NameABC],
+        transaction: Optional[Transaction] = None,
+    ) -> SelfType:
         """
         Executes :func:`FileBase.rename_iter` and yields final item.
         """
-        for item in self.rename_iter(name):
+        for item in self.rename_iter(name, transaction):
             pass
 
         item = cast(SelfType, item)
         return item
 
+    def du(self) -> Usage:
+        """
+        Disk usage of the files, from one batch stat of the storage. Local files are
+        stat-ed from a single ``os.scandir`` of their folder rather than a stat of
+        each path. Files that do not exist are counted as missing.
+        """
+        paths = list(self)
+        stats = self.storage.stat_paths(paths)
+        return Usage.from_stats(stats.values(), missing=len(paths) - len(stats))
+
     def delete_iter(self) -> Generator[Path, None, None]:
         """Iterates through self, deleting each path."""
-        for path in self:
-            os.remove(str(path))
-            yield path
+        return self.storage.delete_paths(self)
 
     def delete(self) -> None:
         """Executes :func:`delete_iter`."""
@@ -122,14 +250,61 @@ class FileBase(FileABC):
 
     def chmod_iter(self, mode: int) -> Generator[Path, None, None]:
         """Iterates through self, changing permissions on each path to ``mode``."""
-        for path in self:
-            path.chmod(mode)
-            yield path
+        return self.storage.chmod_paths(self, mode)
 
     def chmod(self, mode: int) -> None:
         """Executes :func:`FileBase.chmod_iter`."""
         for _ in self.chmod_iter(mode):
             pass
 
+    def pack_iter(
+        self,
+        dst: Union[str, Path, IO[bytes]],
+        format: str = "tar",
+        compression: Optional[str] = None,
+        level: int = 6,
+        workers: int = 4,
+        arcdir: Optional[str] = None,
+    ) -> Generator[Path, None, None]:
+        """
+        Iterates through self, streaming each file straight into an archive with no
+        staging copy, and yielding each path *after* it is written.
+
+        Uncompressed tar archives written to an OS file or path have frame data copied
+        by the kernel with ``os.sendfile`` where available. Compressed tar archives
+        have each frame compressed on a pool of threads, into one gzip member per frame.
+        At most ``workers * 2`` frames are held in memory at once.
+
+        :param dst: path on the same storage, or binary file object, to write the
+            archive to. File objects do not need to be seekable, so archives can be
+            written to pipes or sockets.
+        :param format: ``'tar'`` or ``'zip'``.
+        :param compression: ``None``, ``'gzip'`` for tar or ``'deflate'`` for zip.
+        :param level: compression level, from 1 (fastest) to 9 (smallest).
+        :param workers: frames compressed at once for compressed tar archives.
+        :param arcdir: folder to store files under inside the archive. Files are
+            stored at its root by default.
+
+        :raises ValueError: on an unknown format or compression.
+        """
+        from perfsprocket._archive import pack_iter
+
+        yield from pack_iter(
+            self, dst, format, compression, level, workers, arcdir, self.storage
+        )
+
+    def pack(
+        self,
+        dst: Union[str, Path, IO[bytes]],
+        format: str = "tar",
+        compression: Optional[str] = None,
+        level: int = 6,
+        workers: int = 4,
+        arcdir: Optional[str] = None,
+    ) -> None:
+        """Executes :func:`FileBase.pack_iter`."""
+        for _ in self.pack_iter(dst, format, compression, level, workers, arcdir):
+            pass
+
 
 BaseIterType = Generator[Union[Path, SelfType], None, None]
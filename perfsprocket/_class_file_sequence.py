@@ -1,28 +1,62 @@
+import re
 from pathlib import Path
-from typing import Union, List, overload, Generator, Tuple, Optional, TypeVar
-
-from perfsprocket import FileBase
-from ._file_name import SeqName, NameABC, BRACKET
+from typing import (
+    Any,
+    Dict,
+    Union,
+    List,
+    overload,
+    Generator,
+    Tuple,
+    Optional,
+    Iterable,
+    Sequence,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from ._class_file_base import FileBase
+from ._class_sampled_sequence import SampledSequence
+from ._concat import concat_iter, split_iter, ConcatIterType, SplitIterType, MOVE
+from ._file_name import (
+    SeqName,
+    NameABC,
+    BRACKET,
+    KEEP,
+    _frame_affixes,
+    _format_file_num,
+)
+from ._frame_set import FrameSet
+from ._frame_access import FrameAccessor, FD
+from ._frame_reader import FrameBuffer, MappingPool, SEQUENTIAL, RANDOM, WILLNEED
 from ._helpers_private import _init_path
+from ._name_patterns import NamePatterns
+from ._rate_limit import RateLimit
+from ._rename_plan import plan_renames, run_plan
+from ._storage import Storage, LocalStorage, LOCAL_STORAGE
+from ._sync import sync_to_iter, SyncIterType
+from ._transaction import Transaction
 
 
 def seq_get_index(seq: "FileSequence", item: int) -> Path:
-    print(str(seq.name), seq.start, seq.end, item)
     if item < 0:
-        num = seq._end + item + 1
+        num = seq._end + (item + 1) * seq._step
     else:
-        num = seq._start + item
+        num = seq._start + item * seq._step
 
     if num < seq._start or num > seq.end:
         raise IndexError
 
-    name = str(seq._name.alter(start=num, end=None))
-    return seq._parent / name
+    return seq._parent / seq.frame_name(num)
 
 
 def seq_get_slice(seq: "FileSequence", bounds: slice) -> "FileSequence":
-    num_list: List[int] = list(range(seq._start, seq._end + 1))[bounds]
-    return FileSequence(seq.path, num_list[0], num_list[-1])
+    nums = range(seq._start, seq._end + 1, seq._step)[bounds]
+    first, last = sorted((nums[0], nums[-1]))
+    return seq.from_name(
+        seq._parent, seq._name, first, last, abs(nums.step), seq._storage
+    )
 
 
 @overload
@@ -51,8 +85,24 @@ def filenum_index(  # noqa: F811
         #   a file from the end of the sequence because of the negative roll over.
         if index < 0:
             raise IndexError("Frame Out of range")
+        elif index % seq.step:
+            raise IndexError("Frame not on sequence step")
         else:
-            return index
+            return index // seq.step
+
+
+def filenum_slice_index(index: Optional[int], seq: "FileSequence") -> Optional[int]:
+    """
+    Converts file number slice bound to conventional index. Bounds between the frames
+    of a stepped sequence round up to the next frame.
+    """
+    if index is None or index < 0:
+        return index
+
+    index -= seq.start
+    if index < 0:
+        raise IndexError("Frame Out of range")
+    return -(-index // seq.step)
 
 
 class _SeqNumSlicer:
@@ -75,8 +125,8 @@ class _SeqNumSlicer:
         if isinstance(item, int):
             index = filenum_index(item, self._seq)
         else:
-            start = filenum_index(item.start, self._seq)
-            stop = filenum_index(item.stop, self._seq)
+            start = filenum_slice_index(item.start, self._seq)
+            stop = filenum_slice_index(item.stop, self._seq)
             index = slice(start, stop, item.step)
 
         return self._seq[index]
@@ -85,8 +135,44 @@ class _SeqNumSlicer:
 SelfType = TypeVar("SelfType", bound="FileSequence")
 
 
+# Step of a spec, EX: 'x2' in 'file.[0100-0200x2].exr'
+_SPEC_STEP = re.compile(r"(?<=\d)x(\d+)(?=[\]}>)])")
+
+
+def _end_on_step(start: int, end: int, step: int) -> int:
+    """last file number on ``step`` from ``start`` at or before ``end``"""
+    if step < 1:
+        raise ValueError("step must be positive")
+    return start + (end - start) // step * step
+
+
+def _spread(nums: range, count: int) -> Sequence[int]:
+    """``count`` numbers of ``nums`` spread evenly from the first to the last"""
+    if count >= len(nums):
+        return nums
+    if count == 1:
+        return nums[:1]
+    # rounds each index to the nearest whole index, without float error.
+    last = len(nums) - 1
+    gaps = count - 1
+    return [nums[(i * last * 2 + gaps) // (gaps * 2)] for i in range(count)]
+
+
+def _as_frame_set(other: Union["FileSequence", FrameSet]) -> FrameSet:
+    if isinstance(other, FrameSet):
+        return other
+    return other.frames
+
+
 class FileSequence(FileBase):
-    def __init__(self, path: Union[str, Path], start: int, end: int):
+    def __init__(
+        self,
+        path: Union[str, Path],
+        start: int,
+        end: int,
+        step: int = 1,
+        storage: Optional[Storage] = None,
+    ):
         """
         Interact with file sequences.
 
@@ -94,6 +180,9 @@ class FileSequence(FileBase):
             Generic path like so: 'photo_###.jpeg'
         :param start: first file number of sequence.
         :param end: last file number of sequence.
+        :param step: difference between file numbers. Rounds ``end`` down to the last
+            file number on the step.
+        :param storage: :class:`Storage` the files live on. Defaults to local files.
         """
         path = _init_path(path)
         name = SeqName.from_path(path).alter(start="#", end=None)
@@ -102,16 +191,153 @@ class FileSequence(FileBase):
         self._name: SeqName = name
 
         self._start: int = start
-        self._end: int = end
+        self._end: int = _end_on_step(start, end, step)
+        self._step: int = step
+        self._storage = LOCAL_STORAGE if storage is None else storage
 
         self._seq_num_slicer: Optional["_SeqNumSlicer"] = None
+        self._name_template: Optional[str] = None
+        self._frame_set: Optional[FrameSet] = None
+
+    @classmethod
+    def from_name(
+        cls: Type[SelfType],
+        folder: Union[str, Path],
+        name: SeqName,
+        start: int,
+        end: int,
+        step: int = 1,
+        storage: Optional[Storage] = None,
+    ) -> SelfType:
+        """
+        New sequence from an already parsed name, skipping parsing of a path. Use for
+        names parsed with custom :class:`NamePatterns`.
+
+        :param folder: folder holding the sequence.
+        :param name: name of any file in the sequence.
+        :param start: first file number of sequence.
+        :param end: last file number of sequence.
+        :param step: difference between file numbers.
+        :param storage: :class:`Storage` the files live on. Defaults to local files.
+        """
+        if name.start != "#" or name.end is not None:
+            name = name.alter(start="#", end=None)
+        return cls._from_parts(
+            _init_path(folder),
+            name,
+            start,
+            _end_on_step(start, end, step),
+            step,
+            storage,
+        )
+
+    @classmethod
+    def _from_parts(
+        cls: Type[SelfType],
+        parent: Path,
+        name: SeqName,
+        start: int,
+        end: int,
+        step: int,
+        storage: Optional[Storage] = None,
+    ) -> SelfType:
+        """Skips all checks, ``name`` must be generic and ``end`` on ``step``."""
+        new = cls.__new__(cls)
+        new._parent = parent
+        new._name = name
+        new._start = start
+        new._end = end
+        new._step = step
+        new._storage = LOCAL_STORAGE if storage is None else storage
+        new._seq_num_slicer = None
+        new._name_template = None
+        new._frame_set = None
+        return new
+
+    @classmethod
+    def from_dict(cls: Type[SelfType], data: Dict[str, Any]) -> SelfType:
+        """New sequence from :func:`FileSequence.to_dict`. Does not touch disk."""
+        name = SeqName.from_dict(data["name"])
+        return cls.from_name(
+            data["folder"], name, data["start"], data["end"], data["step"]
+        )
+
+    @classmethod
+    def from_spec(
+        cls: Type[SelfType],
+        spec: Union[str, Path],
+        patterns: Optional[NamePatterns] = None,
+    ) -> SelfType:
+        """
+        New sequence from :func:`FileSequence.to_spec`, or any path naming a frame
+        range, EX: ``'/shots/shot.[1001-1100x2].exr'``. Does not touch disk.
+
+        :param spec: path with a frame range, optionally ending with ``x{step}``.
+        :param patterns: naming conventions to parse with. Defaults to
+            ``perfsprocket.SEQ_PATTERNS``.
+
+        :raises ValueError: if ``spec`` does not name a frame range.
+        """
+        path = _init_path(spec)
+        step = 1
+
+        file_name = path.name
+        matches = list(_SPEC_STEP.finditer(file_name))
+        if matches:
+            start, end = matches[-1].span()
+            step = int(matches[-1].group(1))
+            file_name = "".join((file_name[:start], file_name[end:]))
+
+        name = SeqName.from_path(file_name, patterns)
+        if not isinstance(name.start, int) or not isinstance(name.end, int):
+            raise ValueError(f"'{spec}' does not name a frame range")
+        return cls.from_name(path.parent, name, name.start, name.end, step)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Sequence as a JSON friendly dict, with the class name under ``'type'`` and the
+        name as :func:`SeqName.to_dict`.
+        """
+        return {
+            "type": type(self).__name__,
+            "folder": str(self._parent),
+            "name": self._name.to_dict(),
+            "start": self._start,
+            "end": self._end,
+            "step": self._step,
+        }
+
+    def to_spec(self) -> str:
+        """
+        Whole sequence as one path string, EX: ``'/shots/shot.[1001-1100].exr'``. A
+        step other than 1 is written after the end, EX: ``'[1001-1099x2]'``. Names
+        without braces are written with square brackets.
+        """
+        brackets = self._name.brackets or BRACKET
+        pad = self._name.pad
+        prefix, suffix = _frame_affixes(self._name)
+
+        frames = (
+            f"{_format_file_num(self._start, pad)}-{_format_file_num(self._end, pad)}"
+        )
+        if self._step != 1:
+            frames += f"x{self._step}"
+
+        name = f"{prefix}{brackets.enclose(frames)}{suffix}"
+        return str(self._parent / name)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Rebuilds from parts already parsed, rather than parsing a path again.
+        args = (self._parent, self._name, self._start, self._end, self._step)
+        return type(self)._from_parts, args
 
     def __repr__(self) -> str:
         name = self.name.alter(start=self.start, end=self.end, brackets=BRACKET)
-        return f"<{type(self).__name__}: '{self.path.parent / str(name)}'>"
+        step = f" step {self._step}" if self._step != 1 else ""
+        return f"<{type(self).__name__}: '{self.path.parent / str(name)}'{step}>"
 
     def __len__(self) -> int:
-        return self._end - self._start + 1
+        return (self._end - self._start) // self._step + 1
 
     @overload
     def __getitem__(self, item: int) -> Path:
@@ -130,12 +356,12 @@ class FileSequence(FileBase):
             return seq_get_index(self, item)
 
     def __iter__(self) -> Generator[Path, None, None]:
-        for i in range(len(self)):
-            yield self[i]
+        for num in range(self._start, self._end + 1, self._step):
+            yield self._parent / self.frame_name(num)
 
     def __reversed__(self) -> Generator[Path, None, None]:
-        for i in reversed(range(len(self))):
-            yield self[i]
+        for num in reversed(range(self._start, self._end + 1, self._step)):
+            yield self._parent / self.frame_name(num)
 
     @property
     def path(self) -> Path:
@@ -157,6 +383,114 @@ class FileSequence(FileBase):
         """Return ``end`` frame num passed to :func:`FileSequence.__init__`"""
         return self._end
 
+    def frame_name(self, num: int) -> str:
+        """
+        File name of file number ``num``. Formats with a template cached on first
+        call, so does not check ``num`` is in the sequence.
+        """
+        template = self._name_template
+        if template is None:
+            template = self._build_name_template()
+
+        if num < 0:
+            # Negative numbers are padded without their sign, which a %-template
+            #   cannot do.
+            prefix, suffix = _frame_affixes(self._name)
+            return f"{prefix}{_format_file_num(num, self._name.pad)}{suffix}"
+        return template % num
+
+    def _build_name_template(self) -> str:
+        prefix, suffix = _frame_affixes(self._name)
+        pad = self._name.pad
+        num_format = f"%0{pad}d" if pad else "%d"
+        template = f"{prefix.replace('%', '%%')}{num_format}{suffix.replace('%', '%%')}"
+        self._name_template = template
+        return template
+
+    def accessor(
+        self, max_open: int = 64, handles: str = FD, prefetch: int = 0
+    ) -> FrameAccessor:
+        """
+        Returns a :class:`FrameAccessor` for fast repeated access to frames of this
+        sequence by file number. See :class:`FrameAccessor` for arguments.
+        """
+        return FrameAccessor(self, max_open, handles, prefetch)
+
+    def open_frame(
+        self, frame: int, mmap: bool = True, pool: Optional[MappingPool] = None
+    ) -> FrameBuffer:
+        """
+        Opens file number ``frame`` as a read-only ``memoryview``:
+
+        >>> with sequence.open_frame(150) as view:
+        ...     magic = bytes(view[:4])
+
+        :param frame: file number to open.
+        :param mmap: memory-map the frame, so only the pages read are loaded. If
+            ``False``, the whole frame is read into memory.
+        :param pool: :class:`MappingPool` to reuse mappings from across calls.
+
+        :raises IndexError: if ``frame`` is not in the sequence.
+        :raises ValueError: if the sequence is not on local files.
+        """
+        self._check_local()
+        return FrameBuffer(str(self.files[frame]), mmap, pool)
+
+    def iter_buffers(
+        self, mmap: bool = True, readahead: bool = True, pool_size: int = 2
+    ) -> Generator[Tuple[int, memoryview], None, None]:
+        """
+        Yields ``(file number, memoryview)`` for each frame in order. Each view is
+        released, and its mapping closed or pooled, when the next frame is requested
+        or the generator is closed, so views must not be kept between iterations.
+
+        :param mmap: memory-map frames. If ``False``, each frame is read into memory.
+        :param readahead: hint the OS to read each frame sequentially and start loading
+            the next frame in advance. Turn off when reading only part of each frame,
+            like headers, so only the pages read are loaded.
+        :param pool_size: most idle mappings kept open.
+
+        :raises ValueError: if the sequence is not on local files.
+        """
+        self._check_local()
+        advice = SEQUENTIAL if readahead else RANDOM
+        frames = range(self._start, self._end + 1, self._step)
+        upcoming: Optional[FrameBuffer] = None
+
+        with MappingPool(pool_size) as pool:
+            try:
+                for i, frame in enumerate(frames):
+                    buffer = upcoming
+                    if buffer is None:
+                        buffer = FrameBuffer(self._path_str(frame), mmap, pool, advice)
+                    upcoming = None
+
+                    if readahead and mmap and i + 1 < len(frames):
+                        next_path = self._path_str(frames[i + 1])
+                        upcoming = FrameBuffer(next_path, mmap, pool, advice)
+                        upcoming.advise(WILLNEED)
+
+                    try:
+                        yield frame, buffer.view
+                    finally:
+                        buffer.close()
+            finally:
+                if upcoming is not None:
+                    upcoming.close()
+
+    def _path_str(self, num: int) -> str:
+        return str(self._parent / self.frame_name(num))
+
+    def _check_local(self) -> None:
+        """frames are opened with the os module, so must be local files"""
+        if not isinstance(self._storage, LocalStorage):
+            raise ValueError("frames can only be opened from local files")
+
+    @property
+    def step(self) -> int:
+        """Return ``step`` between frame nums passed to :func:`FileSequence.__init__`"""
+        return self._step
+
     @property
     def files(self) -> _SeqNumSlicer:
         """Returns object that can get file by frame number index."""
@@ -164,15 +498,158 @@ class FileSequence(FileBase):
             self._seq_num_slicer = _SeqNumSlicer(self)
         return self._seq_num_slicer
 
+    @property
+    def frames(self) -> FrameSet:
+        """:class:`FrameSet` of the file numbers in this sequence."""
+        if self._step == 1:
+            return FrameSet(((self._start, self._end),))
+
+        # every frame of a stepped sequence is a range of its own, so the set is
+        #   built once, from ranges that are already sorted and apart.
+        if self._frame_set is None:
+            nums = range(self._start, self._end + 1, self._step)
+            self._frame_set = FrameSet._from_normalized([(num, num) for num in nums])
+        return self._frame_set
+
+    def union(self, other: Union["FileSequence", FrameSet]) -> FrameSet:
+        """File numbers in this sequence or ``other``."""
+        return self.frames.union(_as_frame_set(other))
+
+    def intersection(self, other: Union["FileSequence", FrameSet]) -> FrameSet:
+        """File numbers in both this sequence and ``other``."""
+        return self.frames.intersection(_as_frame_set(other))
+
+    def difference(self, other: Union["FileSequence", FrameSet]) -> FrameSet:
+        """File numbers in this sequence but not ``other``."""
+        return self.frames.difference(_as_frame_set(other))
+
+    def symmetric_difference(self, other: Union["FileSequence", FrameSet]) -> FrameSet:
+        """File numbers in exactly one of this sequence and ``other``."""
+        return self.frames.symmetric_difference(_as_frame_set(other))
+
+    def subsequences(self: SelfType, frames: FrameSet) -> List[SelfType]:
+        """
+        Returns a new sequence with this sequence's name and folder for each range of
+        ``frames``. Use to turn the result of a set operation back into sequences.
+        """
+        return [
+            self.from_name(self._parent, self._name, first, last, 1, self._storage)
+            for first, last in frames.ranges
+        ]
+
+    def sample(
+        self,
+        step: Optional[int] = None,
+        count: Optional[int] = None,
+        frames: Optional[Iterable[int]] = None,
+    ) -> SampledSequence:
+        """
+        Returns a :class:`SampledSequence` view of some frames, EX: for review copies.
+        Give exactly one of:
+
+        :param step: every ``step``-th frame, starting from the first.
+        :param count: ``count`` frames spread evenly from the first to the last frame,
+            EX: ``3`` for the first, middle and last frames. All frames if the
+            sequence is shorter.
+        :param frames: file numbers to sample, EX: editorial cut points. A
+            :class:`FrameSet` or any iterable of file numbers.
+
+        :raises ValueError: if not exactly one of ``step``, ``count`` and ``frames``
+            is given, or ``step`` or ``count`` is not positive.
+        :raises IndexError: if a file number of ``frames`` is not in the sequence.
+        """
+        if sum(arg is not None for arg in (step, count, frames)) != 1:
+            raise ValueError("give exactly one of step, count and frames")
+
+        all_nums = range(self._start, self._end + 1, self._step)
+        nums: Sequence[int]
+        if step is not None:
+            if step < 1:
+                raise ValueError("step must be positive")
+            nums = all_nums[::step]
+        elif count is not None:
+            if count < 1:
+                raise ValueError("count must be positive")
+            nums = _spread(all_nums, count)
+        else:
+            nums = sorted(set(cast(Iterable[int], frames)))
+            for num in nums:
+                if num not in all_nums:
+                    raise IndexError(f"frame {num} not in sequence")
+
+        return SampledSequence(self, nums)
+
     def init_new(self: SelfType, path_new: Path) -> SelfType:
-        return type(self)(path_new, self._start, self._end)
+        return self.from_name(
+            path_new.parent,
+            self._name,
+            self._start,
+            self._end,
+            self._step,
+            self._storage,
+        )
+
+    def sync_to_iter(
+        self,
+        dst_folder: Union[str, Path],
+        checksum: bool = False,
+        delete_extra: bool = False,
+        rate_limit: Optional[RateLimit] = None,
+    ) -> SyncIterType:
+        """
+        Copies only the frames that are missing or differ in ``dst_folder``, using
+        :func:`FileSequence.copy_iter` for each contiguous run of frames. Each folder
+        is stat-ed with one batch stat of the storage, a single ``os.scandir`` for
+        local files.
+
+        Yields a :class:`SyncAction` for every frame, then the new
+        :class:`FileSequence` in ``dst_folder``.
+
+        :param dst_folder: folder to mirror the sequence to.
+        :param checksum: compare frames of equal size by content hash rather than
+            modification time. Needed on storages that cannot set modification times,
+            like :class:`ObjectStorage`.
+        :param delete_extra: delete frames of this sequence in ``dst_folder`` that fall
+            outside its frame range. Files padded differently belong to other
+            sequences, and are kept.
+        :param rate_limit: :class:`RateLimit` to pace copies by, so background syncs
+            leave bandwidth for other users.
+        """
+        dst_folder = _init_path(dst_folder)
+        return sync_to_iter(self, dst_folder, checksum, delete_extra, rate_limit)
+
+    def sync_to(
+        self: SelfType,
+        dst_folder: Union[str, Path],
+        checksum: bool = False,
+        delete_extra: bool = False,
+        rate_limit: Optional[RateLimit] = None,
+    ) -> SelfType:
+        """
+        Executes :func:`FileSequence.sync_to_iter` and returns the final item.
+        """
+        synced = self.sync_to_iter(dst_folder, checksum, delete_extra, rate_limit)
+        for item in synced:
+            pass
+
+        item = cast(SelfType, item)
+        return item
 
     def rename_iter(
-        self, name: Union[str, NameABC]
+        self, name: Union[str, NameABC], transaction: Optional[Transaction] = None
     ) -> Generator[Union[Tuple[Path, Path], "FileSequence"], None, None]:
         """
-        Renames each file in file num order, yielding a OldPath, NewPath pair *after* it
-        has been successfully moved. Yields new :class:`FileSequence` as last item.
+        Renames each file, yielding a OldPath, NewPath pair *after* it has been
+        successfully moved. Yields new :class:`FileSequence` as last item. Files keep
+        the step between their file numbers, and are renamed in an order where no
+        rename overwrites a file still waiting to be renamed.
+
+        :param name: new name of the sequence.
+        :param transaction: :class:`Transaction` to log each completed step to, so
+            the operation can be rolled back.
+
+        :raises FileExistsError: if a new name belongs to a file outside the sequence.
+            Raised before any file is renamed.
         """
         if isinstance(name, str):
             name = SeqName.from_path(name)
@@ -184,40 +661,215 @@ class FileSequence(FileBase):
         else:
             new_start = self._start
 
-        num: int
-        path: Path
-
-        first_path: Optional[Path] = None
-
-        # this comparison is correct, since
-        reverse_rename: bool = new_start < self._start
-
-        # We need to rename form last to first if the start frame is higher. When a
-        # sequence is being renamed to a higher start file, the rename will override
-        # it's own files if done in order.
-
-        new_end = new_start + len(self)
-        num_range = range(new_start, new_end)
-        if reverse_rename:
-            path_iter = iter(self)
-            num_iter = iter(num_range)
-        else:
-            path_iter = reversed(self)
-            num_iter = reversed(num_range)
-
-        for num, path in zip(num_iter, path_iter):
-            this_name = name.alter(start=num, end=None)
-            new_path = path.parent / str(this_name)
-            path.rename(new_path)
-
-            yield path, new_path
-
-            if first_path is None:
-                first_path = new_path
-
-        if reverse_rename or first_path is None:
-            first_path = new_path
+        new_name = name.alter(start="#", end=None)
+        new_end = new_start + (len(self) - 1) * self._step
+        old_names = self._name.format_frames(
+            range(self._start, self._end + 1, self._step)
+        )
+        new_names = new_name.format_frames(range(new_start, new_end + 1, self._step))
+
+        existing = self._storage.list_names(self._parent)
+        plan = plan_renames(list(zip(old_names, new_names)), existing)
+        yield from run_plan(self._parent, plan, transaction, self._storage)
+
+        yield self.from_name(
+            self._parent, new_name, new_start, new_end, self._step, self._storage
+        )
+
+    def renumber_iter(
+        self: SelfType,
+        start: Optional[int] = None,
+        pad: Optional[int] = None,
+        step: Optional[int] = None,
+        delim: Optional[str] = None,
+        transaction: Optional[Transaction] = None,
+    ) -> Generator[Union[Tuple[Path, Path], SelfType], None, None]:
+        """
+        Renames files to new file numbers, padding or delimiter in a single pass. The
+        new names are computed up front, and the folder is listed once to check none
+        of them belong to files outside the sequence. Files are then renamed in an
+        order where no rename overwrites a file still waiting to be renamed.
+
+        Yields an OldPath, NewPath pair *after* each file has been moved, then the new
+        :class:`FileSequence`. Arguments left as ``None`` keep their current value.
+
+        :param start: new first file number.
+        :param pad: new padding of file numbers.
+        :param step: new difference between file numbers.
+        :param delim: new delimiter before the file number.
+        :param transaction: :class:`Transaction` to log each completed rename to,
+            including renames through temporary names, so the operation can be
+            rolled back.
+
+        :raises FileExistsError: if a new name belongs to a file outside the sequence.
+            Raised before any file is renamed.
+        :raises FileNotFoundError: if a file of the sequence is missing. Raised before
+            any file is renamed.
+        """
+        new_start = self._start if start is None else start
+        new_step = self._step if step is None else step
+        new_end = new_start + (len(self) - 1) * new_step
+        new_name = self._name.alter(
+            pad=KEEP if pad is None else pad, delim=KEEP if delim is None else delim
+        )
+        if new_step < 1:
+            raise ValueError("step must be positive")
+
+        old_names = self._name.format_frames(
+            range(self._start, self._end + 1, self._step)
+        )
+        new_names = new_name.format_frames(range(new_start, new_end + 1, new_step))
+
+        existing = self._storage.list_names(self._parent)
+        plan = plan_renames(list(zip(old_names, new_names)), existing)
+        yield from run_plan(self._parent, plan, transaction, self._storage)
+
+        yield self.from_name(
+            self._parent, new_name, new_start, new_end, new_step, self._storage
+        )
+
+    def renumber(
+        self: SelfType,
+        start: Optional[int] = None,
+        pad: Optional[int] = None,
+        step: Optional[int] = None,
+        delim: Optional[str] = None,
+        transaction: Optional[Transaction] = None,
+    ) -> SelfType:
+        """
+        Executes :func:`FileSequence.renumber_iter` and returns the final item.
+        """
+        for item in self.renumber_iter(start, pad, step, delim, transaction):
+            pass
+
+        item = cast(SelfType, item)
+        return item
+
+    @classmethod
+    def concat_iter(
+        cls,
+        *seqs: "FileSequence",
+        start: Optional[int] = None,
+        name: Optional[Union[str, NameABC]] = None,
+        folder: Optional[Union[str, Path]] = None,
+        mode: str = MOVE,
+        transaction: Optional[Transaction] = None,
+    ) -> ConcatIterType:
+        """
+        Joins sequences end to end into one continuous sequence, numbered from
+        ``start`` in the order given:
+
+        >>> FileSequence.concat(shot_a, shot_b, name="edit.####.exr", start=1001)
+        <FileSequence: '/shots/edit.[1001-1150].exr'>
+
+        Every new name is computed and every folder involved listed once up front, so
+        missing frames and name collisions are raised before any file is touched.
+        Moves within one folder are ordered so no file overwrites one still waiting
+        to move, so sequences can be renumbered in place.
+
+        Yields an OldPath, NewPath pair *after* each file is done, then the new
+        :class:`FileSequence`.
+
+        :param seqs: sequences to join, all on the same storage.
+        :param start: first file number of the new sequence. Defaults to the file
+            number of ``name``, or the first file number of the first sequence.
+        :param name: name of the new sequence. Defaults to the name of the first.
+        :param folder: folder of the new sequence. Defaults to the folder of the
+            first.
+        :param mode: ``'move'``, ``'copy'`` or a link mode of :class:`LinkEngine`:
+            ``'hard'``, ``'sym'`` or ``'reflink'``, to leave the sources in place.
+        :param transaction: :class:`Transaction` to log each completed move to, so
+            the operation can be rolled back.
+
+        :raises FileNotFoundError: if a frame of a sequence is missing.
+        :raises FileExistsError: if a new name belongs to a file that is not moved
+            out of the way.
+        """
+        if folder is not None:
+            folder = _init_path(folder)
+        return concat_iter(seqs, start, name, folder, mode, transaction)
+
+    @classmethod
+    def concat(
+        cls,
+        *seqs: "FileSequence",
+        start: Optional[int] = None,
+        name: Optional[Union[str, NameABC]] = None,
+        folder: Optional[Union[str, Path]] = None,
+        mode: str = MOVE,
+        transaction: Optional[Transaction] = None,
+    ) -> "FileSequence":
+        """
+        Executes :func:`FileSequence.concat_iter` and returns the final item.
+        """
+        joined = cls.concat_iter(
+            *seqs,
+            start=start,
+            name=name,
+            folder=folder,
+            mode=mode,
+            transaction=transaction,
+        )
+        for item in joined:
+            pass
+
+        return cast(FileSequence, item)
+
+    def split_iter(
+        self,
+        at: Iterable[int],
+        start: Optional[int] = None,
+        names: Optional[Sequence[Union[str, NameABC]]] = None,
+        folder: Optional[Union[str, Path]] = None,
+        mode: str = MOVE,
+        transaction: Optional[Transaction] = None,
+    ) -> SplitIterType:
+        """
+        Splits the sequence into pieces, EX: reels, each starting at a file number of
+        ``at``:
+
+        >>> plate.split(at=[2001, 3001], start=1001, names=["r1.#.exr", "r2.#.exr",
+        ...                                                  "r3.#.exr"])
+        [<FileSequence: '/shots/r1.[1001-2000].exr'>, ...]
+
+        Pieces that keep their names, numbers and folder need no files touched. All
+        other transfers are planned and checked up front, and run as one batch as in
+        :func:`FileSequence.concat_iter`.
+
+        Yields an OldPath, NewPath pair *after* each file is done, then a list of the
+        new :class:`FileSequence` pieces.
+
+        :param at: file numbers that start a new piece.
+        :param start: first file number of every piece. Defaults to keeping file
+            numbers.
+        :param names: name of each piece. Defaults to the name of this sequence.
+        :param folder: folder of the pieces. Defaults to the folder of this sequence.
+        :param mode: ``'move'``, ``'copy'``, ``'hard'``, ``'sym'`` or ``'reflink'``.
+        :param transaction: :class:`Transaction` to log each completed move to, so
+            the operation can be rolled back.
+
+        :raises IndexError: if a file number of ``at`` is not in the sequence, or is
+            its first.
+        :raises ValueError: if ``names`` does not hold a name for every piece, or
+            pieces would share file names.
+        """
+        if folder is not None:
+            folder = _init_path(folder)
+        return split_iter(self, at, start, names, folder, mode, transaction)
+
+    def split(
+        self: SelfType,
+        at: Iterable[int],
+        start: Optional[int] = None,
+        names: Optional[Sequence[Union[str, NameABC]]] = None,
+        folder: Optional[Union[str, Path]] = None,
+        mode: str = MOVE,
+        transaction: Optional[Transaction] = None,
+    ) -> List[SelfType]:
+        """
+        Executes :func:`FileSequence.split_iter` and returns the final item.
+        """
+        for item in self.split_iter(at, start, names, folder, mode, transaction):
+            pass
 
-        # type can be ignored here since we know all names generated with the above
-        # will have an int fot this_name.start
-        yield type(self)(first_path, new_start, new_end - 1)
+        return cast(List[SelfType], item)
@@ -0,0 +1,221 @@
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+from ._class_file_base import FileBase
+from ._file_name import SeqName, NameABC, BRACKET
+from ._frame_set import FrameSet
+from ._rename_plan import plan_renames, run_plan
+from ._transaction import Transaction
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._class_file_sequence import FileSequence
+
+
+SelfType = TypeVar("SelfType", bound="SampledSequence")
+
+
+class SampledSequence(FileBase):
+    def __init__(self, seq: "FileSequence", nums: Sequence[int]):
+        """
+        View of some frames of a :class:`FileSequence`, made by
+        :func:`FileSequence.sample`. Copies, moves, deletes, disk usage and hashing
+        only touch the sampled frames, and a copy or move returns a view of the same
+        frames in the new folder.
+
+        :param seq: sequence the frames are sampled from.
+        :param nums: file numbers of the sampled frames, ascending. Not checked
+            against ``seq``. Strided samples keep a ``range``, so a view costs the
+            same however many frames it holds.
+        """
+        self._seq: "FileSequence" = seq
+        self._nums: Sequence[int] = nums
+        self._parent: Path = seq.path.parent
+        self._storage = seq.storage
+
+    def __repr__(self) -> str:
+        seq = self._seq
+        name = seq.name.alter(start=seq.start, end=seq.end, brackets=BRACKET)
+        return (
+            f"<{type(self).__name__}: '{seq.path.parent / str(name)}' "
+            f"{len(self)} frames>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._nums)
+
+    @overload
+    def __getitem__(self, item: int) -> Path:
+        ...
+
+    @overload
+    def __getitem__(self: SelfType, item: slice) -> SelfType:  # noqa: F811
+        ...
+
+    def __getitem__(  # noqa: F811
+        self: SelfType, item: Union[int, slice]
+    ) -> Union[Path, SelfType]:
+        """path of the ``item``-th sampled frame, or a view of a slice of them"""
+        if isinstance(item, slice):
+            nums = self._nums[item]
+            if item.step is not None and item.step < 0:
+                nums = nums[::-1]
+            return type(self)(self._seq, nums)
+        return self._path_of(self._nums[item])
+
+    def __iter__(self) -> Generator[Path, None, None]:
+        for num in self._nums:
+            yield self._path_of(num)
+
+    def __reversed__(self) -> Generator[Path, None, None]:
+        for num in reversed(self._nums):
+            yield self._path_of(num)
+
+    def _path_of(self, num: int) -> Path:
+        return self._parent / self._seq.frame_name(num)
+
+    @property
+    def path(self) -> Path:
+        """path to first sampled file"""
+        return self[0]
+
+    @property
+    def name(self) -> SeqName:
+        """name of the sampled sequence. See :class:`SeqName` documentation"""
+        return self._seq.name
+
+    @property
+    def sequence(self) -> "FileSequence":
+        """:class:`FileSequence` the frames are sampled from."""
+        return self._seq
+
+    @property
+    def frames(self) -> FrameSet:
+        """:class:`FrameSet` of the sampled file numbers."""
+        return FrameSet.from_frames(self._nums)
+
+    def subsequences(self) -> List["FileSequence"]:
+        """
+        Returns a :class:`FileSequence` for each contiguous run of sampled frames,
+        EX: to hand a sample of whole shots to code that takes sequences.
+        """
+        return self._seq.subsequences(self.frames)
+
+    def init_new(self: SelfType, path_new: Path) -> SelfType:
+        return type(self)(self._seq.init_new(path_new), self._nums)
+
+    def rename_iter(
+        self: SelfType,
+        name: Union[str, NameABC],
+        transaction: Optional[Transaction] = None,
+    ) -> Generator[Union[Tuple[Path, Path], SelfType], None, None]:
+        """
+        Renames the sampled frames, keeping the gaps between their file numbers.
+        Frames are renamed in an order where no rename overwrites a frame still
+        waiting to be renamed.
+
+        Yields an OldPath, NewPath pair *after* each file has been moved, then a
+        :class:`SampledSequence` of the new names.
+
+        :param name: new name of the frames. Shifted to start from its file number if
+            it has one, EX: ``'review.1001.exr'``.
+        :param transaction: :class:`Transaction` to log each completed step to, so
+            the operation can be rolled back.
+
+        :raises FileExistsError: if a new name belongs to a file outside the sample.
+            Raised before any file is renamed.
+        """
+        new_name = _seq_name(name)
+        shift = 0
+        if isinstance(new_name.start, int):
+            shift = new_name.start - self._nums[0]
+
+        nums = self._nums
+        new_nums: Sequence[int]
+        if isinstance(nums, range):
+            new_nums = range(nums.start + shift, nums.stop + shift, nums.step)
+        else:
+            new_nums = [num + shift for num in nums]
+        new_seq = yield from self._rename_frames(new_name, new_nums, transaction)
+        yield type(self)(new_seq, new_nums)
+
+    def compact_iter(
+        self,
+        name: Optional[Union[str, NameABC]] = None,
+        transaction: Optional[Transaction] = None,
+    ) -> Generator[Union[Tuple[Path, Path], "FileSequence"], None, None]:
+        """
+        Renames the sampled frames to consecutive file numbers, so a review copy plays
+        back as a sequence of its own. Frames are renamed in an order where no rename
+        overwrites a frame still waiting to be renamed.
+
+        Yields an OldPath, NewPath pair *after* each file has been moved, then the new
+        :class:`FileSequence`.
+
+        :param name: new name of the frames. Numbered from its file number if it has
+            one, EX: ``'review.1001.exr'``, otherwise from the first sampled frame.
+            Defaults to the current name.
+        :param transaction: :class:`Transaction` to log each completed step to, so
+            the operation can be rolled back.
+
+        :raises FileExistsError: if a new name belongs to a file outside the sample.
+            Raised before any file is renamed.
+        """
+        new_name = self._seq.name if name is None else _seq_name(name)
+        start = new_name.start if isinstance(new_name.start, int) else self._nums[0]
+        new_nums = range(start, start + len(self))
+        new_seq = yield from self._rename_frames(new_name, new_nums, transaction)
+        yield new_seq
+
+    def compact(
+        self,
+        name: Optional[Union[str, NameABC]] = None,
+        transaction: Optional[Transaction] = None,
+    ) -> "FileSequence":
+        """
+        Executes :func:`SampledSequence.compact_iter` and returns the final item.
+        """
+        for item in self.compact_iter(name, transaction):
+            pass
+
+        return cast("FileSequence", item)
+
+    def _rename_frames(
+        self,
+        name: SeqName,
+        new_nums: Sequence[int],
+        transaction: Optional[Transaction],
+    ) -> Generator[Tuple[Path, Path], None, "FileSequence"]:
+        """
+        renames each sampled frame to ``name`` with the matching number of
+        ``new_nums``, returning the new sequence spanning them
+        """
+        name = name.alter(start="#", end=None)
+        old_names = self._seq.name.format_frames(self._nums)
+        new_names = name.format_frames(new_nums)
+
+        existing = self._storage.list_names(self._parent)
+        plan = plan_renames(list(zip(old_names, new_names)), existing)
+        yield from run_plan(self._parent, plan, transaction, self._storage)
+
+        return self._seq.from_name(
+            self._parent, name, new_nums[0], new_nums[-1], 1, self._storage
+        )
+
+
+def _seq_name(name: Union[str, NameABC]) -> SeqName:
+    if isinstance(name, str):
+        return SeqName.from_path(name)
+    elif not isinstance(name, SeqName):
+        return SeqName(base=name.base, extension=name.extension)
+    return name
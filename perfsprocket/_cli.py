@@ -0,0 +1,448 @@
+"""
+``perfsprocket`` command line tool. Only the standard library is imported at module
+level, each command imports the modules it uses when it runs.
+"""
+import argparse
+import json
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+    from ._class_file import File
+    from ._class_file_sequence import FileSequence
+    from ._parallel import ProcessBackend
+
+    ItemType = Union[File, FileSequence]
+
+
+PROG = "perfsprocket"
+
+# exit codes
+OK = 0
+FAILED = 1
+
+
+class Output:
+    def __init__(self, as_json: bool, progress: bool, stream: Any = None):
+        """
+        Writes command results to stdout as text or JSON lines, and optional progress
+        to stderr.
+
+        :param as_json: write one JSON object per line rather than text.
+        :param progress: write a running count of files processed to stderr.
+        :param stream: stream to write results to. Defaults to ``sys.stdout``.
+        """
+        self.as_json: bool = as_json
+        self.progress: bool = progress
+        self.stream: Any = sys.stdout if stream is None else stream
+        self._done = 0
+        self._total = 0
+
+    def emit(self, record: Dict[str, Any], text: Optional[str]) -> None:
+        """Writes ``record`` as JSON, or ``text`` if not ``None`` in text mode."""
+        if self.as_json:
+            line: Optional[str] = json.dumps(record)
+        else:
+            line = text
+        if line is not None:
+            self.stream.write(line + "\n")
+
+    def start(self, total: int) -> None:
+        """Adds ``total`` files to the progress count."""
+        self._total += total
+
+    def advance(self) -> None:
+        """Counts one more file done."""
+        self._done += 1
+        if self.progress:
+            sys.stderr.write(f"\r{self._done}/{self._total} files")
+            if self._done == self._total:
+                sys.stderr.write("\n")
+            sys.stderr.flush()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the command line tool with ``argv``, defaulting to ``sys.argv[1:]``.
+
+    :return: exit code.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    output = Output(args.json, args.progress)
+
+    try:
+        return int(args.command(args, output))
+    except (OSError, ValueError) as error:
+        sys.stderr.write(f"{PROG}: error: {error}\n")
+        return FAILED
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Parser for all commands, each storing its function as ``command``."""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--json", action="store_true", help="write results as JSON lines"
+    )
+    common.add_argument(
+        "--progress", action="store_true", help="report files done on stderr"
+    )
+
+    dry_run = argparse.ArgumentParser(add_help=False)
+    dry_run.add_argument(
+        "-n",
+        "--dry-run",
+        action="store_true",
+        help="report what would happen without changing anything",
+    )
+
+    workers = argparse.ArgumentParser(add_help=False)
+    workers.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes for parsing and hashing, in this process by default",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog=PROG,
+        description="Sequence-aware file operations. Sequences are given as specs "
+        "like '/shots/shot.[1001-1100].exr', other paths are single files.",
+    )
+    commands = parser.add_subparsers(dest="command_name", metavar="command")
+    commands.required = True
+
+    def add(
+        name: str, func: Callable, help_text: str, *parents: argparse.ArgumentParser
+    ) -> argparse.ArgumentParser:
+        sub = commands.add_parser(
+            name, help=help_text, description=help_text, parents=[common, *parents]
+        )
+        sub.set_defaults(command=func)
+        return sub
+
+    ls = add("ls", _cmd_ls, "list files and sequences in folders", workers)
+    ls.add_argument("folders", nargs="*", default=["."], metavar="folder")
+
+    cp = add("cp", _cmd_cp, "copy files and sequences into a folder", dry_run)
+    cp.add_argument("sources", nargs="+", metavar="source")
+    cp.add_argument("dst")
+    cp.add_argument(
+        "--link", choices=("hard", "sym", "reflink"), help="link rather than copy"
+    )
+    cp.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=8,
+        help="threads making links at once, with --link",
+    )
+    cp.add_argument(
+        "--buffered",
+        action="store_true",
+        help="overlap reads and writes, for large frames on network storage",
+    )
+    _add_durability(cp)
+    _add_rate_limit(cp, bandwidth=True)
+
+    mv = add("mv", _cmd_mv, "move files and sequences into a folder", dry_run)
+    mv.add_argument("sources", nargs="+", metavar="source")
+    mv.add_argument("dst")
+    _add_durability(mv)
+    _add_rate_limit(mv, bandwidth=False)
+
+    rm = add("rm", _cmd_rm, "delete files and sequences", dry_run)
+    rm.add_argument("sources", nargs="+", metavar="source")
+
+    renumber = add("renumber", _cmd_renumber, "renumber a sequence", dry_run)
+    renumber.add_argument("source")
+    renumber.add_argument("--start", type=int, help="new first file number")
+    renumber.add_argument("--pad", type=int, help="new padding of file numbers")
+    renumber.add_argument("--step", type=int, help="new step between file numbers")
+
+    verify = add(
+        "verify", _cmd_verify, "check copies in a folder match their sources", workers
+    )
+    verify.add_argument("sources", nargs="+", metavar="source")
+    verify.add_argument("dst")
+
+    du = add("du", _cmd_du, "disk usage of files, sequences and folders")
+    du.add_argument("sources", nargs="+", metavar="source")
+    du.add_argument(
+        "-w", "--workers", type=int, default=8, help="threads scanning folders at once"
+    )
+
+    return parser
+
+
+def _add_durability(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--durability",
+        choices=("none", "fsync", "batch"),
+        default="none",
+        help="flush written files to disk",
+    )
+
+
+def _add_rate_limit(parser: argparse.ArgumentParser, bandwidth: bool) -> None:
+    if bandwidth:
+        parser.add_argument(
+            "--limit-rate",
+            type=byte_rate,
+            metavar="RATE",
+            help="most bytes per second, EX: 500K, 50M or 1G",
+        )
+    parser.add_argument(
+        "--limit-files", type=float, metavar="RATE", help="most files per second"
+    )
+
+
+_RATE_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+def byte_rate(arg: str) -> float:
+    """bytes per second from a number with an optional K, M or G suffix"""
+    text = arg.strip().upper().rstrip("B")
+    unit = text[-1:] if text[-1:] in _RATE_UNITS else ""
+    try:
+        rate = float(text[: len(text) - len(unit)]) * _RATE_UNITS[unit]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid rate: '{arg}'") from None
+    if rate <= 0:
+        raise argparse.ArgumentTypeError(f"rate must be positive: '{arg}'")
+    return rate
+
+
+def load_item(arg: str) -> "ItemType":
+    """
+    :class:`FileSequence` for a spec with a frame range, otherwise :class:`File`.
+    """
+    from ._class_file import File
+    from ._class_file_sequence import FileSequence
+
+    try:
+        return FileSequence.from_spec(arg)
+    except ValueError:
+        return File(arg)
+
+
+def spec_of(item: "ItemType") -> str:
+    """path string of a file, or spec of a sequence"""
+    from ._class_file_sequence import FileSequence
+
+    if isinstance(item, FileSequence):
+        return item.to_spec()
+    return str(item.path)
+
+
+def _backend(args: argparse.Namespace) -> Optional["ProcessBackend"]:
+    if args.workers is None:
+        return None
+
+    from ._parallel import ProcessBackend
+
+    return ProcessBackend(workers=args.workers)
+
+
+def _cmd_ls(args: argparse.Namespace, output: Output) -> int:
+    from ._discovery import find_sequences
+
+    backend = _backend(args)
+    try:
+        for folder in args.folders:
+            for item in find_sequences(folder, backend=backend):
+                record = item.to_dict()
+                record["spec"] = spec_of(item)
+                record["files"] = len(item)
+                output.emit(record, record["spec"])
+    finally:
+        if backend is not None:
+            backend.close()
+    return OK
+
+
+def _transfer(
+    args: argparse.Namespace, output: Output, op: str, run: Callable[[Any], Any]
+) -> int:
+    """runs ``run`` on each source's ``*_iter`` generator, reporting each file"""
+    from pathlib import Path
+
+    items = [load_item(source) for source in args.sources]
+    dst_folder = Path(args.dst)
+    for item in items:
+        output.start(len(item))
+
+    for item in items:
+        if args.dry_run:
+            for path in item:
+                record = {
+                    "op": op,
+                    "src": str(path),
+                    "dst": str(dst_folder / path.name),
+                }
+                output.emit(record, f"{record['src']} -> {record['dst']}")
+                output.advance()
+            continue
+
+        result: Any = None
+        for result in run(item):
+            if isinstance(result, Path):
+                output.advance()
+
+        record = {"op": op, "src": spec_of(item), "dst": spec_of(result)}
+        output.emit(record, f"{record['src']} -> {record['dst']}")
+    return OK
+
+
+def _durability(args: argparse.Namespace) -> Any:
+    from ._durability import Durability
+
+    return Durability(args.durability)
+
+
+def _rate_limit(args: argparse.Namespace) -> Any:
+    bytes_per_second = getattr(args, "limit_rate", None)
+    if bytes_per_second is None and args.limit_files is None:
+        return None
+
+    from ._rate_limit import RateLimit
+
+    return RateLimit(bytes_per_second, args.limit_files)
+
+
+def _cmd_cp(args: argparse.Namespace, output: Output) -> int:
+    from ._copy_engine import BufferedEngine, CopyEngine, LinkEngine
+
+    engine: Optional[CopyEngine] = BufferedEngine() if args.buffered else None
+    if args.link is not None:
+        engine = LinkEngine(args.link, args.workers, fallback=engine)
+    durability = _durability(args)
+    rate_limit = _rate_limit(args)
+
+    def run(item: Any) -> Any:
+        return item.copy_iter(args.dst, engine, durability, None, rate_limit)
+
+    return _transfer(args, output, "cp", run)
+
+
+def _cmd_mv(args: argparse.Namespace, output: Output) -> int:
+    durability = _durability(args)
+    rate_limit = _rate_limit(args)
+
+    def run(item: Any) -> Any:
+        return item.move_iter(args.dst, durability, None, rate_limit)
+
+    return _transfer(args, output, "mv", run)
+
+
+def _cmd_rm(args: argparse.Namespace, output: Output) -> int:
+    items = [load_item(source) for source in args.sources]
+    for item in items:
+        output.start(len(item))
+
+    for item in items:
+        paths = iter(item) if args.dry_run else item.delete_iter()
+        for path in paths:
+            output.emit({"op": "rm", "path": str(path)}, str(path))
+            output.advance()
+    return OK
+
+
+def _cmd_renumber(args: argparse.Namespace, output: Output) -> int:
+    from ._class_file_sequence import FileSequence
+
+    seq = load_item(args.source)
+    if not isinstance(seq, FileSequence):
+        raise ValueError(f"'{args.source}' is not a sequence spec")
+    output.start(len(seq))
+
+    if args.dry_run:
+        start = seq.start if args.start is None else args.start
+        step = seq.step if args.step is None else args.step
+        name = seq.name if args.pad is None else seq.name.alter(pad=args.pad)
+        new = FileSequence.from_name(
+            seq.path.parent, name, start, start + (len(seq) - 1) * step, step
+        )
+        pairs: Iterable[Any] = zip(seq, new)
+    else:
+        pairs = seq.renumber_iter(args.start, args.pad, args.step)
+
+    for pair in pairs:
+        if isinstance(pair, FileSequence):
+            break
+        old, new_path = pair
+        if old == new_path:
+            continue
+        record = {"op": "renumber", "src": str(old), "dst": str(new_path)}
+        output.emit(record, f"{record['src']} -> {record['dst']}")
+        output.advance()
+    return OK
+
+
+def _cmd_verify(args: argparse.Namespace, output: Output) -> int:
+    from pathlib import Path
+    from ._hashing import hash_file
+
+    items = [load_item(source) for source in args.sources]
+    dst_folder = Path(args.dst)
+    pairs = [(path, dst_folder / path.name) for item in items for path in item]
+    output.start(len(pairs))
+
+    existing = [pair for pair in pairs if pair[0].is_file() and pair[1].is_file()]
+    backend = _backend(args)
+    try:
+        paths = [path for pair in existing for path in pair]
+        if backend is None:
+            digests: Dict["Path", str] = {path: hash_file(path) for path in paths}
+        else:
+            digests = dict(backend.hash_iter(paths))
+    finally:
+        if backend is not None:
+            backend.close()
+
+    failed = False
+    for src, dst in pairs:
+        status = _verify_status(src, dst, digests)
+        failed = failed or status != "ok"
+        record = {"op": "verify", "src": str(src), "dst": str(dst), "status": status}
+        output.emit(record, f"{status}: {src} -> {dst}")
+        output.advance()
+
+    return FAILED if failed else OK
+
+
+def _verify_status(src: "Path", dst: "Path", digests: Dict["Path", str]) -> str:
+    if src not in digests:
+        # pairs are only hashed when both files exist.
+        return "missing" if src.is_file() else "missing source"
+    if digests[src] != digests[dst]:
+        return "mismatch"
+    return "ok"
+
+
+def _cmd_du(args: argparse.Namespace, output: Output) -> int:
+    from ._discovery import usage_iter
+    from ._usage import Usage
+
+    usages: List[Any] = list()
+    for source in args.sources:
+        if os.path.isdir(source):
+            found: Iterable[Any] = usage_iter(source, workers=args.workers)
+        else:
+            item = load_item(source)
+            found = [(item, item.du())]
+
+        for item, item_usage in found:
+            usages.append(item_usage)
+            _emit_usage(output, spec_of(item), item_usage)
+
+    _emit_usage(output, None, Usage.total(usages))
+    return OK
+
+
+def _emit_usage(output: Output, path: Optional[str], usage: Any) -> None:
+    record = dict(usage._asdict(), path=path, mean_size=usage.mean_size)
+    output.emit(record, f"{usage.apparent}\t{'total' if path is None else path}")
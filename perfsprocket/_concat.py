@@ -0,0 +1,225 @@
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ._class_sampled_sequence import _seq_name
+from ._copy_engine import LinkEngine, LINK_MODES
+from ._file_name import NameABC, SeqName
+from ._rename_plan import plan_renames, run_plan
+from ._storage import LocalStorage, Storage
+from ._transaction import Transaction
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._class_file_sequence import FileSequence
+
+
+MOVE = "move"
+COPY = "copy"
+
+MODES = (MOVE, COPY) + LINK_MODES
+
+PairList = List[Tuple[Path, Path]]
+ConcatIterType = Generator[Union[Tuple[Path, Path], "FileSequence"], None, None]
+SplitIterType = Generator[Union[Tuple[Path, Path], List["FileSequence"]], None, None]
+
+
+def concat_iter(
+    seqs: Sequence["FileSequence"],
+    start: Optional[int],
+    name: Optional[Union[str, NameABC]],
+    folder: Optional[Path],
+    mode: str,
+    transaction: Optional[Transaction],
+) -> ConcatIterType:
+    """
+    Plans and runs the transfers of :func:`FileSequence.concat_iter`, yielding each
+    OldPath, NewPath pair once done, then the new sequence.
+    """
+    if not seqs:
+        raise ValueError("nothing to concatenate")
+
+    first = seqs[0]
+    new_name = first.name if name is None else _seq_name(name)
+    if start is None:
+        start = new_name.start if isinstance(new_name.start, int) else first.start
+    if folder is None:
+        folder = first.path.parent
+
+    sources = [path for seq in seqs for path in seq]
+    new_nums = range(start, start + len(sources))
+    pairs = _pairs_to(sources, folder, new_name, new_nums)
+
+    yield from transfer_iter(pairs, folder, mode, _storage_of(seqs), transaction)
+    yield first.from_name(folder, new_name, start, new_nums[-1], 1, first.storage)
+
+
+def split_iter(
+    seq: "FileSequence",
+    at: Iterable[int],
+    start: Optional[int],
+    names: Optional[Sequence[Union[str, NameABC]]],
+    folder: Optional[Path],
+    mode: str,
+    transaction: Optional[Transaction],
+) -> SplitIterType:
+    """
+    Plans and runs the transfers of :func:`FileSequence.split_iter`, yielding each
+    OldPath, NewPath pair once done, then the list of new sequences.
+    """
+    nums = range(seq.start, seq.end + 1, seq.step)
+    bounds = [0]
+    for num in sorted(set(at)):
+        if num not in nums or num == seq.start:
+            raise IndexError(f"cannot split at frame {num}")
+        bounds.append(nums.index(num))
+    bounds.append(len(nums))
+
+    pieces = [nums[first:last] for first, last in zip(bounds, bounds[1:])]
+    if names is not None and len(names) != len(pieces):
+        raise ValueError(f"{len(pieces)} pieces need {len(pieces)} names")
+
+    if start is None and names is None and folder is None:
+        # pieces keep their names and file numbers, so no file is touched.
+        yield [_sequence_of(seq, seq.path.parent, seq.name, piece) for piece in pieces]
+        return
+
+    if folder is None:
+        folder = seq.path.parent
+
+    pairs: PairList = list()
+    new_seqs: List["FileSequence"] = list()
+    for i, piece in enumerate(pieces):
+        new_name = seq.name if names is None else _seq_name(names[i])
+        new_start = piece[0] if start is None else start
+        new_nums = range(new_start, new_start + len(piece) * seq.step, seq.step)
+
+        sources = [seq.path.parent / seq.frame_name(num) for num in piece]
+        pairs.extend(_pairs_to(sources, folder, new_name, new_nums))
+        new_seqs.append(_sequence_of(seq, folder, new_name, new_nums))
+
+    yield from transfer_iter(pairs, folder, mode, seq.storage, transaction)
+    yield new_seqs
+
+
+def transfer_iter(
+    pairs: PairList,
+    folder: Path,
+    mode: str,
+    storage: Storage,
+    transaction: Optional[Transaction],
+) -> Generator[Tuple[Path, Path], None, None]:
+    """
+    Moves, copies or links files to new paths in ``folder`` as one batch, yielding
+    each OldPath, NewPath pair once done.
+
+    Every folder involved is listed once, and every check made, before any file is
+    touched. Files moved within ``folder`` are renamed in an order from
+    :func:`plan_renames`, so new names may be the old names of other files in the
+    batch. Files from other folders are moved in afterwards, once the names they take
+    are free.
+
+    :raises FileNotFoundError: if a source is missing.
+    :raises FileExistsError: if a new path belongs to a file outside the batch.
+    :raises ValueError: on an unknown mode, a file given twice, two files given the
+        same new path, or a transaction with a mode other than ``'move'``.
+    """
+    _check_mode(mode, storage, transaction)
+    existing = _check_sources(pairs, folder, storage)
+    local = [(src.name, dst.name) for src, dst in pairs if src.parent == folder]
+    incoming = [(src, dst) for src, dst in pairs if src.parent != folder]
+
+    if mode != MOVE:
+        for _, dst in pairs:
+            if dst.name in existing:
+                raise FileExistsError(dst)
+        yield from _copy_to(pairs, mode, storage)
+        return
+
+    # Names freed by renames within the folder can be taken by incoming files.
+    moving_out = {src for src, _ in local}
+    for _, dst in incoming:
+        if dst.name in existing and dst.name not in moving_out:
+            raise FileExistsError(dst)
+
+    plan = plan_renames(local, existing)
+    yield from run_plan(folder, plan, transaction, storage)
+
+    for src, dst in storage.move_pairs(incoming):
+        if transaction is not None:
+            transaction.record(src, dst, storage)
+        yield src, dst
+
+
+def _check_mode(
+    mode: str, storage: Storage, transaction: Optional[Transaction]
+) -> None:
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}, got '{mode}'")
+    if mode != MOVE and transaction is not None:
+        raise ValueError("only moves can be logged to a transaction")
+    if mode in LINK_MODES and not isinstance(storage, LocalStorage):
+        raise ValueError("links can only be made between local files")
+
+
+def _check_sources(pairs: PairList, folder: Path, storage: Storage) -> Set[str]:
+    """
+    checks every source exists, listing each folder once, and returns the names in
+    ``folder``
+    """
+    if len({src for src, _ in pairs}) != len(pairs):
+        raise ValueError("a file cannot be transferred twice")
+    if len({dst for _, dst in pairs}) != len(pairs):
+        raise ValueError("more than one file would get the same new path")
+
+    existing = set(storage.list_names(folder))
+    listings: Dict[Path, Set[str]] = {folder: existing}
+    for src, _ in pairs:
+        names = listings.get(src.parent)
+        if names is None:
+            names = listings[src.parent] = set(storage.list_names(src.parent))
+        if src.name not in names:
+            raise FileNotFoundError(src)
+    return existing
+
+
+def _copy_to(
+    pairs: PairList, mode: str, storage: Storage
+) -> Generator[Tuple[Path, Path], None, None]:
+    if mode == COPY:
+        copied = storage.copy_pairs(pairs)
+    else:
+        copied = LinkEngine(mode).copy_pairs(pairs)
+
+    for pair, _ in zip(pairs, copied):
+        yield pair
+
+
+def _pairs_to(
+    sources: List[Path], folder: Path, name: SeqName, nums: Sequence[int]
+) -> PairList:
+    """pairs of each source and its new path, named ``name`` with numbers ``nums``"""
+    new_names = name.format_frames(nums)
+    return [(src, folder / new) for src, new in zip(sources, new_names)]
+
+
+def _sequence_of(
+    seq: "FileSequence", folder: Path, name: SeqName, nums: range
+) -> "FileSequence":
+    return seq.from_name(folder, name, nums[0], nums[-1], nums.step, seq.storage)
+
+
+def _storage_of(seqs: Sequence["FileSequence"]) -> Storage:
+    storage = seqs[0].storage
+    if any(seq.storage is not storage for seq in seqs):
+        raise ValueError("sequences must all be on the same storage")
+    return storage
@@ -0,0 +1,505 @@
+import errno
+import mmap
+import os
+import queue
+import shutil
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Generator, Iterable, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+PairsType = Iterable[Tuple[Path, Path]]
+
+
+class CopyEngine:
+    """
+    Interface for copying files in :func:`FileBase.copy_iter`. Engines receive all
+    ``(src, dst)`` pairs of an operation up front, so they are free to pipeline work
+    across files.
+    """
+
+    def copy_pairs(self, pairs: PairsType) -> Generator[Path, None, None]:
+        """
+        Copies each ``src`` to ``dst``, yielding ``dst`` once it is fully written, in
+        the same order as ``pairs``. Closing the generator early must stop any
+        background work.
+        """
+        raise NotImplementedError
+
+
+class ShutilEngine(CopyEngine):
+    """Copies each file in turn with ``shutil.copy``. The default engine."""
+
+    def copy_pairs(self, pairs: PairsType) -> Generator[Path, None, None]:
+        for src, dst in pairs:
+            shutil.copy(str(src), str(dst))
+            yield dst
+
+
+SHUTIL_ENGINE = ShutilEngine()
+
+
+class BufferedEngine(CopyEngine):
+    def __init__(
+        self,
+        block_size: int = 8 * 1024 * 1024,
+        queue_size: int = 8,
+        fadvise: bool = True,
+        direct: bool = False,
+    ):
+        """
+        Copies through a reader thread and a writer thread sharing a fixed pool of
+        large, page aligned buffers. The reader runs ahead of the writer across file
+        boundaries, so reads of the next frame overlap writes of the last. Meant for
+        network filesystems where the small synchronous reads and writes of
+        ``shutil.copy`` leave the link idle.
+
+        Each file is written under a hidden name next to its destination and renamed
+        over it once complete, so an existing destination is replaced whole, never
+        truncated while still being read. Like ``shutil.copy``, copying a file onto
+        itself raises ``shutil.SameFileError``.
+
+        :param block_size: bytes per buffer and per read / write call. Rounded up to
+            a multiple of the page size.
+        :param queue_size: number of buffers in the pool, which bounds how far the
+            reader can run ahead and the memory used: ``block_size * queue_size``.
+        :param fadvise: where ``os.posix_fadvise`` is available, hint sequential
+            access on reads and drop source and destination pages from the page cache
+            once each file is done, so large copies do not evict other data.
+        :param direct: where ``O_DIRECT`` is available, write files of at least
+            ``block_size`` bytes straight to the device, bypassing the page cache.
+            The unaligned tail of each file is written normally. Filesystems that
+            refuse ``O_DIRECT`` fall back to normal writes.
+        """
+        if block_size < 1 or queue_size < 1:
+            raise ValueError("block_size and queue_size must be positive")
+
+        self.block_size: int = -(-block_size // mmap.PAGESIZE) * mmap.PAGESIZE
+        self.queue_size: int = queue_size
+        self.fadvise: bool = fadvise and hasattr(os, "posix_fadvise")
+        self.direct: bool = direct and hasattr(os, "O_DIRECT") and fcntl is not None
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(block_size={self.block_size}, "
+            f"queue_size={self.queue_size}, fadvise={self.fadvise}, "
+            f"direct={self.direct})"
+        )
+
+    def copy_pairs(self, pairs: PairsType) -> Generator[Path, None, None]:
+        pipeline = _Pipeline(self, pairs)
+        pipeline.start()
+
+        try:
+            while True:
+                item = pipeline.done.get()
+                if item is _FINISHED:
+                    return
+                elif isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            pipeline.stop()
+
+
+# Messages passed between pipeline threads.
+_FINISHED = object()
+_OPEN = "open"
+_DATA = "data"
+_END = "end"
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+class _Pipeline:
+    """Reader / writer threads and queues for a single :class:`BufferedEngine` call."""
+
+    def __init__(self, engine: BufferedEngine, pairs: PairsType):
+        self.engine = engine
+        self.pairs = pairs
+
+        # Buffers are allocated once per call and recycled through 'free'. Anonymous
+        #   mmaps are page aligned, which O_DIRECT style IO requires.
+        self.buffers: List[mmap.mmap] = [
+            mmap.mmap(-1, engine.block_size) for _ in range(engine.queue_size)
+        ]
+        self.free: "queue.Queue[mmap.mmap]" = queue.Queue()
+        for buffer in self.buffers:
+            self.free.put(buffer)
+
+        self.filled: "queue.Queue[Any]" = queue.Queue()
+        self.done: "queue.Queue[Any]" = queue.Queue()
+        self.stopped = threading.Event()
+
+        self.reader = threading.Thread(target=self._read_all, daemon=True)
+        self.writer = threading.Thread(target=self._write_all, daemon=True)
+
+    def start(self) -> None:
+        self.reader.start()
+        self.writer.start()
+
+    def stop(self) -> None:
+        """Stops both threads and releases buffers. Safe to call at any point."""
+        self.stopped.set()
+        # Unblock a reader waiting on a buffer and a writer waiting on data.
+        for buffer in self.buffers:
+            self.free.put(buffer)
+        self.filled.put(_FINISHED)
+
+        self.reader.join()
+        self.writer.join()
+
+        for buffer in self.buffers:
+            buffer.close()
+
+    def _read_all(self) -> None:
+        try:
+            for src, dst in self.pairs:
+                if self.stopped.is_set():
+                    return
+                self._read_file(src, dst)
+        except BaseException as error:
+            self.filled.put(error)
+        else:
+            self.filled.put(_FINISHED)
+
+    def _read_file(self, src: Path, dst: Path) -> None:
+        with open(str(src), "rb", buffering=0) as f:
+            fd = f.fileno()
+            if self.engine.fadvise:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            src_stat = os.fstat(fd)
+            _raise_if_same(src, dst, src_stat)
+            self.filled.put((_OPEN, dst, src_stat.st_size))
+
+            while not self.stopped.is_set():
+                buffer = self.free.get()
+                read = f.readinto(buffer)  # type: ignore
+                if not read:
+                    self.free.put(buffer)
+                    break
+                self.filled.put((_DATA, buffer, read))
+
+            if self.engine.fadvise:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+        self.filled.put((_END, src, dst))
+
+    def _write_all(self) -> None:
+        fd: Optional[int] = None
+        temp: Optional[Path] = None
+
+        try:
+            while True:
+                message = self.filled.get()
+                if message is _FINISHED or self.stopped.is_set():
+                    self.done.put(_FINISHED)
+                    return
+                elif isinstance(message, BaseException):
+                    self.done.put(message)
+                    return
+
+                kind, first, second = message
+                if kind == _OPEN:
+                    temp = _temp_path(first)
+                    fd = self._open_dst(temp, second)
+                elif kind == _DATA:
+                    if second % mmap.PAGESIZE:
+                        # O_DIRECT writes must be aligned, write the tail normally.
+                        _clear_direct(fd)  # type: ignore
+                    _write_buffer(fd, first, second)  # type: ignore
+                    self.free.put(first)
+                else:
+                    finished_fd, fd = fd, None
+                    self._finish_file(finished_fd, first, temp)  # type: ignore
+                    os.replace(str(temp), str(second))
+                    temp = None
+                    self.done.put(second)
+        except BaseException as error:
+            self.stopped.set()
+            self.done.put(error)
+        finally:
+            if fd is not None:
+                os.close(fd)
+            if temp is not None and os.path.lexists(str(temp)):
+                os.remove(str(temp))
+
+    def _open_dst(self, dst: Path, size: int) -> int:
+        if self.engine.direct and size >= self.engine.block_size:
+            try:
+                return os.open(str(dst), _WRITE_FLAGS | os.O_DIRECT)
+            except OSError as error:
+                if error.errno != errno.EINVAL:
+                    raise
+        return os.open(str(dst), _WRITE_FLAGS)
+
+    def _finish_file(self, fd: int, src: Path, dst: Path) -> None:
+        try:
+            if self.engine.fadvise:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+        # match shutil.copy, which copies permission bits.
+        shutil.copymode(str(src), str(dst))
+
+
+def _temp_path(dst: Path) -> Path:
+    """hidden path next to ``dst`` to write or link it under until complete"""
+    return dst.with_name(f".{dst.name}.{os.urandom(4).hex()}.copying")
+
+
+def _raise_if_same(src: Path, dst: Path, src_stat: os.stat_result) -> None:
+    """raises ``shutil.SameFileError`` if ``dst`` exists and is the file ``src``"""
+    try:
+        dst_stat = os.stat(str(dst))
+    except FileNotFoundError:
+        return
+    if (dst_stat.st_dev, dst_stat.st_ino) == (src_stat.st_dev, src_stat.st_ino):
+        raise shutil.SameFileError(f"{src} and {dst} are the same file")
+
+
+def _write_buffer(fd: int, buffer: mmap.mmap, length: int) -> None:
+    """writes the first ``length`` bytes of ``buffer``, retrying short writes"""
+    view = memoryview(buffer)
+    try:
+        written = 0
+        while written < length:
+            written += os.write(fd, view[written:length])
+    finally:
+        view.release()
+
+
+def _clear_direct(fd: int) -> None:
+    """turns off ``O_DIRECT`` on ``fd`` if it is set"""
+    if fcntl is None or not hasattr(os, "O_DIRECT"):
+        return
+
+    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+    if flags & os.O_DIRECT:
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags & ~os.O_DIRECT)
+
+
+HARD = "hard"
+SYMBOLIC = "sym"
+REFLINK = "reflink"
+
+LINK_MODES = (HARD, SYMBOLIC, REFLINK)
+
+# Errors meaning a link cannot be made between these two paths, rather than that
+#   something is wrong. Those pairs are copied instead.
+_LINK_FALLBACK_ERRORS = {
+    errno.EXDEV,
+    errno.EMLINK,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+    errno.EINVAL,
+    errno.ENOTTY,
+}
+
+# Linux ioctl cloning a whole file: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+
+class LinkEngine(CopyEngine):
+    def __init__(
+        self,
+        mode: str = HARD,
+        workers: int = 8,
+        fallback: Optional[CopyEngine] = None,
+    ):
+        """
+        "Virtual copy" engine. Creates each destination as a link to its source, a
+        single metadata call per file, spread over a pool of threads. Pairs that
+        cannot be linked, like those on different devices, are copied instead.
+
+        :param mode:
+
+            - ``'hard'``: hard link. Source and copy share data and permissions,
+              edits to one show in the other.
+            - ``'sym'``: symbolic link to the absolute source path.
+            - ``'reflink'``: copy-on-write clone where the filesystem supports it
+              (btrfs, xfs, APFS). Copies share data blocks until either is edited.
+
+        :param workers: threads making links at once.
+        :param fallback: engine for pairs that cannot be linked. Defaults to
+            :class:`ShutilEngine`. Every such pair of a call is sent through a single
+            ``copy_pairs`` call of the engine, so engines that pipeline reads and
+            writes across files still do.
+        """
+        if mode not in LINK_MODES:
+            raise ValueError(f"link mode must be one of {LINK_MODES}, got '{mode}'")
+        if workers < 1:
+            raise ValueError("workers must be positive")
+
+        self.mode: str = mode
+        self.workers: int = workers
+        self.fallback: CopyEngine = SHUTIL_ENGINE if fallback is None else fallback
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(mode='{self.mode}', workers={self.workers}, "
+            f"fallback={self.fallback!r})"
+        )
+
+    def copy_pairs(self, pairs: PairsType) -> Generator[Path, None, None]:
+        # Only a few links per worker are queued at once, so results are yielded in
+        #   order without first submitting every pair.
+        pending: Deque[Tuple[Future, Path]] = deque()
+        max_pending = self.workers * 4
+        copies = _FallbackStream(self.fallback)
+
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            for src, dst in pairs:
+                future = executor.submit(self._link, src, dst, copies)
+                pending.append((future, dst))
+                if len(pending) >= max_pending:
+                    yield copies.wait(*pending.popleft())
+
+            while pending:
+                yield copies.wait(*pending.popleft())
+        finally:
+            for future, _ in pending:
+                future.cancel()
+            executor.shutdown()
+            copies.close()
+
+    def _link(self, src: Path, dst: Path, copies: "_FallbackStream") -> bool:
+        """links ``dst`` to ``src``, or hands the pair to ``copies``. Returns linked"""
+        try:
+            _replace_with_link(self.mode, src, dst)
+        except OSError as error:
+            if error.errno not in _LINK_FALLBACK_ERRORS:
+                raise
+            copies.put(src, dst)
+            return False
+        return True
+
+
+class _FallbackStream:
+    """
+    Pairs that could not be linked, copied by one ``copy_pairs`` call of the fallback
+    engine on a thread of its own. Started by the first pair.
+    """
+
+    def __init__(self, engine: CopyEngine):
+        self.engine = engine
+        self.pairs: "queue.Queue[Optional[Tuple[Path, Path]]]" = queue.Queue()
+        self.copied: "queue.Queue[Any]" = queue.Queue()
+        # copies finished but not yet reached by the caller, which waits in order.
+        self.finished: Set[Path] = set()
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    def put(self, src: Path, dst: Path) -> None:
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._copy_all, daemon=True)
+                self.thread.start()
+        self.pairs.put((src, dst))
+
+    def wait(self, future: Future, dst: Path) -> Path:
+        """returns ``dst`` once linked, or copied if its link failed"""
+        if future.result():
+            return dst
+
+        while dst not in self.finished:
+            copied = self.copied.get()
+            if isinstance(copied, BaseException):
+                raise copied
+            self.finished.add(copied)
+        self.finished.discard(dst)
+        return dst
+
+    def close(self) -> None:
+        """ends the stream, letting copies of pairs already handed over finish"""
+        if self.thread is not None:
+            self.pairs.put(None)
+            self.thread.join()
+
+    def _copy_all(self) -> None:
+        try:
+            for dst in self.engine.copy_pairs(iter(self.pairs.get, None)):
+                self.copied.put(dst)
+        except BaseException as error:
+            self.copied.put(error)
+
+
+def _replace_with_link(mode: str, src: Path, dst: Path) -> None:
+    """
+    links ``dst`` to ``src``, replacing ``dst`` if it exists like a copy would. An
+    existing ``dst`` is only replaced once the new link is made, by renaming a link
+    under a hidden name over it.
+    """
+    try:
+        _make_link(mode, src, dst)
+        return
+    except FileExistsError:
+        _raise_if_same(src, dst, os.stat(str(src)))
+
+    temp = _temp_path(dst)
+    _make_link(mode, src, temp)
+    try:
+        os.replace(str(temp), str(dst))
+    except BaseException:
+        os.remove(str(temp))
+        raise
+
+
+def _make_link(mode: str, src: Path, dst: Path) -> None:
+    if mode == HARD:
+        os.link(str(src), str(dst))
+    elif mode == SYMBOLIC:
+        os.symlink(os.path.abspath(str(src)), str(dst))
+    else:
+        _reflink(src, dst)
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    """clones ``src`` to ``dst`` with FICLONE on linux and clonefile on macOS"""
+    if sys.platform == "darwin":
+        _clonefile(src, dst)
+        return
+
+    if fcntl is None or not sys.platform.startswith("linux"):
+        raise OSError(errno.ENOTSUP, "reflinks not supported on this platform")
+
+    with open(str(src), "rb") as src_file:
+        dst_fd = os.open(str(dst), _WRITE_FLAGS)
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_file.fileno())
+        except OSError:
+            os.close(dst_fd)
+            os.remove(str(dst))
+            raise
+        os.close(dst_fd)
+
+    # match shutil.copy, which copies permission bits.
+    shutil.copymode(str(src), str(dst))
+
+
+_CLONEFILE: Any = None
+
+
+def _clonefile(src: Path, dst: Path) -> None:
+    global _CLONEFILE
+
+    # ctypes is slow to import and only needed here, on macOS.
+    import ctypes
+    import ctypes.util
+
+    if _CLONEFILE is None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        _CLONEFILE = libc.clonefile
+
+    if _CLONEFILE(os.fsencode(str(src)), os.fsencode(str(dst)), 0) != 0:
+        error = ctypes.get_errno()
+        raise OSError(error, os.strerror(error), str(dst))
@@ -0,0 +1,246 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from pathlib import Path
+from typing import Dict, Generator, Iterable, List, Optional, Set, Tuple, Union
+
+from ._class_file import File
+from ._class_file_sequence import FileSequence
+from ._file_name import SeqName
+from ._frame_set import FrameSet
+from ._helpers_private import _init_path
+from ._name_patterns import NamePatterns
+from ._parallel import (
+    ProcessBackend,
+    ConventionsType,
+    conventions_of,
+    patterns_from,
+    pack_name,
+)
+from ._storage import Storage
+from ._usage import Usage
+
+
+# Names of one sequence share a key of (base, delim, extension, tail, pad). Names with
+#   leading zeros key their padding. Names without key a pad of 0, as they fit any
+#   padding up to their number of digits. Catalogs map each key to the frame numbers
+#   found, and list names that are not frames.
+NameKeyType = Tuple[str, str, Optional[str], Optional[str]]
+KeyType = Tuple[str, str, Optional[str], Optional[str], int]
+CatalogType = Tuple[Dict[KeyType, List[int]], List[str]]
+UsageType = Tuple[Union[File, FileSequence], Usage]
+ScannedType = Tuple[Union[File, FileSequence], List[os.stat_result]]
+
+
+def find_sequences(
+    folder: Union[str, Path],
+    patterns: Optional[NamePatterns] = None,
+    backend: Optional[ProcessBackend] = None,
+) -> List[Union[File, FileSequence]]:
+    """
+    Lists ``folder`` once and groups file names into sequences. Frame ranges with gaps
+    are split into one :class:`FileSequence` per contiguous run. Files that are not
+    numbered, or are the only frame of their name, are returned as :class:`File`.
+
+    :param folder: folder to catalog. Sub-folders are ignored.
+    :param patterns: naming conventions to parse with. Defaults to
+        ``perfsprocket.SEQ_PATTERNS``.
+    :param backend: :class:`ProcessBackend` to parse names on. Names are parsed in
+        this process by default.
+
+    :return: files and sequences, sorted by path.
+    """
+    folder = _init_path(folder)
+    conventions = conventions_of(patterns)
+
+    with os.scandir(str(folder)) as entries:
+        names = [entry.name for entry in entries if entry.is_file()]
+
+    if backend is None:
+        catalog = catalog_names(conventions, names)
+    else:
+        catalog = ({}, [])
+        func = partial(catalog_names, conventions)
+        for _, chunk_catalog in backend.map_iter(func, names):
+            _merge_catalogs(catalog, chunk_catalog)
+
+    return _build_files(folder, catalog)
+
+
+def catalog_names(conventions: ConventionsType, names: List[str]) -> CatalogType:
+    """groups ``names`` by sequence. Runs in worker processes for a backend."""
+    patterns = patterns_from(conventions)
+    groups: Dict[KeyType, List[int]] = dict()
+    singles: List[str] = list()
+
+    for name in names:
+        packed = pack_name(name, patterns)
+        # Placeholders, frame ranges and bracketed numbers name a whole sequence, not
+        #   a frame.
+        if packed is None or not isinstance(packed[2], int) or packed[3] is not None:
+            singles.append(name)
+            continue
+
+        base, delim, start, _, pad, braces, extension, tail = packed
+        if braces >= 0:
+            singles.append(name)
+            continue
+        if len(str(abs(start))) >= pad:
+            pad = 0
+
+        key = (base, delim, extension, tail, pad)
+        groups.setdefault(key, []).append(start)
+
+    return groups, singles
+
+
+def _merge_catalogs(catalog: CatalogType, other: CatalogType) -> None:
+    groups, singles = catalog
+    for key, frames in other[0].items():
+        groups.setdefault(key, []).extend(frames)
+    singles.extend(other[1])
+
+
+def _resolve_padding(groups: Dict[KeyType, List[int]]) -> Dict[KeyType, List[int]]:
+    """
+    Moves frames of names without leading zeros into the group of the same name with
+    the most padding their digits fill, EX: 'p.1000.exr' joins 'p.0999.exr'. Frames
+    left over share a group padded to the fewest digits among them.
+    """
+    pads: Dict[NameKeyType, List[int]] = dict()
+    for base, delim, extension, tail, pad in groups:
+        if pad:
+            pads.setdefault((base, delim, extension, tail), []).append(pad)
+
+    resolved: Dict[KeyType, List[int]] = dict()
+    for key, frames in groups.items():
+        base, delim, extension, tail, key_pad = key
+        if key_pad:
+            resolved.setdefault(key, []).extend(frames)
+            continue
+
+        name_key = (base, delim, extension, tail)
+
+        name_pads = sorted(pads.get(name_key, []), reverse=True)
+        unpadded: List[int] = list()
+        for frame in frames:
+            digits = len(str(abs(frame)))
+            pad = next((pad for pad in name_pads if pad <= digits), 0)
+            if pad:
+                resolved.setdefault(name_key + (pad,), []).append(frame)
+            else:
+                unpadded.append(frame)
+
+        if unpadded:
+            pad = min(len(str(abs(frame))) for frame in unpadded)
+            resolved.setdefault(name_key + (pad,), []).extend(unpadded)
+
+    return resolved
+
+
+def _build_files(
+    folder: Path, catalog: CatalogType, storage: Optional[Storage] = None
+) -> List[Union[File, FileSequence]]:
+    groups, singles = catalog
+    found: List[Union[File, FileSequence]] = [
+        File(folder / name, storage) for name in singles
+    ]
+
+    for key, frames in _resolve_padding(groups).items():
+        base, delim, extension, tail, pad = key
+        generic = SeqName(
+            base=base, extension=extension, delim=delim, pad=pad, tail=tail
+        )
+        if len(frames) == 1:
+            found.append(File(folder / generic.format_frames(frames)[0], storage))
+            continue
+
+        for first, last in FrameSet.from_frames(frames).ranges:
+            found.append(
+                FileSequence.from_name(folder, generic, first, last, 1, storage)
+            )
+
+    found.sort(key=lambda item: str(item.path))
+    return found
+
+
+def usage_iter(
+    root: Union[str, Path], patterns: Optional[NamePatterns] = None, workers: int = 8
+) -> Generator[UsageType, None, None]:
+    """
+    Disk usage of every file and sequence under ``root``. Each folder is listed once
+    with ``os.scandir`` and files are stat-ed from its entries, with folders scanned
+    on a pool of threads. Symbolic links are not followed or counted.
+
+    :param root: folder to scan, including all sub-folders.
+    :param patterns: naming conventions to group sequences with. Defaults to
+        ``perfsprocket.SEQ_PATTERNS``.
+    :param workers: folders scanned at once.
+
+    :return: yields ``(File or FileSequence, Usage)`` pairs, a folder at a time in
+        the order folders finish.
+    """
+    for item, stats in scan_tree_iter([root], patterns, workers):
+        yield item, Usage.from_stats(stats)
+
+
+def usage(
+    root: Union[str, Path], patterns: Optional[NamePatterns] = None, workers: int = 8
+) -> List[UsageType]:
+    """
+    Executes :func:`usage_iter`, returning pairs sorted by path. Combine them with
+    :func:`Usage.total`.
+    """
+    found = list(usage_iter(root, patterns, workers))
+    found.sort(key=lambda pair: str(pair[0].path))
+    return found
+
+
+def scan_tree_iter(
+    roots: Iterable[Union[str, Path]],
+    patterns: Optional[NamePatterns] = None,
+    workers: int = 8,
+) -> Generator[ScannedType, None, None]:
+    """
+    Yields every file and sequence under ``roots`` with the stat results of its
+    files, in file order. Folders are listed once each on a pool of threads, and
+    symbolic links are skipped.
+    """
+    conventions = conventions_of(patterns)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: Set[Future] = {
+            executor.submit(_scan_folder, _init_path(root), conventions)
+            for root in roots
+        }
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found, folders = future.result()
+                    for folder in folders:
+                        pending.add(executor.submit(_scan_folder, folder, conventions))
+                    yield from found
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _scan_folder(
+    folder: Path, conventions: ConventionsType
+) -> Tuple[List[ScannedType], List[Path]]:
+    """files and sequences in ``folder`` with their stat results, and its sub-folders"""
+    stats: Dict[str, os.stat_result] = dict()
+    folders: List[Path] = list()
+
+    with os.scandir(str(folder)) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                folders.append(Path(entry.path))
+            elif entry.is_file(follow_symlinks=False):
+                stats[entry.name] = entry.stat(follow_symlinks=False)
+
+    found: List[ScannedType] = list()
+    for item in _build_files(folder, catalog_names(conventions, list(stats))):
+        found.append((item, [stats[path.name] for path in item]))
+    return found, folders
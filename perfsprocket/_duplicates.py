@@ -0,0 +1,142 @@
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from ._class_file import File
+from ._class_file_sequence import FileSequence
+from ._discovery import scan_tree_iter
+from ._hashing import hash_file, DEFAULT_ALGORITHM
+from ._name_patterns import NamePatterns
+
+
+ItemType = Union[File, FileSequence]
+GroupType = List[ItemType]
+
+# Bytes read from both the start and the end of each file for partial hashes.
+PARTIAL_BLOCK_SIZE = 1 << 16
+
+
+def find_duplicates(
+    roots: Iterable[Union[str, Path]],
+    patterns: Optional[NamePatterns] = None,
+    workers: int = 8,
+    algorithm: str = DEFAULT_ALGORITHM,
+    block_size: int = PARTIAL_BLOCK_SIZE,
+) -> List[GroupType]:
+    """
+    Finds files and sequences under ``roots`` with identical contents, frame for
+    frame. Candidates are narrowed in three passes, each reading only what the pass
+    before could not tell apart:
+
+    1. signature: the number of frames and the size of each frame, from the stat
+       results of the directory scan.
+    2. partial hash: the first and last ``block_size`` bytes of each frame.
+    3. full hash: every byte of each frame. Skipped where the partial hash already
+       covered whole frames.
+
+    Hashing runs on a pool of threads. Empty files, and items whose frames are
+    already hard links of each other, are not reported.
+
+    :param roots: folders to search, including all sub-folders.
+    :param patterns: naming conventions to group sequences with. Defaults to
+        ``perfsprocket.SEQ_PATTERNS``.
+    :param workers: folders scanned and items hashed at once.
+    :param algorithm: any algorithm name accepted by ``hashlib.new``.
+    :param block_size: bytes read from each end of a frame for partial hashes.
+
+    :return: groups of duplicates. Each group is sorted by path, so the first item can
+        be kept and the rest deleted or replaced with links to it. Groups are sorted
+        by the path of their first item.
+    """
+    signatures: Dict[Tuple[int, ...], Tuple[GroupType, set]] = dict()
+
+    for item, stats in scan_tree_iter(roots, patterns, workers):
+        sizes = tuple(stat.st_size for stat in stats)
+        if not any(sizes):
+            continue
+
+        group, inodes = signatures.setdefault(sizes, (list(), set()))
+        item_inodes = _inodes_of(stats)
+        if item_inodes is not None:
+            if item_inodes in inodes:
+                continue
+            inodes.add(item_inodes)
+        group.append(item)
+
+    # Partial hashes of frames no larger than two blocks already cover every byte.
+    small: List[GroupType] = list()
+    large: List[GroupType] = list()
+    for sizes, (group, _) in signatures.items():
+        if len(group) > 1:
+            (small if max(sizes) <= block_size * 2 else large).append(group)
+
+    def partial(item: ItemType) -> str:
+        return partial_digest(item, algorithm, block_size)
+
+    def full(item: ItemType) -> str:
+        return full_digest(item, algorithm)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        small = _split_groups(executor, small, partial)
+        large = _split_groups(executor, _split_groups(executor, large, partial), full)
+
+    candidates = small + large
+    for group in candidates:
+        group.sort(key=lambda item: str(item.path))
+    candidates.sort(key=lambda group: str(group[0].path))
+    return candidates
+
+
+def partial_digest(item: ItemType, algorithm: str, block_size: int) -> str:
+    """hex digest of the first and last ``block_size`` bytes of each frame"""
+    digest = hashlib.new(algorithm)
+
+    for path in item:
+        with open(str(path), "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            digest.update(f.read(block_size))
+            if size > block_size:
+                # overlapping ends of small frames are not read twice.
+                f.seek(max(block_size, size - block_size))
+                digest.update(f.read(block_size))
+
+    return digest.hexdigest()
+
+
+def full_digest(item: ItemType, algorithm: str) -> str:
+    """hex digest of the digests of each frame, in order"""
+    digest = hashlib.new(algorithm)
+    for path in item:
+        digest.update(hash_file(path, algorithm).encode())
+    return digest.hexdigest()
+
+
+def _split_groups(
+    executor: ThreadPoolExecutor,
+    groups: List[GroupType],
+    digest_of: Callable[[ItemType], str],
+) -> List[GroupType]:
+    """splits each group by the digest of its items, dropping items left alone"""
+    items = [item for group in groups for item in group]
+    digests = iter(executor.map(digest_of, items))
+
+    split: List[GroupType] = list()
+    for group in groups:
+        by_digest: Dict[str, GroupType] = dict()
+        for item in group:
+            by_digest.setdefault(next(digests), list()).append(item)
+        split.extend(found for found in by_digest.values() if len(found) > 1)
+    return split
+
+
+def _inodes_of(stats: List[os.stat_result]) -> Optional[Tuple[Tuple[int, int], ...]]:
+    """
+    device and inode of each frame, ``None`` where the OS does not report inodes from
+    a directory scan.
+    """
+    inodes = tuple((stat.st_dev, stat.st_ino) for stat in stats)
+    if not all(inode for _, inode in inodes):
+        return None
+    return inodes
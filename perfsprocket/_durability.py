@@ -0,0 +1,228 @@
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generator, Iterable, List, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._storage import Storage
+
+
+NONE = "none"
+FSYNC = "fsync"
+BATCH = "batch"
+
+MODES = (NONE, FSYNC, BATCH)
+
+# Batch limits used when mode is 'batch' and neither limit is given.
+DEFAULT_BATCH_FRAMES = 100
+DEFAULT_BATCH_BYTES = 1024 * 1024 * 1024
+
+
+class Durability:
+    def __init__(
+        self,
+        mode: str = NONE,
+        batch_frames: Optional[int] = None,
+        batch_bytes: Optional[int] = None,
+    ):
+        """
+        When files written by copy and move operations are flushed to stable storage.
+        Operations only report a frame once it is as durable as the mode promises, so
+        the last frame yielded before a crash is the last frame safely on disk.
+
+        :param mode:
+
+            - ``'none'``: leave flushing to the OS. Fastest, but a crash may leave
+              truncated frames behind.
+            - ``'fsync'``: fsync each file and its folder before it is reported.
+            - ``'batch'``: flush the destination filesystem every ``batch_frames``
+              frames or ``batch_bytes`` bytes, whichever comes first, then report the
+              whole batch. Uses one ``syncfs`` call per batch where available, and
+              falls back to an fsync of each file in the batch.
+
+        :param batch_frames: frames per batch. Defaults to ``100`` if neither limit is
+            given.
+        :param batch_bytes: bytes per batch. Defaults to 1 GiB if neither limit is
+            given.
+        """
+        if mode not in MODES:
+            raise ValueError(f"durability mode must be one of {MODES}, got '{mode}'")
+
+        if batch_frames is None and batch_bytes is None:
+            batch_frames = DEFAULT_BATCH_FRAMES
+            batch_bytes = DEFAULT_BATCH_BYTES
+        limits = (batch_frames, batch_bytes)
+        if any(limit is not None and limit < 1 for limit in limits):
+            raise ValueError("batch limits must be positive")
+
+        self.mode: str = mode
+        self.batch_frames: Optional[int] = batch_frames
+        self.batch_bytes: Optional[int] = batch_bytes
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(mode='{self.mode}', "
+            f"batch_frames={self.batch_frames}, batch_bytes={self.batch_bytes})"
+        )
+
+    def flush_iter(
+        self,
+        written: Iterable[Path],
+        data: bool = True,
+        folders: Iterable[Path] = (),
+        storage: Optional["Storage"] = None,
+    ) -> Generator[Path, None, None]:
+        """
+        Passes through paths from ``written`` once they are flushed.
+
+        :param written: paths as they finish being written.
+        :param data: whether file contents need flushing. ``False`` for renames, which
+            only change folder entries.
+        :param folders: extra folders to flush alongside the folders of ``written``,
+            like the source folder of a move.
+        :param storage: :class:`Storage` the paths were written to, which flushes
+            them. Defaults to local files.
+        """
+        if self.mode == NONE:
+            yield from written
+            return
+
+        if storage is None:
+            # imported here, as local storage flushes files with this module.
+            from ._storage import LOCAL_STORAGE
+
+            storage = LOCAL_STORAGE
+        if self.mode == FSYNC:
+            yield from self._fsync_each(written, data, folders, storage)
+        else:
+            yield from self._fsync_batches(written, data, folders, storage)
+
+    def _fsync_each(
+        self,
+        written: Iterable[Path],
+        data: bool,
+        folders: Iterable[Path],
+        storage: "Storage",
+    ) -> Generator[Path, None, None]:
+        folders = list(folders)
+        for path in written:
+            if data:
+                storage.sync(path)
+            for folder in [path.parent] + folders:
+                storage.sync_folder(folder)
+            yield path
+
+    def _fsync_batches(
+        self,
+        written: Iterable[Path],
+        data: bool,
+        folders: Iterable[Path],
+        storage: "Storage",
+    ) -> Generator[Path, None, None]:
+        folders = list(folders)
+        pending: List[Path] = list()
+        pending_bytes = 0
+
+        for path in written:
+            pending.append(path)
+            if data and self.batch_bytes is not None:
+                pending_bytes += storage.stat(path).st_size
+
+            if self._batch_full(len(pending), pending_bytes):
+                _flush_batch(pending, data, folders, storage)
+                yield from pending
+                pending = list()
+                pending_bytes = 0
+
+        if pending:
+            _flush_batch(pending, data, folders, storage)
+            yield from pending
+
+    def _batch_full(self, frames: int, byte_count: int) -> bool:
+        if self.batch_frames is not None and frames >= self.batch_frames:
+            return True
+        return self.batch_bytes is not None and byte_count >= self.batch_bytes
+
+
+NO_DURABILITY = Durability()
+
+
+def _flush_batch(
+    paths: List[Path], data: bool, folders: List[Path], storage: "Storage"
+) -> None:
+    """flushes a batch of written paths and the folders holding them"""
+    batch_folders = list(dict.fromkeys([path.parent for path in paths] + folders))
+
+    if data:
+        storage.sync_paths(paths)
+
+    for folder in batch_folders:
+        storage.sync_folder(folder)
+
+
+def fsync_path(path: Path) -> None:
+    """flushes contents of file at ``path``"""
+    fd = os.open(str(path), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_folder(folder: Path) -> None:
+    """
+    flushes entries of ``folder`` so new and renamed files survive a crash. Folders
+    cannot be opened on windows, where this does nothing.
+    """
+    if os.name == "nt":
+        return
+
+    fd = os.open(str(folder), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+_SYNCFS: Any = None
+
+
+def syncfs_path(path: Path) -> bool:
+    """
+    flushes the whole filesystem holding ``path`` with linux ``syncfs``.
+
+    :return: ``False`` if ``syncfs`` is not available.
+    """
+    global _SYNCFS
+
+    if _SYNCFS is None:
+        _SYNCFS = _load_syncfs()
+    if _SYNCFS is False:
+        return False
+
+    fd = os.open(str(path), os.O_RDONLY)
+    try:
+        if _SYNCFS(fd) != 0:
+            import ctypes
+
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), str(path))
+    finally:
+        os.close(fd)
+    return True
+
+
+def _load_syncfs() -> Any:
+    """looks up ``syncfs`` in libc, ``False`` if not found"""
+    if not sys.platform.startswith("linux"):
+        return False
+
+    # ctypes is slow to import and only needed here.
+    import ctypes
+    import ctypes.util
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        return libc.syncfs
+    except (OSError, AttributeError):
+        return False
@@ -1,7 +1,12 @@
+import sys
 from typing import Generator, Union, Tuple, Any, TypeVar
-from typing_extensions import Protocol, runtime
 from pathlib import Path
 
+if sys.version_info >= (3, 8):
+    from typing import Protocol, runtime_checkable as runtime
+else:  # pragma: no cover
+    from typing_extensions import Protocol, runtime
+
 from ._file_name import NameABC
 
 
@@ -1,10 +1,27 @@
-import re
+import sys
 from dataclasses import dataclass
-from typing import Optional, Union, Dict, Tuple, overload, Any, cast
-from typing_extensions import Protocol
+from typing import (
+    Optional,
+    Union,
+    Dict,
+    Tuple,
+    List,
+    Iterable,
+    Sequence,
+    overload,
+    Any,
+    cast,
+)
 from pathlib import PurePath
 
+if sys.version_info >= (3, 8):
+    from typing import Protocol
+else:  # pragma: no cover
+    from typing_extensions import Protocol
+
 from ._helpers_private import _init_pure_path
+from ._name_patterns import NamePatterns, SEQ_PATTERNS
+from ._frame_set import FrameSet
 
 
 class Braces:
@@ -15,6 +32,14 @@ class Braces:
     def __repr__(self) -> str:
         return f"{self.open}{self.close}"
 
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Braces):
+            return NotImplemented
+        return self._open == other._open and self._close == other._close
+
+    def __hash__(self) -> int:
+        return hash((self._open, self._close))
+
     @property
     def open(self) -> str:
         """opening character passed to :func:`Braces.__init__`"""
@@ -29,6 +54,14 @@ class Braces:
         """wrap text in open and close char"""
         return f"{self.open}{text}{self.close}"
 
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        # The built in kinds unpickle as the same module level objects, so names
+        #   compare equal after a round trip.
+        for name, kind in zip(_BRACES_NAMES, BRACES_KINDS):
+            if self is kind:
+                return name
+        return type(self), (self.open, self.close)
+
 
 ARROW = Braces("<", ">")
 BRACKET = Braces("[", "]")
@@ -37,6 +70,20 @@ PAREN = Braces("(", ")")
 
 
 BRACES_KINDS = [ARROW, BRACKET, CURLY, PAREN]
+_BRACES_NAMES = ["ARROW", "BRACKET", "CURLY", "PAREN"]
+
+
+def braces_from_chars(chars: Optional[str]) -> Optional[Braces]:
+    """
+    :class:`Braces` for an open and close character pair like ``'[]'``, ``None`` for
+    ``None``. Built in kinds return the module level objects.
+    """
+    if chars is None:
+        return None
+    for kind in BRACES_KINDS:
+        if chars == f"{kind.open}{kind.close}":
+            return kind
+    return Braces(chars[0], chars[1])
 
 
 class Flag:
@@ -46,17 +93,9 @@ class Flag:
 KEEP = Flag()
 
 
-PATTERN = re.compile(
-    r"^"
-    r"(?P<base>.+)"
-    r"(?P<sep>[._])"
-    r"(?P<open>[\[{<(])?"
-    r"(?P<start>\d+|#+)"
-    r"(-(?P<end>\d*|#*))?"
-    r"(?P<close>[\]}>)])?"
-    r"(?P<extension>\..+)?"
-    r"$"
-)
+# Strings accepted as generic 'start' / 'end' file numbers, one per convention of
+#   writing a placeholder: 'file.####.exr', 'file.@@@@.exr', 'file.%04d.exr'.
+PLACEHOLDERS = ("#", "@", "%")
 
 
 class NameABC(Protocol):
@@ -128,6 +167,18 @@ class FileName(NameABC):
 
         return FileName(base=base_arg, extension=extension_arg)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Fields as a JSON friendly dict, with the class name under ``'type'``."""
+        return {"type": "FileName", "base": self.base, "extension": self.extension}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FileName":
+        """New :class:`FileName` from :func:`FileName.to_dict`"""
+        return cls(base=data["base"], extension=data["extension"])
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self.base, self.extension)
+
     def formatted(self) -> str:
         """returns formatted string EX: `movie.mp4`"""
         extension = self.extension if self.extension else ""
@@ -141,6 +192,9 @@ class SeqName(FileName):
     end: Optional[Union[int, str]] = None
     pad: int = 0
     brackets: Optional[Braces] = None
+    # Text between the file number and the extension of names with the file number
+    #   mid-name, EX: '_v001' in 'shot_0100_v001.exr'
+    tail: Optional[str] = None
 
     def __post_init__(self) -> None:
         super().__post_init__()
@@ -148,11 +202,31 @@ class SeqName(FileName):
         object.__setattr__(self, "end", _post_init_start_end(self.end))
 
     @classmethod
-    def from_path(cls, path: Union[str, PurePath]) -> "SeqName":
-        """Parse file sequence filename from path"""
+    def from_path(
+        cls, path: Union[str, PurePath], patterns: Optional[NamePatterns] = None
+    ) -> "SeqName":
+        """
+        Parse file sequence filename from path
+
+        :param path: path or file name to parse.
+        :param patterns: naming conventions to parse with. Defaults to
+            ``perfsprocket.SEQ_PATTERNS``.
+        """
+        name, _ = cls.from_path_with_convention(path, patterns)
+        return name
+
+    @classmethod
+    def from_path_with_convention(
+        cls, path: Union[str, PurePath], patterns: Optional[NamePatterns] = None
+    ) -> Tuple["SeqName", str]:
+        """
+        Same as :func:`SeqName.from_path`, also returning the name of the naming
+        convention that matched.
+        """
         path = _init_pure_path(path)
-        pieces = _extract_pieces_from_str(path)
-        base, delim, start, num_end, pad, brackets, extension = pieces
+        convention, groups = _match_filename(path, patterns)
+        pieces = _pieces_from_groups(groups)
+        base, delim, start, num_end, pad, brackets, extension, tail = pieces
 
         new = cls(
             base=base,
@@ -162,8 +236,46 @@ class SeqName(FileName):
             end=num_end,
             pad=pad,
             brackets=brackets,
+            tail=tail,
+        )
+        return new, convention
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Fields as a JSON friendly dict, with the class name under ``'type'``. Braces
+        are stored as their characters, EX: ``'[]'``.
+        """
+        brackets = self.brackets
+        chars = None if brackets is None else f"{brackets.open}{brackets.close}"
+        return {
+            "type": "SeqName",
+            "base": self.base,
+            "extension": self.extension,
+            "delim": self.delim,
+            "start": self.start,
+            "end": self.end,
+            "pad": self.pad,
+            "brackets": chars,
+            "tail": self.tail,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SeqName":
+        """New :class:`SeqName` from :func:`SeqName.to_dict`"""
+        return cls(
+            base=data["base"],
+            extension=data["extension"],
+            delim=data["delim"],
+            start=data["start"],
+            end=data["end"],
+            pad=data["pad"],
+            brackets=braces_from_chars(data["brackets"]),
+            tail=data.get("tail"),
         )
-        return new
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        fields = (self.delim, self.start, self.end, self.pad, self.brackets, self.tail)
+        return type(self), (self.base, self.extension) + fields
 
     def alter(
         self,
@@ -174,6 +286,7 @@ class SeqName(FileName):
         end: Optional[Union[int, str, Flag]] = KEEP,
         pad: Union[int, Flag] = KEEP,
         brackets: Optional[Union[Braces, Flag]] = KEEP,
+        tail: Optional[Union[str, Flag]] = KEEP,
         **kwargs: Union[Any, Flag],
     ) -> "SeqName":
         """
@@ -183,8 +296,17 @@ class SeqName(FileName):
 
         :return: new object
         """
-        new = base, extension, delim, start, end, pad, brackets
-        names = ["base", "extension", "delim", "start", "end", "pad", "brackets"]
+        new = base, extension, delim, start, end, pad, brackets, tail
+        names = [
+            "base",
+            "extension",
+            "delim",
+            "start",
+            "end",
+            "pad",
+            "brackets",
+            "tail",
+        ]
 
         kwargs = dict()
 
@@ -202,23 +324,72 @@ class SeqName(FileName):
         open_bracket, close_bracket, range_sep = _format_range_pieces(self)
         start_str, end_str = _format_file_nums(self)
         ext = self.extension if self.extension else ""
+        tail = self.tail if self.tail else ""
 
         formatted = (
             f"{self.base}{self.delim}{open_bracket}{start_str}{range_sep}{end_str}"
-            f"{close_bracket}{ext}"
+            f"{close_bracket}{tail}{ext}"
         )
 
         return formatted
 
+    @overload
+    def format_frames(self, frames: Iterable[int], join: None = None) -> List[str]:
+        ...
+
+    @overload  # noqa: F811
+    def format_frames(self, frames: Iterable[int], join: str) -> str:
+        ...
+
+    def format_frames(  # noqa: F811
+        self, frames: Iterable[int], join: Optional[str] = None
+    ) -> Union[List[str], str]:
+        """
+        Formats the file name of every frame in ``frames`` in one pass. Gives the same
+        names as calling ``str(name.alter(start=frame, end=None))`` for each frame.
+
+        Large requests are rendered in bulk with numpy when it is installed.
+
+        :param frames: ``range``, :class:`FrameSet`, numpy array or any iterable of
+            frame numbers.
+        :param join: when given, returns a single string of all names separated by
+            ``join`` instead of a list.
+        """
+        # numpy arrays go straight to numpy, only other iterators are listed.
+        nums: Union[Sequence[int], FrameSet]
+        if isinstance(frames, (Sequence, FrameSet)) or _is_array(frames):
+            nums = cast(Union[Sequence[int], FrameSet], frames)
+        else:
+            nums = list(frames)
+
+        prefix, suffix = _frame_affixes(self)
+
+        names = _format_frames_numpy(prefix, suffix, self.pad, nums, join)
+        if names is not None:
+            return names
+
+        if isinstance(nums, FrameSet) or _is_array(nums):
+            nums = list(nums)
+
+        names_list = _format_frames_python(prefix, suffix, self.pad, nums)
+        if join is not None:
+            return join.join(names_list)
+        return names_list
+
+
+def _file_num_from_str(text: str) -> Union[int, str]:
+    """parses file number text. Placeholders like '####' return their placeholder."""
+    for placeholder in PLACEHOLDERS:
+        if placeholder in text:
+            return placeholder
+    return int(text)
+
 
 def _num_end_from_match(groups: Dict[str, Optional[str]]) -> Optional[Union[int, str]]:
     """extract end frame from REGEX match."""
     num_end: Optional[str] = groups["end"]
     if num_end:
-        if "#" in num_end:
-            result: Optional[Union[int, str]] = "#"
-        else:
-            result = int(num_end)
+        result: Optional[Union[int, str]] = _file_num_from_str(num_end)
     else:
         result = None
     return result
@@ -229,7 +400,12 @@ def _padding_from_match(groups: Dict[str, Optional[str]]) -> int:
     start = groups["start"]
     start = cast(str, start)
 
-    padding = len(start)
+    # printf placeholders give their padding as the field width: '%04d'
+    if start.startswith("%"):
+        width = start[1:-1]
+        return int(width) if width else 0
+
+    padding = len(start.lstrip("-"))
 
     return padding
 
@@ -271,31 +447,214 @@ def _format_range_pieces(seq_name: "SeqName") -> Tuple[str, str, str]:
     return open_bracket, close_bracket, range_sep
 
 
-def _format_file_nums(seq_name: "SeqName") -> Tuple[str, str]:
-    fill_start = "#" if seq_name.start == "#" else "0"
-    fill_end = "#" if seq_name.end == "#" else "0"
+def _format_file_num(num: Union[int, str], pad: int) -> str:
+    """formats a single file number or placeholder to ``pad`` characters"""
+    if num == "%":
+        return f"%0{pad}d" if pad else "%d"
+    elif isinstance(num, str):
+        return num.rjust(pad, num)
+    elif num < 0:
+        return f"-{str(-num).rjust(pad, '0')}"
+    else:
+        return str(num).rjust(pad, "0")
+
 
-    start_str = str(seq_name.start).rjust(seq_name.pad, fill_start)
+def _format_file_nums(seq_name: "SeqName") -> Tuple[str, str]:
+    start_str = _format_file_num(seq_name.start, seq_name.pad)
 
     if seq_name.end is not None:
-        end_str = str(seq_name.end).rjust(seq_name.pad, fill_end)
+        end_str = _format_file_num(seq_name.end, seq_name.pad)
     else:
         end_str = ""
 
     return start_str, end_str
 
 
-def _run_filename_regex(path: PurePath) -> Dict[str, Optional[str]]:
-    """extracts sequence name parts from regex"""
-    file_name = path.name
+def _frame_affixes(seq_name: "SeqName") -> Tuple[str, str]:
+    """Returns text before and after the file number of a single-frame name."""
+    ext = seq_name.extension if seq_name.extension else ""
+    tail = seq_name.tail if seq_name.tail else ""
+    return f"{seq_name.base}{seq_name.delim}", f"{tail}{ext}"
+
+
+def _format_frames_python(
+    prefix: str, suffix: str, pad: int, frames: Sequence[int]
+) -> List[str]:
+    """Formats frame names with a single precompiled %-template."""
+    if len(frames) and min(frames) < 0:
+        # Negative numbers are padded without their sign, which a single %-template
+        #   cannot do.
+        return [f"{prefix}{_format_file_num(num, pad)}{suffix}" for num in frames]
+
+    num_format = f"%0{pad}d" if pad else "%d"
+    template = f"{prefix.replace('%', '%%')}{num_format}{suffix.replace('%', '%%')}"
+    return list(map(template.__mod__, frames))
+
 
-    result = re.match(PATTERN, file_name)
+def _is_ascii(text: str) -> bool:
+    # str.isascii is only available from python 3.7.
+    try:
+        text.encode("ascii")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def _is_array(frames: Any) -> bool:
+    """whether ``frames`` is a numpy array, checked without importing numpy"""
+    return type(frames).__module__ == "numpy"
+
+
+# Below this many frames the numpy setup costs more than it saves.
+_NUMPY_MIN_FRAMES = 4096
+
+# Powers of ten used to count digits. int64 frame numbers have at most 19 digits.
+_DIGIT_BOUNDS = [10**i for i in range(1, 19)]
+
+
+def _format_frames_numpy(
+    prefix: str,
+    suffix: str,
+    pad: int,
+    frames: Union[Sequence[int], FrameSet],
+    join: Optional[str],
+) -> Optional[Union[List[str], str]]:
+    """
+    Renders frame names as rows of ascii digits with numpy. Returns ``None`` when
+    numpy is unavailable or the request is not suited to it, so the caller can fall
+    back to :func:`_format_frames_python`.
+    """
+    sep = "\n" if join is None else join
+    # Lists are made by splitting the joined text on newlines.
+    unsplittable = join is None and "\n" in prefix + suffix
+
+    if len(frames) < _NUMPY_MIN_FRAMES or unsplittable:
+        return None
+    if not _is_ascii(prefix + suffix + sep):
+        return None
+
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    nums = _frames_to_array(np, frames)
+    if nums.min() < 0:
+        return None
+
+    # uint32 division is noticeably faster than int64 where the numbers allow it.
+    if nums.max() < 2**32:
+        nums = nums.astype(np.uint32)
+
+    buffer = _render_frames_numpy(np, nums, prefix, suffix + sep, pad)
+
+    text = buffer.tobytes().decode("ascii")
+    if sep:
+        text = text[: len(text) - len(sep)]
+
+    if join is None:
+        return text.split(sep)
+    return text
+
+
+def _frames_to_array(np: Any, frames: Union[Sequence[int], FrameSet]) -> Any:
+    """int64 array of frames, built from ranges without iterating where possible"""
+    if isinstance(frames, range):
+        return np.arange(frames.start, frames.stop, frames.step, dtype=np.int64)
+    elif isinstance(frames, FrameSet):
+        ranges = frames.ranges
+        return np.concatenate(
+            [np.arange(first, last + 1, dtype=np.int64) for first, last in ranges]
+        )
+    else:
+        return np.asarray(frames, dtype=np.int64)
+
+
+def _render_frames_numpy(np: Any, nums: Any, prefix: str, tail: str, pad: int) -> Any:
+    """
+    Returns a uint8 buffer of ``{prefix}{padded num}{tail}`` for each number. Rows are
+    built separately for each digit width, as widths grow past the padding.
+    """
+    digits = np.searchsorted(np.array(_DIGIT_BOUNDS, dtype=np.int64), nums, "right")
+    widths = np.maximum(digits + 1, pad)
+
+    row_lengths = widths + len(prefix) + len(tail)
+    offsets = np.zeros(len(nums) + 1, dtype=np.int64)
+    np.cumsum(row_lengths, out=offsets[1:])
+
+    buffer = np.empty(int(offsets[-1]), dtype=np.uint8)
+    prefix_bytes = np.frombuffer(prefix.encode("ascii"), dtype=np.uint8)
+    tail_bytes = np.frombuffer(tail.encode("ascii"), dtype=np.uint8)
+
+    # Ascending frames, the common case, have each width in one contiguous run that
+    #   can be written with a slice rather than a scatter.
+    ascending = bool(np.all(widths[1:] >= widths[:-1]))
+
+    for width in range(int(widths.min()), int(widths.max()) + 1):
+        if ascending:
+            first, last = np.searchsorted(widths, [width, width + 1])
+            selection: Any = slice(first, last)
+        else:
+            selection = np.flatnonzero(widths == width)
+
+        selected = nums[selection]
+        if not len(selected):
+            continue
+
+        rows = _render_width_rows(np, selected, width, prefix_bytes, tail_bytes)
+
+        if ascending:
+            row_start, row_end = offsets[first], offsets[last]
+            buffer[row_start:row_end] = rows.reshape(-1)
+        else:
+            positions = offsets[selection][:, None] + np.arange(rows.shape[1])
+            buffer[positions] = rows
+
+    return buffer
+
+
+def _render_width_rows(
+    np: Any, nums: Any, width: int, prefix_bytes: Any, tail_bytes: Any
+) -> Any:
+    """Returns 2D uint8 array with one name per row, all numbers ``width`` digits."""
+    digits_start = len(prefix_bytes)
+    digits_end = digits_start + width
+
+    rows = np.empty((len(nums), digits_end + len(tail_bytes)), dtype=np.uint8)
+    rows[:, :digits_start] = prefix_bytes
+    rows[:, digits_end:] = tail_bytes
+
+    # Digits are computed one contiguous row per decimal place, then copied into the
+    #   name rows in a single transposed assignment.
+    digit_rows = np.empty((width, len(nums)), dtype=np.uint8)
+    remaining = nums
+    for place in range(width - 1, -1, -1):
+        quotient = remaining // 10
+        digit_rows[place] = remaining - quotient * 10
+        remaining = quotient
+    digit_rows += 48
+
+    rows[:, digits_start:digits_end] = digit_rows.T
+    return rows
+
+
+def _match_filename(
+    path: PurePath, patterns: Optional[NamePatterns] = None
+) -> Tuple[str, Dict[str, Optional[str]]]:
+    """matches file name against naming conventions, returns convention and groups"""
+    if patterns is None:
+        patterns = SEQ_PATTERNS
+
+    result = patterns.match(path.name)
     if result is None:
-        raise ValueError
+        raise ValueError(f"'{path.name}' does not match a sequence naming convention")
+
+    return result.convention, result.groups
+
 
-    # Stub file for re is wrong here. None can be a value if group is optional.
-    #   We need to ignore MyPy complaining that Optional[str] is incorrect
-    groups: Dict[str, Optional[str]] = result.groupdict()  # type: ignore
+def _run_filename_regex(path: PurePath) -> Dict[str, Optional[str]]:
+    """extracts sequence name parts from regex"""
+    _, groups = _match_filename(path)
     return groups
 
 
@@ -307,13 +666,18 @@ PiecesType = Tuple[
     int,
     Optional[Braces],
     Optional[str],
+    Optional[str],
 ]
 
 
 def _extract_pieces_from_str(path: PurePath) -> PiecesType:
     """extracts filename pieces from regex"""
     groups = _run_filename_regex(path)
+    return _pieces_from_groups(groups)
+
 
+def _pieces_from_groups(groups: Dict[str, Optional[str]]) -> PiecesType:
+    """converts convention match groups to filename pieces"""
     num_end = _num_end_from_match(groups)
     padding = _padding_from_match(groups)
     brackets = _brackets_from_match(groups)
@@ -323,19 +687,16 @@ def _extract_pieces_from_str(path: PurePath) -> PiecesType:
     base = cast(str, base)
 
     extension = groups["extension"]
+    tail = groups["tail"]
     sep = groups["sep"]
 
     start = groups["start"]
     start = cast(str, start)
-
-    if "#" in start:
-        start_arg: Union[int, str] = "#"
-    else:
-        start_arg = int(start)
+    start_arg = _file_num_from_str(start)
 
     sep = cast(str, sep)
 
-    return base, sep, start_arg, num_end, padding, brackets, extension
+    return base, sep, start_arg, num_end, padding, brackets, extension, tail
 
 
 @overload
@@ -353,14 +714,14 @@ def _post_init_start_end(  # noqa: F811
 ) -> Optional[Union[int, str]]:
     """
     parses start and end values, returns int when castable, raises value error if
-    not and string is not "#"
+    not and string is not a placeholder: "#", "@" or "%"
     """
     if value is None:
         return None
     if isinstance(value, str):
-        if "#" in value:
-            return "#"
-        else:
-            raise ValueError("start/end must be int or '#'")
+        for placeholder in PLACEHOLDERS:
+            if placeholder in value:
+                return placeholder
+        raise ValueError("start/end must be int, '#', '@' or '%'")
     else:
         return value
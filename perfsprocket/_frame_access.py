@@ -0,0 +1,307 @@
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from ._storage import LocalStorage
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._class_file_sequence import FileSequence
+
+
+HandleType = Union[int, mmap.mmap]
+
+FD = "fd"
+MMAP = "mmap"
+
+HANDLE_KINDS = (FD, MMAP)
+
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+class FrameAccessor:
+    def __init__(
+        self,
+        seq: "FileSequence",
+        max_open: int = 64,
+        handles: str = FD,
+        prefetch: int = 0,
+    ):
+        """
+        Fast random access to the frames of a :class:`FileSequence`, for callers that
+        look up frames many times a second, like playback.
+
+        Frame paths are formatted from a cached template rather than by altering the
+        sequence name. Opened frames are kept in a bounded LRU cache of file
+        descriptors or read-only mmaps. With ``prefetch`` set, a background thread
+        opens the next frames in the direction of play and asks the OS to read them
+        ahead.
+
+        Handles belong to the accessor. A handle returned by
+        :func:`FrameAccessor.open` is pinned until :func:`FrameAccessor.release`, so
+        neither later opens nor prefetching can close it while it is in use. Unpinned
+        handles are closed when evicted from the cache, and all handles when the
+        accessor is closed. Use as a context manager to close automatically.
+
+        :param seq: sequence to access.
+        :param max_open: most handles kept open at once, not counting pinned handles
+            beyond it.
+        :param handles: ``'fd'`` for file descriptors or ``'mmap'`` for read-only
+            mmaps of whole frames.
+        :param prefetch: number of frames to open ahead of the last frame accessed.
+            Must be lower than ``max_open``, so prefetched frames do not evict each
+            other.
+
+        :raises ValueError: if ``seq`` is not on local files.
+        """
+        if handles not in HANDLE_KINDS:
+            raise ValueError(f"handles must be one of {HANDLE_KINDS}, got '{handles}'")
+        if max_open < 1 or prefetch < 0 or prefetch >= max_open:
+            raise ValueError("max_open must be positive and above prefetch")
+        if not isinstance(seq.storage, LocalStorage):
+            raise ValueError("frames can only be opened from local files")
+
+        self.seq: "FileSequence" = seq
+        self.max_open: int = max_open
+        self.handles: str = handles
+        self.prefetch: int = prefetch
+
+        self._folder: str = os.path.join(str(seq.path.parent), "")
+        self._open: "OrderedDict[int, HandleType]" = OrderedDict()
+        self._pins: Dict[int, int] = dict()
+        self._lock = threading.Lock()
+        self._last_frame: Optional[int] = None
+
+        self._prefetcher: Optional[_Prefetcher] = None
+        if prefetch:
+            self._prefetcher = _Prefetcher(self)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.seq!r}, max_open={self.max_open}, "
+            f"handles='{self.handles}', prefetch={self.prefetch})"
+        )
+
+    def __enter__(self) -> "FrameAccessor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __contains__(self, frame: Any) -> bool:
+        seq = self.seq
+        return (
+            isinstance(frame, int)
+            and seq.start <= frame <= seq.end
+            and (frame - seq.start) % seq.step == 0
+        )
+
+    def path(self, frame: int) -> str:
+        """
+        Path of file number ``frame`` as a string.
+
+        :raises IndexError: if ``frame`` is not in the sequence.
+        """
+        if frame not in self:
+            raise IndexError(f"frame {frame} not in {self.seq!r}")
+        return self._folder + self.seq.frame_name(frame)
+
+    def open(self, frame: int) -> HandleType:
+        """
+        Returns an open handle to file number ``frame``, from the cache if possible.
+        The handle is pinned open until a matching call to
+        :func:`FrameAccessor.release`. Schedules prefetching of the frames after it in
+        the direction of play.
+
+        :raises IndexError: if ``frame`` is not in the sequence.
+        """
+        path = self.path(frame)
+
+        with self._lock:
+            handle = self._open.get(frame)
+            if handle is not None:
+                self._open.move_to_end(frame)
+                self._pins[frame] = self._pins.get(frame, 0) + 1
+
+        if handle is None:
+            handle = self._insert(frame, _open_handle(path, self.handles), pin=True)
+
+        if self._prefetcher is not None:
+            self._prefetcher.request(self._frames_ahead(frame))
+        self._last_frame = frame
+
+        return handle
+
+    def release(self, frame: int) -> None:
+        """
+        Unpins a handle returned by :func:`FrameAccessor.open`, so it can be closed
+        once evicted. Each call to ``open`` needs one call to ``release``.
+
+        :raises ValueError: if ``frame`` is not pinned.
+        """
+        with self._lock:
+            count = self._pins.get(frame)
+            if count is None:
+                raise ValueError(f"frame {frame} is not pinned")
+            elif count == 1:
+                del self._pins[frame]
+            else:
+                self._pins[frame] = count - 1
+            evicted = self._trim()
+
+        for handle in evicted:
+            _close_handle(handle)
+
+    def cached(self, frame: int) -> bool:
+        """whether file number ``frame`` is open in the cache"""
+        with self._lock:
+            return frame in self._open
+
+    def close(self) -> None:
+        """Stops prefetching and closes all handles."""
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+            self._prefetcher = None
+
+        with self._lock:
+            handles = list(self._open.values())
+            self._open.clear()
+            self._pins.clear()
+
+        for handle in handles:
+            _close_handle(handle)
+
+    def _insert(self, frame: int, handle: HandleType, pin: bool = False) -> HandleType:
+        """
+        adds a handle to the cache, returning the cached handle for the frame. Pinned
+        before anything is evicted when ``pin`` is set.
+        """
+        evicted: List[HandleType] = list()
+
+        with self._lock:
+            if pin:
+                self._pins[frame] = self._pins.get(frame, 0) + 1
+
+            existing = self._open.get(frame)
+            if existing is not None:
+                # opened by the other thread in the meantime.
+                self._open.move_to_end(frame)
+                evicted.append(handle)
+                handle = existing
+            else:
+                self._open[frame] = handle
+                evicted.extend(self._trim())
+
+        for old in evicted:
+            _close_handle(old)
+        return handle
+
+    def _trim(self) -> List[HandleType]:
+        """
+        removes the least recently used unpinned handles over ``max_open`` from the
+        cache, returning them to be closed. Call with the lock held.
+        """
+        excess = len(self._open) - self.max_open
+        if excess <= 0:
+            return []
+
+        frames = list()
+        for frame in self._open:
+            if frame not in self._pins:
+                frames.append(frame)
+                if len(frames) == excess:
+                    break
+        return [self._open.pop(frame) for frame in frames]
+
+    def _frames_ahead(self, frame: int) -> List[int]:
+        """frames to prefetch after ``frame``, backwards when playing in reverse"""
+        step = self.seq.step
+        if self._last_frame is not None and frame < self._last_frame:
+            step = -step
+
+        ahead = list()
+        for i in range(1, self.prefetch + 1):
+            next_frame = frame + step * i
+            if next_frame not in self:
+                break
+            ahead.append(next_frame)
+        return ahead
+
+
+class _Prefetcher:
+    """Background thread opening frames requested by a :class:`FrameAccessor`."""
+
+    def __init__(self, accessor: FrameAccessor):
+        self.accessor = accessor
+        self.frames: List[int] = list()
+        self.wake = threading.Condition()
+        self.stopped = False
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def request(self, frames: List[int]) -> None:
+        """replaces pending frames, so scrubbing never queues up stale work"""
+        with self.wake:
+            self.frames = frames
+            self.wake.notify()
+
+    def stop(self) -> None:
+        with self.wake:
+            self.stopped = True
+            self.wake.notify()
+        self.thread.join()
+
+    def _next_frame(self) -> Optional[int]:
+        with self.wake:
+            while not self.frames and not self.stopped:
+                self.wake.wait()
+            if self.stopped:
+                return None
+            return self.frames.pop(0)
+
+    def _run(self) -> None:
+        accessor = self.accessor
+        while True:
+            frame = self._next_frame()
+            if frame is None:
+                return
+            if accessor.cached(frame):
+                continue
+
+            try:
+                handle = _open_handle(accessor.path(frame), accessor.handles)
+            except (OSError, ValueError):
+                # missing or empty frames raise when actually accessed.
+                continue
+
+            _read_ahead(handle)
+            accessor._insert(frame, handle)
+
+
+def _open_handle(path: str, kind: str) -> HandleType:
+    fd = os.open(path, _READ_FLAGS)
+    if kind == FD:
+        return fd
+
+    try:
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+
+def _close_handle(handle: HandleType) -> None:
+    if isinstance(handle, mmap.mmap):
+        handle.close()
+    else:
+        os.close(handle)
+
+
+def _read_ahead(handle: HandleType) -> None:
+    """asks the OS to start reading a frame into the page cache, where supported"""
+    if isinstance(handle, mmap.mmap):
+        if hasattr(handle, "madvise") and hasattr(mmap, "MADV_WILLNEED"):
+            handle.madvise(mmap.MADV_WILLNEED)
+    elif hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(handle, 0, 0, os.POSIX_FADV_WILLNEED)
@@ -0,0 +1,185 @@
+import mmap
+import os
+from collections import OrderedDict
+from typing import Any, List, Optional
+
+SEQUENTIAL = getattr(mmap, "MADV_SEQUENTIAL", None)
+RANDOM = getattr(mmap, "MADV_RANDOM", None)
+WILLNEED = getattr(mmap, "MADV_WILLNEED", None)
+
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+class MappingPool:
+    def __init__(self, size: int = 8):
+        """
+        Bounded pool of read-only file mappings, reused when the same file is opened
+        again. Mappings in use are never closed by the pool. Once released, the least
+        recently used mappings are closed when the pool grows past ``size``.
+
+        Use as a context manager, or call :func:`MappingPool.close`, to close all
+        mappings. Mappings still in use are closed as soon as they are released.
+
+        :param size: most idle mappings kept open.
+        """
+        if size < 1:
+            raise ValueError("size must be positive")
+
+        self.size: int = size
+        # path: [mapping, number of borrowers]
+        self._mappings: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self._closed = False
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={self.size})"
+
+    def __len__(self) -> int:
+        return len(self._mappings)
+
+    def __enter__(self) -> "MappingPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __contains__(self, path: Any) -> bool:
+        return path in self._mappings
+
+    def acquire(self, path: str) -> mmap.mmap:
+        """
+        Returns a mapping of the whole file at ``path``, which must not be empty.
+        Each call must be matched by a call to :func:`MappingPool.release`.
+        """
+        if self._closed:
+            raise ValueError("mapping pool is closed")
+
+        entry = self._mappings.get(path)
+        if entry is None:
+            entry = [_map_file(path), 0]
+            self._mappings[path] = entry
+        else:
+            self._mappings.move_to_end(path)
+
+        entry[1] += 1
+        self._evict()
+        return entry[0]
+
+    def release(self, path: str) -> None:
+        """Gives back a mapping from :func:`MappingPool.acquire`."""
+        entry = self._mappings[path]
+        entry[1] -= 1
+
+        if self._closed and not entry[1]:
+            del self._mappings[path]
+            entry[0].close()
+        else:
+            self._evict()
+
+    def close(self) -> None:
+        """Closes idle mappings now, and mappings in use once released."""
+        self._closed = True
+        for path, (mapping, borrowers) in list(self._mappings.items()):
+            if not borrowers:
+                del self._mappings[path]
+                mapping.close()
+
+    def _evict(self) -> None:
+        excess = len(self._mappings) - self.size
+        if excess <= 0:
+            return
+
+        for path, (mapping, borrowers) in list(self._mappings.items()):
+            if excess <= 0:
+                break
+            if borrowers:
+                continue
+            del self._mappings[path]
+            mapping.close()
+            excess -= 1
+
+
+class FrameBuffer:
+    def __init__(
+        self,
+        path: str,
+        use_mmap: bool = True,
+        pool: Optional[MappingPool] = None,
+        advice: Optional[int] = None,
+    ):
+        """
+        Read-only ``memoryview`` of a whole frame, returned by
+        :func:`FileSequence.open_frame`. Memory-mapped frames are zero-copy: only the
+        pages actually read are loaded from disk.
+
+        Use as a context manager, which returns the view, or call
+        :func:`FrameBuffer.close` when done. Closing releases the view, so it
+        cannot be used afterwards.
+
+        :param path: file to open.
+        :param use_mmap: map the file. If ``False``, the file is read into memory.
+        :param pool: :class:`MappingPool` to take the mapping from. A mapping private
+            to this buffer is made by default.
+        :param advice: ``madvise`` constant to apply to the mapping, where supported.
+        """
+        self.path: str = path
+        self._pool: Optional[MappingPool] = pool if use_mmap else None
+        self._mapping: Optional[mmap.mmap] = None
+
+        if not use_mmap:
+            with open(path, "rb", buffering=0) as f:
+                self._view = memoryview(f.read())
+            return
+
+        if os.path.getsize(path) == 0:
+            # empty files cannot be mapped.
+            self._view = memoryview(b"")
+            self._pool = None
+            return
+
+        if self._pool is not None:
+            self._mapping = self._pool.acquire(path)
+        else:
+            self._mapping = _map_file(path)
+
+        self._view = memoryview(self._mapping)
+        self.advise(advice)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: '{self.path}'>"
+
+    def __enter__(self) -> memoryview:
+        return self.view
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def view(self) -> memoryview:
+        """read-only view of the frame's bytes"""
+        return self._view
+
+    def advise(self, advice: Optional[int]) -> None:
+        """Applies an ``madvise`` constant to the mapping, where supported."""
+        mapping = self._mapping
+        if advice is not None and mapping is not None and hasattr(mapping, "madvise"):
+            mapping.madvise(advice)
+
+    def close(self) -> None:
+        """Releases the view and closes or returns the mapping. Safe to call twice."""
+        mapping, self._mapping = self._mapping, None
+        self._view.release()
+
+        if mapping is None:
+            return
+        if self._pool is not None:
+            self._pool.release(self.path)
+        else:
+            mapping.close()
+
+
+def _map_file(path: str) -> mmap.mmap:
+    fd = os.open(path, _READ_FLAGS)
+    try:
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
@@ -0,0 +1,216 @@
+import re
+from bisect import bisect_right
+from itertools import chain
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+RangeType = Tuple[int, int]
+
+# '1001', '1001-1100', '-10--5'
+RANGE_PATTERN = re.compile(r"(-?\d+)(?:-(-?\d+))?")
+
+
+class FrameSet:
+    def __init__(self, ranges: Iterable[RangeType] = ()):
+        """
+        Set of frame numbers stored as sorted, non-overlapping inclusive ranges. Set
+        operations run over the ranges, so their cost depends on the number of ranges
+        rather than the number of frames.
+
+        :param ranges: ``(first, last)`` inclusive frame ranges, in any order. Ranges
+            may overlap or touch, they are merged.
+        """
+        self._ranges: Tuple[RangeType, ...] = _normalize(ranges)
+
+    @classmethod
+    def from_frames(cls, frames: Iterable[int]) -> "FrameSet":
+        """New :class:`FrameSet` of individual frame numbers."""
+        return cls((frame, frame) for frame in frames)
+
+    @classmethod
+    def from_str(cls, text: str) -> "FrameSet":
+        """
+        New :class:`FrameSet` from comma separated frames and ranges.
+        Ex: ``'1001-1100,1150,1200-1300'``
+        """
+        ranges = list()
+        for piece in text.split(","):
+            piece = piece.strip()
+            if not piece:
+                continue
+
+            result = RANGE_PATTERN.fullmatch(piece)
+            if result is None:
+                raise ValueError(f"could not parse frame range '{piece}'")
+
+            first, last = result.groups()
+            ranges.append((int(first), int(first if last is None else last)))
+        return cls(ranges)
+
+    @classmethod
+    def _from_normalized(cls, ranges: List[RangeType]) -> "FrameSet":
+        """Skips sorting and merging for ranges produced by set operations."""
+        new = cls.__new__(cls)
+        new._ranges = tuple(ranges)
+        return new
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self}')"
+
+    def __str__(self) -> str:
+        return ",".join(
+            str(first) if first == last else f"{first}-{last}"
+            for first, last in self._ranges
+        )
+
+    def __len__(self) -> int:
+        return sum(last - first + 1 for first, last in self._ranges)
+
+    def __bool__(self) -> bool:
+        return bool(self._ranges)
+
+    def __iter__(self) -> Iterator[int]:
+        return chain.from_iterable(
+            range(first, last + 1) for first, last in self._ranges
+        )
+
+    def __reversed__(self) -> Iterator[int]:
+        return chain.from_iterable(
+            range(last, first - 1, -1) for first, last in reversed(self._ranges)
+        )
+
+    def __contains__(self, frame: Any) -> bool:
+        index = bisect_right(self._ranges, (frame, float("inf"))) - 1
+        return index >= 0 and self._ranges[index][1] >= frame
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, FrameSet):
+            return NotImplemented
+        return self._ranges == other._ranges
+
+    def __hash__(self) -> int:
+        return hash(self._ranges)
+
+    def __or__(self, other: "FrameSet") -> "FrameSet":
+        return self.union(other)
+
+    def __and__(self, other: "FrameSet") -> "FrameSet":
+        return self.intersection(other)
+
+    def __sub__(self, other: "FrameSet") -> "FrameSet":
+        return self.difference(other)
+
+    def __xor__(self, other: "FrameSet") -> "FrameSet":
+        return self.symmetric_difference(other)
+
+    @property
+    def ranges(self) -> Tuple[RangeType, ...]:
+        """sorted, non-overlapping ``(first, last)`` inclusive ranges"""
+        return self._ranges
+
+    @property
+    def start(self) -> Optional[int]:
+        """lowest frame, ``None`` if empty"""
+        return self._ranges[0][0] if self._ranges else None
+
+    @property
+    def end(self) -> Optional[int]:
+        """highest frame, ``None`` if empty"""
+        return self._ranges[-1][1] if self._ranges else None
+
+    def union(self, other: "FrameSet") -> "FrameSet":
+        """frames in either set"""
+        merged = _merge_sorted(self._ranges, other._ranges)
+        return self._from_normalized(_coalesce(merged))
+
+    def intersection(self, other: "FrameSet") -> "FrameSet":
+        """frames in both sets"""
+        result: List[RangeType] = list()
+        ours, theirs = self._ranges, other._ranges
+        i = j = 0
+
+        while i < len(ours) and j < len(theirs):
+            first = max(ours[i][0], theirs[j][0])
+            last = min(ours[i][1], theirs[j][1])
+            if first <= last:
+                result.append((first, last))
+
+            # Advance whichever range finishes first, the other may still overlap the
+            #   next range.
+            if ours[i][1] < theirs[j][1]:
+                i += 1
+            else:
+                j += 1
+
+        return self._from_normalized(result)
+
+    def difference(self, other: "FrameSet") -> "FrameSet":
+        """frames in this set but not ``other``"""
+        result: List[RangeType] = list()
+        theirs = other._ranges
+        j = 0
+
+        for first, last in self._ranges:
+            # skip ranges of other that finish before this one starts.
+            while j < len(theirs) and theirs[j][1] < first:
+                j += 1
+
+            k = j
+            while k < len(theirs) and theirs[k][0] <= last:
+                cut_first, cut_last = theirs[k]
+                if cut_first > first:
+                    result.append((first, cut_first - 1))
+                first = cut_last + 1
+                if first > last:
+                    break
+                k += 1
+
+            if first <= last:
+                result.append((first, last))
+
+        return self._from_normalized(result)
+
+    def symmetric_difference(self, other: "FrameSet") -> "FrameSet":
+        """frames in exactly one of the sets"""
+        return self.difference(other).union(other.difference(self))
+
+
+def _normalize(ranges: Iterable[RangeType]) -> Tuple[RangeType, ...]:
+    """sorts and merges arbitrary inclusive ranges"""
+    cleaned = list()
+    for first, last in ranges:
+        if first > last:
+            raise ValueError(f"range start {first} is after end {last}")
+        cleaned.append((first, last))
+    cleaned.sort()
+    return tuple(_coalesce(cleaned))
+
+
+def _merge_sorted(
+    ours: Tuple[RangeType, ...], theirs: Tuple[RangeType, ...]
+) -> List[RangeType]:
+    """merges two sorted range lists into one sorted list, in linear time"""
+    result: List[RangeType] = list()
+    i = j = 0
+    while i < len(ours) and j < len(theirs):
+        if ours[i] <= theirs[j]:
+            result.append(ours[i])
+            i += 1
+        else:
+            result.append(theirs[j])
+            j += 1
+    result.extend(ours[i:])
+    result.extend(theirs[j:])
+    return result
+
+
+def _coalesce(ranges: List[RangeType]) -> List[RangeType]:
+    """joins overlapping or touching ranges of a sorted range list"""
+    result: List[RangeType] = list()
+    for first, last in ranges:
+        if result and first <= result[-1][1] + 1:
+            if last > result[-1][1]:
+                result[-1] = (result[-1][0], last)
+        else:
+            result.append((first, last))
+    return result
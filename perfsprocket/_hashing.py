@@ -0,0 +1,58 @@
+import hashlib
+from pathlib import Path
+from typing import IO, Union
+
+
+DEFAULT_ALGORITHM = "blake2b"
+
+# Large reads keep syscall counts low on network filesystems.
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def hash_file(
+    path: Union[str, Path],
+    algorithm: str = DEFAULT_ALGORITHM,
+    block_size: int = HASH_BLOCK_SIZE,
+) -> str:
+    """
+    Returns hex digest of a file's contents.
+
+    :param path: file to hash.
+    :param algorithm: any algorithm name accepted by ``hashlib.new``.
+    :param block_size: bytes read per call. A single buffer is reused for all reads.
+    """
+    digest = hashlib.new(algorithm)
+    buffer = bytearray(block_size)
+    view = memoryview(buffer)
+
+    with open(str(path), "rb", buffering=0) as f:
+        while True:
+            read = f.readinto(buffer)  # type: ignore
+            if not read:
+                break
+            digest.update(view[:read])
+
+    return digest.hexdigest()
+
+
+def hash_stream(
+    source: IO[bytes],
+    algorithm: str = DEFAULT_ALGORITHM,
+    block_size: int = HASH_BLOCK_SIZE,
+) -> str:
+    """
+    Returns hex digest of everything left to read from a binary file object, like a
+    file opened with :func:`Storage.open`.
+
+    :param source: file object to hash.
+    :param algorithm: any algorithm name accepted by ``hashlib.new``.
+    :param block_size: bytes read per call.
+    """
+    digest = hashlib.new(algorithm)
+    while True:
+        block = source.read(block_size)
+        if not block:
+            break
+        digest.update(block)
+
+    return digest.hexdigest()
@@ -0,0 +1,349 @@
+import errno
+import io
+import itertools
+import os
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import IO, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from ._storage import Storage
+
+# Permission bits an owner needs on a folder to add, remove or rename its entries.
+_FOLDER_WRITE = stat.S_IWUSR | stat.S_IXUSR
+
+
+class _Entry:
+    """contents and metadata of one in-memory file"""
+
+    __slots__ = ("data", "mode", "mtime_ns", "ino")
+
+    def __init__(self, data: bytes, mode: int, mtime_ns: int, ino: int):
+        self.data: bytes = data
+        self.mode: int = mode
+        self.mtime_ns: int = mtime_ns
+        self.ino: int = ino
+
+
+class _Folder:
+    """entries of one in-memory folder, by name"""
+
+    __slots__ = ("children", "mode", "mtime_ns", "ino", "device")
+
+    def __init__(self, mode: int, mtime_ns: int, ino: int, device: int):
+        self.children: Dict[str, Union[_Entry, "_Folder"]] = dict()
+        self.mode: int = mode
+        self.mtime_ns: int = mtime_ns
+        self.ino: int = ino
+        self.device: int = device
+
+
+def _error(kind: Type[OSError], code: int, path: Union[str, Path]) -> OSError:
+    return kind(code, os.strerror(code), str(path))
+
+
+class _MemoryWriter(io.BytesIO):
+    """buffers writes, storing them in the storage on close"""
+
+    def __init__(self, storage: "MemoryStorage", path: Union[str, Path]):
+        super().__init__()
+        self._storage = storage
+        self._path = path
+
+    def close(self) -> None:
+        if not self.closed:
+            self._storage._store(self._path, self.getvalue(), None)
+        super().close()
+
+
+class MemoryStorage(Storage):
+    def __init__(self, mode: int = 0o644, folder_mode: int = 0o755):
+        """
+        A filesystem held in memory, for tests and benchmarks of operations on many
+        files without touching disk. Safe to use from many threads.
+
+        Files live in a tree of folders, and operations fail the way they would on
+        disk, raising the same ``OSError`` subclasses as the ``os`` module:
+
+        - paths in folders that do not exist raise ``FileNotFoundError``.
+        - renames between devices, see :func:`MemoryStorage.mount`, raise ``OSError``
+          with ``errno.EXDEV``.
+        - permission bits are checked as for the owner of every file: adding,
+          removing or renaming entries needs write and execute permission on the
+          folder, reading a file needs read permission, replacing one needs write
+          permission. Failures raise ``PermissionError``.
+
+        Folders are looked up by path string in a dict, so operations cost the same
+        however deep or large a folder is.
+
+        :param mode: permission bits of new files.
+        :param folder_mode: permission bits of new folders.
+        """
+        self.mode: int = mode
+        self.folder_mode: int = folder_mode
+        self._folders: Dict[str, _Folder] = dict()
+        self._files = 0
+        self._inodes = itertools.count(1)
+        self._devices = itertools.count(1)
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self._files} files>"
+
+    def __len__(self) -> int:
+        """number of files stored"""
+        return self._files
+
+    def mkdir(
+        self,
+        path: Union[str, Path],
+        parents: bool = False,
+        exist_ok: bool = False,
+        mode: Optional[int] = None,
+    ) -> None:
+        """Creates a folder, with the same arguments as ``Path.mkdir``."""
+        key = str(Path(path))
+        head, name = os.path.split(key)
+        with self._lock:
+            if not name:
+                self._folder(key)
+                return
+            if key in self._folders:
+                if not exist_ok:
+                    raise _error(FileExistsError, errno.EEXIST, key)
+                return
+
+            if parents and head not in self._folders:
+                self.mkdir(head, parents=True, exist_ok=True)
+            parent = self._folder(head)
+            if name in parent.children:
+                raise _error(FileExistsError, errno.EEXIST, key)
+            self._check_folder_write(parent, key)
+
+            folder = _Folder(
+                self.folder_mode if mode is None else mode,
+                _now_ns(),
+                next(self._inodes),
+                parent.device,
+            )
+            parent.children[name] = folder
+            self._folders[key] = folder
+
+    def mount(self, path: Union[str, Path]) -> int:
+        """
+        Makes the empty folder at ``path`` the root of a new device, creating it and
+        its parents if needed. Files cannot be renamed between devices, just as
+        between filesystems on disk.
+
+        :return: device number of the folder.
+
+        :raises ValueError: if the folder is not empty.
+        """
+        key = str(Path(path))
+        with self._lock:
+            self.mkdir(key, parents=True, exist_ok=True)
+            folder = self._folders[key]
+            if folder.children:
+                raise ValueError(f"cannot mount non-empty folder '{key}'")
+            folder.device = next(self._devices)
+            return folder.device
+
+    def write_bytes(
+        self, path: Union[str, Path], data: bytes, mode: Optional[int] = None
+    ) -> None:
+        """
+        Creates or replaces the file at ``path``, holding ``data``. Missing folders are
+        created, so fixtures can be set up in one call per file.
+        """
+        with self._lock:
+            self.mkdir(os.path.dirname(str(path)), parents=True, exist_ok=True)
+            self._store(path, bytes(data), mode)
+
+    def create_files(
+        self, paths: Iterable[Union[str, Path]], data: bytes = b""
+    ) -> None:
+        """
+        Creates a file holding ``data`` at each path, creating missing folders. The
+        fastest way to set up large fixtures: files of each folder share one lookup
+        and one copy of ``data``.
+        """
+        data = bytes(data)
+        now = _now_ns()
+        with self._lock:
+            folder: Optional[_Folder] = None
+            parent: Optional[str] = None
+            for path in paths:
+                head, name = os.path.split(str(path))
+                if head != parent:
+                    parent = head
+                    self.mkdir(head, parents=True, exist_ok=True)
+                    folder = self._folders.get(head) or self._folder(head)
+
+                assert folder is not None
+                if self._replaced(folder, name, path) is None:
+                    self._files += 1
+                folder.children[name] = _Entry(data, self.mode, now, next(self._inodes))
+
+    def read_bytes(self, path: Union[str, Path]) -> bytes:
+        """Contents of the file at ``path``."""
+        entry = self._file(*self._locate(path), path)
+        if not entry.mode & stat.S_IRUSR:
+            raise _error(PermissionError, errno.EACCES, path)
+        return entry.data
+
+    def _folder(self, key: str) -> _Folder:
+        """folder at ``key``, created on first use if it is the root of a drive"""
+        folder = self._folders.get(key)
+        if folder is None:
+            if os.path.split(key)[1]:
+                raise _error(FileNotFoundError, errno.ENOENT, key)
+            folder = _Folder(self.folder_mode, 0, next(self._inodes), 0)
+            self._folders[key] = folder
+        return folder
+
+    def _locate(self, path: Union[str, Path]) -> Tuple[_Folder, str]:
+        """folder holding ``path``, and the name of ``path`` within it"""
+        head, name = os.path.split(str(path))
+        return self._folder(head), name
+
+    @staticmethod
+    def _file(folder: _Folder, name: str, path: Union[str, Path]) -> _Entry:
+        entry = folder.children.get(name)
+        if entry is None:
+            raise _error(FileNotFoundError, errno.ENOENT, path)
+        if isinstance(entry, _Folder):
+            raise _error(IsADirectoryError, errno.EISDIR, path)
+        return entry
+
+    @staticmethod
+    def _check_folder_write(folder: _Folder, path: Union[str, Path]) -> None:
+        """raises if entries cannot be added to or removed in the folder of ``path``"""
+        if folder.mode & _FOLDER_WRITE != _FOLDER_WRITE:
+            raise _error(PermissionError, errno.EACCES, os.path.dirname(str(path)))
+
+    @staticmethod
+    def _replaced(
+        folder: _Folder, name: str, path: Union[str, Path]
+    ) -> Optional[_Entry]:
+        """existing file that a new one at ``path`` would replace"""
+        existing = folder.children.get(name)
+        if isinstance(existing, _Folder):
+            raise _error(IsADirectoryError, errno.EISDIR, path)
+        return existing
+
+    def _check_writable(
+        self, folder: _Folder, name: str, path: Union[str, Path]
+    ) -> Optional[_Entry]:
+        """file at ``path`` to be replaced, after checking it can be written"""
+        entry = self._replaced(folder, name, path)
+        if entry is None:
+            self._check_folder_write(folder, path)
+        elif not entry.mode & stat.S_IWUSR:
+            raise _error(PermissionError, errno.EACCES, path)
+        return entry
+
+    def _store(self, path: Union[str, Path], data: bytes, mode: Optional[int]) -> None:
+        with self._lock:
+            folder, name = self._locate(path)
+            entry = self._check_writable(folder, name, path)
+            if entry is None:
+                entry = _Entry(b"", self.mode, 0, next(self._inodes))
+                folder.children[name] = entry
+                self._files += 1
+
+            entry.data = data
+            entry.mtime_ns = _now_ns()
+            if mode is not None:
+                entry.mode = stat.S_IMODE(mode)
+
+    def stat(self, path: Path) -> os.stat_result:
+        found = self._folders.get(str(path))
+        if found is not None:
+            mode = stat.S_IFDIR | found.mode
+            return _stat_result(mode, found.ino, found.device, 0, found.mtime_ns)
+
+        folder, name = self._locate(path)
+        entry = self._file(folder, name, path)
+        mode = stat.S_IFREG | entry.mode
+        return _stat_result(
+            mode, entry.ino, folder.device, len(entry.data), entry.mtime_ns
+        )
+
+    def list_names(self, folder: Path) -> List[str]:
+        with self._lock:
+            return list(self._folder(str(folder)).children)
+
+    def rename(self, src: Path, dst: Path) -> None:
+        with self._lock:
+            src_folder, src_name = self._locate(src)
+            dst_folder, dst_name = self._locate(dst)
+            entry = self._file(src_folder, src_name, src)
+
+            if src_folder.device != dst_folder.device:
+                raise _error(OSError, errno.EXDEV, src)
+            self._check_folder_write(src_folder, src)
+            self._check_folder_write(dst_folder, dst)
+            if src_folder is dst_folder and src_name == dst_name:
+                return
+            if self._replaced(dst_folder, dst_name, dst) is not None:
+                self._files -= 1
+
+            del src_folder.children[src_name]
+            dst_folder.children[dst_name] = entry
+
+    def copy(self, src: Path, dst: Path) -> None:
+        with self._lock:
+            entry = self._file(*self._locate(src), src)
+            self._store(dst, self.read_bytes(src), entry.mode)
+
+    def delete(self, path: Path) -> None:
+        with self._lock:
+            folder, name = self._locate(path)
+            self._file(folder, name, path)
+            self._check_folder_write(folder, path)
+            del folder.children[name]
+            self._files -= 1
+
+    def chmod(self, path: Path, mode: int) -> None:
+        with self._lock:
+            found = self._folders.get(str(path)) or self._file(
+                *self._locate(path), path
+            )
+            found.mode = stat.S_IMODE(mode)
+
+    def utime(self, path: Path, ns: Tuple[int, int]) -> None:
+        with self._lock:
+            found = self._folders.get(str(path)) or self._file(
+                *self._locate(path), path
+            )
+            found.mtime_ns = ns[1]
+
+    def makedirs(self, folder: Path) -> None:
+        self.mkdir(folder, parents=True, exist_ok=True)
+
+    def open(self, path: Path, mode: str = "rb") -> IO[bytes]:
+        if mode == "rb":
+            return io.BytesIO(self.read_bytes(path))
+        if mode != "wb":
+            raise ValueError(f"mode must be 'rb' or 'wb', got {mode!r}")
+
+        # fails now, not on close, if the file cannot be written.
+        with self._lock:
+            self._check_writable(*self._locate(path), path)
+        return _MemoryWriter(self, path)
+
+
+def _now_ns() -> int:
+    # time.time_ns is only available from python 3.7.
+    return int(time.time() * 1e9)
+
+
+def _stat_result(
+    mode: int, ino: int, device: int, size: int, mtime_ns: int
+) -> os.stat_result:
+    mtime = mtime_ns / 1e9
+    times = dict.fromkeys(("st_atime_ns", "st_mtime_ns", "st_ctime_ns"), mtime_ns)
+    return os.stat_result(
+        (mode, ino, device, 1, 0, 0, size, mtime, mtime, mtime), times
+    )
@@ -0,0 +1,201 @@
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Pattern, Tuple
+
+
+# Named groups a convention may define. 'base', 'sep' and 'start' are required.
+FIELDS = ("base", "sep", "open", "start", "end", "close", "extension", "tail")
+REQUIRED_FIELDS = ("base", "sep", "start")
+
+# Group numbers shift once conventions are combined into one regex, so patterns may
+#   only refer back to groups by name. Matches '\1' or '(?(1)' not itself escaped.
+NUMBERED_REFERENCE = re.compile(r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?\(\d)")
+
+
+DEFAULT_CONVENTIONS: List[Tuple[str, str]] = [
+    # 'file.0100.exr', 'file.####.exr', 'file_[0100-0200].exr'
+    (
+        "default",
+        r"(?P<base>.+)"
+        r"(?P<sep>[._])"
+        r"(?P<open>[\[{<(])?"
+        r"(?P<start>\d+|#+)"
+        r"(-(?P<end>\d*|#*))?"
+        r"(?P<close>[\]}>)])?"
+        r"(?P<extension>\..+)?",
+    ),
+    # 'file.-0005.exr', 'file.[-0010-0010].exr'
+    (
+        "negative",
+        r"(?P<base>.+)"
+        r"(?P<sep>[._])"
+        r"(?P<open>[\[{<(])?"
+        r"(?P<start>-\d+)"
+        r"(-(?P<end>-?\d+))?"
+        r"(?P<close>[\]}>)])?"
+        r"(?P<extension>\..+)?",
+    ),
+    # 'file.%04d.exr', 'file_%d.exr'
+    (
+        "printf",
+        r"(?P<base>.+)(?P<sep>[._])(?P<start>%0?\d*d)(?P<extension>\..+)?",
+    ),
+    # 'file.@@@@.exr'
+    ("at", r"(?P<base>.+)(?P<sep>[._])(?P<start>@+)(?P<extension>\..+)?"),
+    # 'file_0100_v001.exr', 'file_[0100-0200]_v001.exr', frame number followed by more
+    #   name, kept as the 'tail', before the extension.
+    (
+        "mid_name",
+        r"(?P<base>.+)"
+        r"(?P<sep>[._])"
+        r"(?P<open>[\[{<(])?"
+        r"(?P<start>\d+|#+)"
+        r"(-(?P<end>\d*|#*))?"
+        r"(?P<close>[\]}>)])?"
+        r"(?P<tail>_[^.]+)"
+        r"(?P<extension>\..+)?",
+    ),
+]
+
+
+class PatternMatch(NamedTuple):
+    """Result of :func:`NamePatterns.match`"""
+
+    convention: str
+    groups: Dict[str, Optional[str]]
+
+
+class NamePatterns:
+    def __init__(self, conventions: Optional[Iterable[Tuple[str, str]]] = None) -> None:
+        """
+        Registry of file sequence naming conventions. All conventions are compiled into
+        a single combined regex, so a name is matched against every convention in one
+        pass. Conventions are tried in registration order, the first to match wins.
+
+        :param conventions: ``(name, pattern)`` pairs to register. Defaults to the
+            built in conventions.
+        """
+        self._conventions: List[Tuple[str, str]] = list()
+        self._compiled: Optional[Pattern] = None
+        self._group_names: Dict[str, Tuple[str, Tuple[Optional[str], ...]]] = dict()
+
+        if conventions is None:
+            # The built in conventions are known to be valid, so nothing is compiled
+            #   until the first match.
+            self._conventions = list(DEFAULT_CONVENTIONS)
+            return
+
+        for name, pattern in conventions:
+            self.register(name, pattern)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self.conventions}>"
+
+    @property
+    def conventions(self) -> List[str]:
+        """Names of registered conventions in match order."""
+        return [name for name, _ in self._conventions]
+
+    def items(self) -> List[Tuple[str, str]]:
+        """``(name, pattern)`` pairs of registered conventions in match order."""
+        return list(self._conventions)
+
+    def register(self, name: str, pattern: str, index: Optional[int] = None) -> None:
+        """
+        Add a naming convention.
+
+        :param name: name reported by :func:`NamePatterns.match` for this convention.
+        :param pattern: regex matching a whole file name. Must define the named groups
+            ``base``, ``sep`` and ``start``, and may define ``open``, ``end``,
+            ``close``, ``tail`` and ``extension``. Groups can only be referred back
+            to by name, EX: ``(?P=sep)``.
+        :param index: position in the match order. Appended to the end by default.
+
+        :raises ValueError: if ``name`` is already registered, or ``pattern`` is
+            missing a required group or refers back to a group by number.
+        """
+        if name in self.conventions:
+            raise ValueError(f"naming convention '{name}' already registered")
+        if NUMBERED_REFERENCE.search(pattern):
+            raise ValueError(
+                f"pattern for '{name}' refers to a group by number, use a named group "
+                f"and '(?P=name)' instead"
+            )
+
+        group_names = set(re.compile(pattern).groupindex)
+        missing = [field for field in REQUIRED_FIELDS if field not in group_names]
+        if missing:
+            raise ValueError(f"pattern for '{name}' missing groups: {missing}")
+
+        if index is None:
+            index = len(self._conventions)
+        self._conventions.insert(index, (name, pattern))
+        self._compiled = None
+
+    def unregister(self, name: str) -> None:
+        """
+        Remove a naming convention.
+
+        :raises KeyError: if ``name`` is not registered.
+        """
+        for i, (registered, _) in enumerate(self._conventions):
+            if registered == name:
+                del self._conventions[i]
+                self._compiled = None
+                return
+        raise KeyError(name)
+
+    def match(self, file_name: str) -> Optional[PatternMatch]:
+        """
+        Matches ``file_name`` against all conventions at once.
+
+        :return: name of the matching convention and the value of each named group
+            (see :func:`NamePatterns.register`), ``None`` for groups the convention
+            does not define. ``None`` if no convention matches.
+        """
+        if not self._conventions:
+            return None
+
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compile()
+
+        result = compiled.fullmatch(file_name)
+        if result is None:
+            return None
+
+        convention, group_names = self._group_names[result.lastgroup]  # type: ignore
+        groups = {
+            field: (None if group is None else result.group(group))
+            for field, group in zip(FIELDS, group_names)
+        }
+        return PatternMatch(convention, groups)
+
+    def _compile(self) -> Pattern:
+        """Combines conventions into one regex of alternatives."""
+        alternatives = list()
+        group_names = dict()
+
+        for i, (name, pattern) in enumerate(self._conventions):
+            prefix = f"_{i}_"
+            pattern = re.sub(r"\(\?P<(\w+)>", rf"(?P<{prefix}\1>", pattern)
+            pattern = re.sub(r"\(\?P=(\w+)\)", rf"(?P={prefix}\1)", pattern)
+
+            # The wrapping group closes last, so it is reported as the 'lastgroup' of
+            #   a match and tells us which convention matched.
+            wrapper = f"_{i}"
+            alternatives.append(f"(?P<{wrapper}>{pattern})")
+
+            defined = re.compile(pattern).groupindex
+            fields = tuple(
+                f"{prefix}{field}" if f"{prefix}{field}" in defined else None
+                for field in FIELDS
+            )
+            group_names[wrapper] = (name, fields)
+
+        self._group_names = group_names
+        self._compiled = re.compile("|".join(alternatives))
+        return self._compiled
+
+
+SEQ_PATTERNS = NamePatterns()
+"""Default registry used by :func:`SeqName.from_path`"""
@@ -0,0 +1,435 @@
+import errno
+import io
+import os
+import queue
+import stat
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from ._storage import PairsType, Storage
+
+
+ItemType = TypeVar("ItemType")
+ResultType = TypeVar("ResultType")
+
+# Most keys a single DeleteObjects request accepts.
+DELETE_BATCH = 1000
+
+# Error codes of S3 compatible stores, by the OSError they are raised as.
+_MISSING = {"404", "NoSuchKey", "NotFound"}
+_DENIED = {"403", "AccessDenied", "Forbidden"}
+
+
+class _ClientPool:
+    """clients of the store, created on demand and reused across operations"""
+
+    def __init__(self, factory: Callable[[], Any], size: int):
+        self._factory = factory
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    @contextmanager
+    def client(self) -> Iterator[Any]:
+        with self._slots:
+            try:
+                client = self._idle.get_nowait()
+            except queue.Empty:
+                client = self._factory()
+            try:
+                yield client
+            finally:
+                self._idle.put(client)
+
+
+class _ObjectWriter(io.RawIOBase):
+    """
+    buffers writes into parts, uploading each full part as it fills. Small objects are
+    stored with a single request on close.
+    """
+
+    def __init__(self, storage: "ObjectStorage", path: Path):
+        super().__init__()
+        self._storage = storage
+        self._key = storage.key_of(path)
+        self._path = path
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts: List[Dict[str, Any]] = list()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._storage.part_size:
+            self._upload_part(self._storage.part_size)
+        return len(data)
+
+    def _upload_part(self, size: int) -> None:
+        part = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        bucket = self._storage.bucket
+
+        with self._storage.client() as client, _os_errors(self._path):
+            if self._upload_id is None:
+                response = client.create_multipart_upload(Bucket=bucket, Key=self._key)
+                self._upload_id = response["UploadId"]
+            number = len(self._parts) + 1
+            response = client.upload_part(
+                Bucket=bucket,
+                Key=self._key,
+                UploadId=self._upload_id,
+                PartNumber=number,
+                Body=part,
+            )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": number})
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._finish()
+        finally:
+            super().close()
+
+    def _finish(self) -> None:
+        bucket = self._storage.bucket
+        if self._upload_id is None:
+            with self._storage.client() as client, _os_errors(self._path):
+                client.put_object(
+                    Bucket=bucket, Key=self._key, Body=bytes(self._buffer)
+                )
+            return
+
+        if self._buffer:
+            self._upload_part(len(self._buffer))
+        with self._storage.client() as client, _os_errors(self._path):
+            client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=self._key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": self._parts},
+            )
+
+
+class ObjectStorage(Storage):
+    def __init__(
+        self,
+        client_factory: Callable[[], Any],
+        bucket: str,
+        workers: int = 8,
+        multipart_threshold: int = 64 * 1024 * 1024,
+        part_size: int = 64 * 1024 * 1024,
+    ):
+        """
+        Files held as objects of an S3 compatible store, like a local MinIO server
+        standing in for a cloud bucket. Paths are keys with the leading slash removed,
+        and folders are key prefixes ending in ``/``.
+
+        Requests go through a pool of clients, one per worker at most, which are
+        reused across operations so their connections stay open. Operations batch
+        natively:
+
+        - stats of many paths list each folder once, 1000 keys per request.
+        - copies run ``workers`` at a time, server side. Objects of at least
+          ``multipart_threshold`` bytes are copied in parts of ``part_size`` bytes,
+          which is required for objects over 5GiB.
+        - deletes remove up to 1000 objects per request.
+        - renames are batches of copies followed by one delete request.
+        - files opened for writing upload in parts once they reach ``part_size``
+          bytes, so memory use is bounded.
+
+        Objects have no permission bits, so :func:`FileBase.chmod` is not supported.
+        Their modification time is when they were last written, so
+        :func:`Storage.utime` raises ``OSError`` with ``errno.ENOTSUP``.
+
+        :param client_factory: called with no arguments to create a client, EX:
+            ``lambda: boto3.client("s3", endpoint_url="http://localhost:9000")``.
+        :param bucket: bucket holding the files.
+        :param workers: requests sent at once, and the most clients created.
+        :param multipart_threshold: size in bytes from which copies use multipart
+            transfers.
+        :param part_size: bytes per part of multipart transfers. Most stores require
+            at least 5MiB.
+        """
+        if workers < 1 or part_size < 1:
+            raise ValueError("workers and part_size must be positive")
+
+        self.bucket: str = bucket
+        self.workers: int = workers
+        self.multipart_threshold: int = multipart_threshold
+        self.part_size: int = part_size
+        self._pool = _ClientPool(client_factory, workers)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(bucket={self.bucket!r}, workers={self.workers})"
+
+    @staticmethod
+    def key_of(path: Path) -> str:
+        """object key of ``path``"""
+        return PurePosixPath(path).as_posix().lstrip("/")
+
+    def client(self) -> Any:
+        """Context manager lending a client from the pool."""
+        return self._pool.client()
+
+    def stat(self, path: Path) -> os.stat_result:
+        with self.client() as client, _os_errors(path):
+            response = client.head_object(Bucket=self.bucket, Key=self.key_of(path))
+        return _object_stat(response["ContentLength"], response.get("LastModified"))
+
+    def list_names(self, folder: Path) -> List[str]:
+        return list(self._list_folder(folder))
+
+    def _list_folder(self, folder: Path) -> Dict[str, os.stat_result]:
+        """stat results of files in ``folder``, and placeholders for sub-folders"""
+        prefix = self.key_of(folder).rstrip("/")
+        prefix = prefix + "/" if prefix else ""
+        offset = len(prefix)
+        found: Dict[str, os.stat_result] = dict()
+        kwargs = {"Bucket": self.bucket, "Prefix": prefix, "Delimiter": "/"}
+
+        with self.client() as client, _os_errors(folder):
+            while True:
+                response = client.list_objects_v2(**kwargs)
+                for content in response.get("Contents", ()):
+                    name = content["Key"][offset:]
+                    found[name] = _object_stat(
+                        content["Size"], content.get("LastModified")
+                    )
+                for common in response.get("CommonPrefixes", ()):
+                    name = common["Prefix"][offset:].rstrip("/")
+                    found[name] = _folder_stat()
+                if not response.get("IsTruncated"):
+                    return found
+                kwargs["ContinuationToken"] = response["NextContinuationToken"]
+
+    def stat_folder(
+        self, folder: Path, keep: Callable[[str], bool]
+    ) -> Dict[str, os.stat_result]:
+        listing = self._list_folder(folder)
+        return {name: found for name, found in listing.items() if keep(name)}
+
+    def stat_paths(self, paths: Iterable[Path]) -> Dict[Path, os.stat_result]:
+        by_folder: Dict[Path, Dict[str, Path]] = dict()
+        for path in paths:
+            by_folder.setdefault(path.parent, dict())[path.name] = path
+
+        stats = dict()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            listings = executor.map(self._list_folder, by_folder)
+            for names, listing in zip(by_folder.values(), listings):
+                for name, path in names.items():
+                    if name in listing and stat.S_ISREG(listing[name].st_mode):
+                        stats[path] = listing[name]
+        return stats
+
+    def rename(self, src: Path, dst: Path) -> None:
+        for _ in self.rename_pairs([(src, dst)]):
+            pass
+
+    def copy(self, src: Path, dst: Path) -> None:
+        for _ in self.copy_pairs([(src, dst)]):
+            pass
+
+    def delete(self, path: Path) -> None:
+        for _ in self.delete_paths([path]):
+            pass
+
+    def utime(self, path: Path, ns: Tuple[int, int]) -> None:
+        raise OSError(
+            errno.ENOTSUP, "objects keep the time they were last written", str(path)
+        )
+
+    def open(self, path: Path, mode: str = "rb") -> IO[bytes]:
+        if mode == "wb":
+            return _ObjectWriter(self, path)  # type: ignore
+        if mode != "rb":
+            raise ValueError(f"mode must be 'rb' or 'wb', got {mode!r}")
+
+        with self.client() as client, _os_errors(path):
+            response = client.get_object(Bucket=self.bucket, Key=self.key_of(path))
+        return response["Body"]  # type: ignore
+
+    def copy_pairs(self, pairs: PairsType) -> Generator[Path, None, None]:
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for src, dst in _ordered(executor, self._copy_pair, pairs, self.workers):
+                yield dst
+
+    def _copy_pair(self, pair: Tuple[Path, Path]) -> Tuple[Path, Path]:
+        src, dst = pair
+        source = {"Bucket": self.bucket, "Key": self.key_of(src)}
+        key = self.key_of(dst)
+
+        with self.client() as client, _os_errors(src):
+            size = client.head_object(**source)["ContentLength"]
+            if size < self.multipart_threshold:
+                client.copy_object(Bucket=self.bucket, Key=key, CopySource=source)
+            else:
+                self._copy_parts(client, source, key, size)
+        return pair
+
+    def _copy_parts(
+        self, client: Any, source: Dict[str, str], key: str, size: int
+    ) -> None:
+        upload = client.create_multipart_upload(Bucket=self.bucket, Key=key)
+        upload_id = upload["UploadId"]
+        parts = list()
+
+        try:
+            for number, offset in enumerate(range(0, size, self.part_size), 1):
+                last = min(offset + self.part_size, size) - 1
+                response = client.upload_part_copy(
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=number,
+                    CopySource=source,
+                    CopySourceRange=f"bytes={offset}-{last}",
+                )
+                etag = response["CopyPartResult"]["ETag"]
+                parts.append({"ETag": etag, "PartNumber": number})
+
+            client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            client.abort_multipart_upload(
+                Bucket=self.bucket, Key=key, UploadId=upload_id
+            )
+            raise
+
+    def rename_pairs(
+        self, pairs: PairsType
+    ) -> Generator[Tuple[Path, Path], None, None]:
+        for batch in _independent_batches(pairs, DELETE_BATCH):
+            # sources are only deleted once every copy of the batch has landed.
+            list(self.copy_pairs(pair for pair in batch if pair[0] != pair[1]))
+            list(self.delete_paths(src for src, dst in batch if src != dst))
+            yield from batch
+
+    def delete_paths(self, paths: Iterable[Path]) -> Generator[Path, None, None]:
+        for batch in _batches(paths, DELETE_BATCH):
+            objects = [{"Key": self.key_of(path)} for path in batch]
+            with self.client() as client, _os_errors(batch[0]):
+                response = client.delete_objects(
+                    Bucket=self.bucket, Delete={"Objects": objects, "Quiet": True}
+                )
+
+            errors = response.get("Errors")
+            if errors:
+                error = errors[0]
+                raise _error_for(error.get("Code"), error.get("Key"), error)
+            yield from batch
+
+
+def _object_stat(size: int, modified: Any) -> os.stat_result:
+    mtime = modified.timestamp() if modified is not None else 0.0
+    # last modified times are whole microseconds at most.
+    mtime_ns = round(mtime * 1e6) * 1000
+    times = dict.fromkeys(("st_atime_ns", "st_mtime_ns", "st_ctime_ns"), mtime_ns)
+    return os.stat_result(
+        (stat.S_IFREG | 0o644, 0, 0, 1, 0, 0, size, mtime, mtime, mtime), times
+    )
+
+
+def _folder_stat() -> os.stat_result:
+    return os.stat_result((stat.S_IFDIR | 0o755, 0, 0, 1, 0, 0, 0, 0, 0, 0))
+
+
+def _error_for(code: Optional[str], path: Any, error: Any) -> Exception:
+    if code in _MISSING:
+        return FileNotFoundError(errno.ENOENT, "No such object", str(path))
+    if code in _DENIED:
+        return PermissionError(errno.EACCES, "Access denied", str(path))
+    return OSError(errno.EIO, f"object store error: {error}", str(path))
+
+
+@contextmanager
+def _os_errors(path: Any) -> Iterator[None]:
+    """raises client errors carrying an S3 error code as ``OSError``"""
+    try:
+        yield
+    except Exception as error:
+        response = getattr(error, "response", None)
+        if not isinstance(response, dict) or "Error" not in response:
+            raise
+        code = response["Error"].get("Code")
+        raise _error_for(code, path, error) from error
+
+
+def _batches(items: Iterable[ItemType], size: int) -> Iterator[List[ItemType]]:
+    batch: List[ItemType] = list()
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = list()
+    if batch:
+        yield batch
+
+
+def _independent_batches(
+    pairs: PairsType, size: int
+) -> Iterator[List[Tuple[Path, Path]]]:
+    """
+    Splits ``pairs`` into batches whose pairs can be copied in parallel.
+
+    A batch ends before the first pair that reads a destination or writes a source
+    of the batch, so chained renames run one link at a time in the caller's order.
+    """
+    batch: List[Tuple[Path, Path]] = list()
+    sources: Set[Path] = set()
+    destinations: Set[Path] = set()
+    for src, dst in pairs:
+        if len(batch) == size or src in destinations or dst in sources:
+            yield batch
+            batch = list()
+            sources.clear()
+            destinations.clear()
+        batch.append((src, dst))
+        sources.add(src)
+        destinations.add(dst)
+    if batch:
+        yield batch
+
+
+def _ordered(
+    executor: ThreadPoolExecutor,
+    func: Callable[[ItemType], ResultType],
+    items: Iterable[ItemType],
+    window: int,
+) -> Generator[ResultType, None, None]:
+    """results of ``func`` in order of ``items``, keeping ``window`` calls in flight"""
+    pending: Deque[Future] = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,315 @@
+import itertools
+import threading
+from concurrent.futures import CancelledError, TimeoutError
+from typing import Any, Iterator, List, Optional, Set
+
+
+QUEUED = "queued"
+RUNNING = "running"
+PAUSED = "paused"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+STATES = (QUEUED, RUNNING, PAUSED, DONE, FAILED, CANCELLED)
+
+# States an operation never leaves.
+FINISHED = (DONE, FAILED, CANCELLED)
+
+
+class Operation:
+    def __init__(self, pool: "WorkerPool", steps: Iterator[Any], priority: int):
+        """
+        Handle of an operation running on a :class:`WorkerPool`, made by
+        :func:`WorkerPool.submit`. The pool advances the operation one frame at a
+        time, and pause, cancel and priority changes take effect between frames.
+
+        Safe to use from any thread.
+        """
+        self._pool = pool
+        self._steps = steps
+        self._priority = priority
+        self._state = QUEUED
+        self._order = 0
+        self._pause_requested = False
+        self._cancel_requested = False
+        self._completed = 0
+        self._last: Any = None
+        self._error: Optional[BaseException] = None
+        self._finished = threading.Event()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__}: {self._state}, priority={self._priority}, "
+            f"{self._completed} steps>"
+        )
+
+    @property
+    def state(self) -> str:
+        """
+        ``'queued'``, ``'running'``, ``'paused'``, ``'done'``, ``'failed'`` or
+        ``'cancelled'``. A running operation asked to pause or cancel stays
+        ``'running'`` until its current frame is done.
+        """
+        return self._state
+
+    @property
+    def completed(self) -> int:
+        """number of items yielded by the operation so far"""
+        return self._completed
+
+    @property
+    def priority(self) -> int:
+        """
+        Operations with a higher priority run first. Settable: a new priority is used
+        from the next frame on.
+        """
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority: int) -> None:
+        with self._pool._condition:
+            self._priority = priority
+            self._pool._condition.notify()
+
+    def pause(self) -> bool:
+        """
+        Stops the operation after its current frame, until :func:`Operation.resume`.
+        Workers it would have used run other operations meanwhile.
+
+        :return: ``False`` if the operation had already finished or been cancelled.
+        """
+        with self._pool._condition:
+            if self._state in FINISHED or self._cancel_requested:
+                return False
+            if self._state == QUEUED:
+                self._pool._ready.remove(self)
+                self._state = PAUSED
+            elif self._state == RUNNING:
+                self._pause_requested = True
+            return True
+
+    def resume(self) -> bool:
+        """
+        Queues a paused operation to run again.
+
+        :return: ``False`` if the operation had already finished or been cancelled.
+        """
+        with self._pool._condition:
+            if self._state in FINISHED or self._cancel_requested:
+                return False
+            self._pause_requested = False
+            if self._state == PAUSED:
+                self._pool._queue(self)
+            return True
+
+    def cancel(self) -> bool:
+        """
+        Stops the operation after its current frame. The operation's generator is
+        closed, so copy engines stop any background work. Files already done are
+        left in place: roll back a :class:`Transaction` given to the operation to
+        undo its renames.
+
+        :return: ``False`` if the operation had already finished or been cancelled.
+        """
+        with self._pool._condition:
+            if self._state in FINISHED or self._cancel_requested:
+                return False
+            self._cancel_requested = True
+            if self._state == RUNNING:
+                return True
+            if self._state == QUEUED:
+                self._pool._ready.remove(self)
+
+        self._close()
+        return True
+
+    def done(self) -> bool:
+        """whether the operation is done, failed or cancelled"""
+        return self._finished.is_set()
+
+    def cancelled(self) -> bool:
+        """whether the operation was cancelled"""
+        return self._state == CANCELLED
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until the operation is done, failed or cancelled.
+
+        :return: ``False`` if ``timeout`` seconds passed first.
+        """
+        return self._finished.wait(timeout)
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """
+        Waits for the operation, and returns the last item it yielded: the new
+        :class:`File` or :class:`FileSequence` of a copy, move or rename.
+
+        :raises concurrent.futures.CancelledError: if the operation was cancelled.
+        :raises concurrent.futures.TimeoutError: if ``timeout`` seconds pass first.
+        :raises: the error the operation raised, if it failed.
+        """
+        if not self._finished.wait(timeout):
+            raise TimeoutError
+        if self._state == CANCELLED:
+            raise CancelledError
+        if self._error is not None:
+            raise self._error
+        return self._last
+
+    def _step(self) -> None:
+        """advances the operation by one item, on a worker of the pool"""
+        try:
+            self._last = next(self._steps)
+        except StopIteration:
+            self._finish(DONE)
+            return
+        except BaseException as error:
+            self._error = error
+            self._finish(FAILED)
+            return
+        self._completed += 1
+
+        with self._pool._condition:
+            if self._cancel_requested:
+                pass
+            elif self._pause_requested and not self._pool._closing:
+                self._pause_requested = False
+                self._state = PAUSED
+                return
+            else:
+                self._pool._queue(self)
+                return
+        self._close()
+
+    def _close(self) -> None:
+        """closes the operation's generator, cleaning up after it, then cancels it"""
+        close = getattr(self._steps, "close", None)
+        try:
+            if close is not None:
+                close()
+        finally:
+            self._finish(CANCELLED)
+
+    def _finish(self, state: str) -> None:
+        with self._pool._condition:
+            self._state = state
+            self._pool._active.discard(self)
+        self._finished.set()
+
+
+class WorkerPool:
+    def __init__(self, workers: int = 2):
+        """
+        Pool of worker threads shared by operations of different priority. Submit any
+        ``*_iter`` generator, EX: :func:`FileBase.copy_iter`, to run it in the
+        background and get a :class:`Operation` handle to pause, cancel or
+        re-prioritize it.
+
+        Each operation runs on one worker at a time, and goes back in the queue after
+        every frame. Workers always take the queued operation of highest priority
+        next, so an urgent copy pre-empts bulk jobs at their next frame boundary.
+        Operations of equal priority take turns.
+
+        Threads are started on first use. Use as a context manager to wait for
+        submitted operations and stop the threads on exit.
+
+        :param workers: number of operations run at once.
+        """
+        if workers < 1:
+            raise ValueError("workers must be positive")
+
+        self.workers: int = workers
+        self._condition = threading.Condition()
+        self._ready: List[Operation] = list()
+        self._active: Set[Operation] = set()
+        self._threads: List[threading.Thread] = list()
+        self._orders = itertools.count()
+        self._closing = False
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(workers={self.workers})"
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def submit(self, steps: Iterator[Any], priority: int = 0) -> Operation:
+        """
+        Runs an operation in the background.
+
+        >>> operation = pool.submit(sequence.copy_iter("/Volumes/archive"), priority=10)
+        >>> copied = operation.result()
+
+        :param steps: generator of the operation, EX: from
+            :func:`FileBase.copy_iter`, :func:`FileBase.move_iter`,
+            :func:`FileBase.delete_iter` or :func:`FileBase.rename_iter`. It is not
+            started until a worker takes it.
+        :param priority: operations with a higher priority run first.
+
+        :raises RuntimeError: if the pool is closed.
+        """
+        operation = Operation(self, iter(steps), priority)
+        with self._condition:
+            if self._closing:
+                raise RuntimeError("cannot submit to a closed pool")
+            self._active.add(operation)
+            self._queue(operation)
+            if len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work, daemon=True)
+                self._threads.append(thread)
+                thread.start()
+        return operation
+
+    def close(self, cancel: bool = False) -> None:
+        """
+        Waits for every operation to finish, then stops the worker threads. Paused
+        operations are cancelled, as they would otherwise never finish.
+
+        :param cancel: cancel queued and running operations, rather than waiting for
+            them.
+        """
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+            operations = list(self._active)
+
+        for operation in operations:
+            if cancel or operation.state == PAUSED:
+                operation.cancel()
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+
+        # operations paused while the pool was closing.
+        for operation in list(self._active):
+            operation.cancel()
+
+    def _queue(self, operation: Operation) -> None:
+        """queues an operation to run, behind others of the same priority"""
+        operation._state = QUEUED
+        operation._order = next(self._orders)
+        self._ready.append(operation)
+        self._condition.notify()
+
+    def _take(self) -> Optional[Operation]:
+        """operation to run next, or ``None`` once the pool is closed and idle"""
+        with self._condition:
+            while not self._ready:
+                if self._closing:
+                    return None
+                self._condition.wait()
+
+            operation = max(self._ready, key=lambda op: (op._priority, -op._order))
+            self._ready.remove(operation)
+            operation._state = RUNNING
+            return operation
+
+    def _work(self) -> None:
+        while True:
+            operation = self._take()
+            if operation is None:
+                return
+            operation._step()
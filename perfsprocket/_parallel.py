@@ -0,0 +1,234 @@
+import os
+from concurrent.futures import (
+    Future,
+    FIRST_COMPLETED,
+    wait,
+)
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ._file_name import SeqName, BRACES_KINDS, _pieces_from_groups
+from ._hashing import hash_file, DEFAULT_ALGORITHM
+from ._name_patterns import NamePatterns, SEQ_PATTERNS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import ProcessPoolExecutor
+
+
+ConventionsType = Tuple[Tuple[str, str], ...]
+
+# Parsed names travel between processes as plain tuples rather than pickled
+#   SeqName objects: (base, delim, start, end, pad, braces index, extension, tail).
+#   The braces index is into BRACES_KINDS, -1 for no braces.
+PackedName = Tuple[str, str, Any, Any, int, int, Optional[str], Optional[str]]
+
+
+class ProcessBackend:
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: int = 10_000,
+        hash_chunk_size: int = 4,
+    ):
+        """
+        Runs CPU bound bulk work -- parsing names, hashing files, building catalogs --
+        on a pool of worker processes. Work is sent in chunks, results come back as
+        plain tuples and are streamed in the order chunks finish.
+
+        The pool is started on first use and reused until :func:`ProcessBackend.close`
+        is called. Use as a context manager to close it automatically.
+
+        :param workers: number of worker processes. Defaults to ``os.cpu_count()``.
+        :param chunk_size: names per task when parsing or cataloging.
+        :param hash_chunk_size: files per task when hashing.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1 or chunk_size < 1 or hash_chunk_size < 1:
+            raise ValueError("workers and chunk sizes must be positive")
+
+        self.workers: int = workers
+        self.chunk_size: int = chunk_size
+        self.hash_chunk_size: int = hash_chunk_size
+
+        self._executor: Optional["ProcessPoolExecutor"] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(workers={self.workers}, "
+            f"chunk_size={self.chunk_size}, hash_chunk_size={self.hash_chunk_size})"
+        )
+
+    def __enter__(self) -> "ProcessBackend":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the worker pool, if started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def map_iter(
+        self,
+        func: Callable[[List[Any]], Any],
+        items: Iterable[Any],
+        chunk_size: Optional[int] = None,
+    ) -> Generator[Tuple[List[Any], Any], None, None]:
+        """
+        Calls ``func`` on chunks of ``items`` in worker processes, yielding each
+        ``(chunk, result)`` pair as its chunk finishes. Only a few chunks per worker
+        are in flight at once, so ``items`` may be a lazy iterable.
+
+        :param func: picklable function taking a list of items.
+        :param items: items to split into chunks.
+        :param chunk_size: items per chunk. Defaults to ``chunk_size`` of the backend.
+        """
+        if chunk_size is None:
+            chunk_size = self.chunk_size
+
+        if self._executor is None:
+            # multiprocessing is slow to import, so is only imported once a pool is
+            #   needed.
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        executor = self._executor
+
+        items = iter(items)
+        pending: Dict[Future, List[Any]] = dict()
+        max_pending = self.workers * 2
+
+        try:
+            while True:
+                while len(pending) < max_pending:
+                    chunk = list(islice(items, chunk_size))
+                    if not chunk:
+                        break
+                    pending[executor.submit(func, chunk)] = chunk
+
+                if not pending:
+                    return
+
+                done: Set[Future]
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = pending.pop(future)
+                    yield chunk, future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def parse_iter(
+        self, names: Iterable[str], patterns: Optional[NamePatterns] = None
+    ) -> Generator[Tuple[str, Optional[SeqName]], None, None]:
+        """
+        Parses file names with :func:`SeqName.from_path` in worker processes.
+
+        :param names: file names to parse.
+        :param patterns: naming conventions to parse with. Defaults to
+            ``perfsprocket.SEQ_PATTERNS``.
+
+        :return: yields ``(name, SeqName)`` pairs as chunks finish. ``SeqName`` is
+            ``None`` for names that match no convention.
+        """
+        func = partial(_parse_chunk, conventions_of(patterns))
+
+        for chunk, packed_names in self.map_iter(func, names):
+            for name, packed in zip(chunk, packed_names):
+                yield name, None if packed is None else unpack_name(packed)
+
+    def hash_iter(
+        self, paths: Iterable[Union[str, Path]], algorithm: str = DEFAULT_ALGORITHM
+    ) -> Generator[Tuple[Path, str], None, None]:
+        """
+        Hashes files with :func:`perfsprocket._hashing.hash_file` in worker
+        processes.
+
+        :return: yields ``(path, hex digest)`` pairs as chunks finish.
+        """
+        func = partial(_hash_chunk, algorithm)
+        path_strs = (str(path) for path in paths)
+
+        for chunk, digests in self.map_iter(func, path_strs, self.hash_chunk_size):
+            for path, digest in zip(chunk, digests):
+                yield Path(path), digest
+
+
+def conventions_of(patterns: Optional[NamePatterns]) -> ConventionsType:
+    """picklable snapshot of a naming convention registry"""
+    if patterns is None:
+        patterns = SEQ_PATTERNS
+    return tuple(patterns.items())
+
+
+# Each worker compiles a registry snapshot once and reuses it for every chunk.
+_WORKER_PATTERNS: Dict[ConventionsType, NamePatterns] = dict()
+
+
+def patterns_from(conventions: ConventionsType) -> NamePatterns:
+    """registry for a snapshot from :func:`conventions_of`, cached per process"""
+    patterns = _WORKER_PATTERNS.get(conventions)
+    if patterns is None:
+        patterns = NamePatterns(conventions)
+        _WORKER_PATTERNS[conventions] = patterns
+    return patterns
+
+
+def pack_name(name: str, patterns: NamePatterns) -> Optional[PackedName]:
+    """parses ``name`` into a :data:`PackedName`, ``None`` if it does not match"""
+    result = patterns.match(name)
+    if result is None:
+        return None
+
+    try:
+        pieces = _pieces_from_groups(result.groups)
+    except ValueError:
+        # mismatched braces, EX: 'file.[0100-0200}.exr'
+        return None
+
+    base, delim, start, end, pad, braces, extension, tail = pieces
+    braces_index = -1 if braces is None else BRACES_KINDS.index(braces)
+    return base, delim, start, end, pad, braces_index, extension, tail
+
+
+def unpack_name(packed: PackedName) -> SeqName:
+    """rebuilds a :class:`SeqName` from :func:`pack_name`"""
+    base, delim, start, end, pad, braces_index, extension, tail = packed
+    return SeqName(
+        base=base,
+        extension=extension,
+        delim=delim,
+        start=start,
+        end=end,
+        pad=pad,
+        brackets=None if braces_index < 0 else BRACES_KINDS[braces_index],
+        tail=tail,
+    )
+
+
+def _parse_chunk(
+    conventions: ConventionsType, names: List[str]
+) -> List[Optional[PackedName]]:
+    patterns = patterns_from(conventions)
+    return [pack_name(name, patterns) for name in names]
+
+
+def _hash_chunk(algorithm: str, paths: List[str]) -> List[str]:
+    return [hash_file(path, algorithm) for path in paths]
@@ -0,0 +1,213 @@
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Generator, List, Optional, Tuple, Union
+
+from ._helpers_private import _init_path
+
+PairsType = Generator[Tuple[Path, Path], None, None]
+
+
+class _Bucket:
+    """tokens refilled at ``rate`` per second, up to ``rate * burst``"""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate: float = rate
+        self.burst: float = burst
+        self.tokens: float = rate * burst
+        self.updated: float = now
+
+    def take(self, amount: float, now: float) -> float:
+        """
+        takes ``amount`` tokens, returning seconds to wait until the bucket is out of
+        debt. Taking more than is left puts the bucket in debt, which later takes wait
+        out, so amounts larger than a whole bucket still pass at the set rate.
+        """
+        capacity = self.rate * self.burst
+        self.tokens = min(capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= amount
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class RateLimit:
+    def __init__(
+        self,
+        bytes_per_second: Optional[float] = None,
+        files_per_second: Optional[float] = None,
+        burst: float = 1.0,
+    ):
+        """
+        Token bucket limiting the bandwidth and file rate of copies and moves. One
+        limit can be shared by any number of operations and threads, which then share
+        its rate between them.
+
+        Pass to the ``rate_limit`` argument of :func:`FileBase.copy_iter`,
+        :func:`FileBase.move_iter` or :func:`FileSequence.sync_to_iter` to limit a
+        single call, register with :func:`RateLimit.apply_to` to limit every copy and
+        move into a folder, or set with :func:`RateLimit.set_global` to limit all of
+        them.
+
+        Files are paced as they are handed to the copy engine, so the rate holds on
+        average over a few files rather than within each file. Renames move no data,
+        so moves are limited by files per second only, unless they copy files between
+        devices.
+
+        Rates can be changed at any time, from any thread, and ``None`` turns a limit
+        off. Operations no limit applies to are not slowed at all.
+
+        :param bytes_per_second: most bytes copied per second.
+        :param files_per_second: most files copied or moved per second.
+        :param burst: seconds of unused rate that can be saved up and spent at once.
+        """
+        if burst <= 0:
+            raise ValueError("burst must be positive")
+
+        self._lock = threading.Lock()
+        self._burst = burst
+        self._bytes: Optional[_Bucket] = None
+        self._files: Optional[_Bucket] = None
+        self.bytes_per_second = bytes_per_second
+        self.files_per_second = files_per_second
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(bytes_per_second={self.bytes_per_second}, "
+            f"files_per_second={self.files_per_second}, burst={self._burst})"
+        )
+
+    @property
+    def bytes_per_second(self) -> Optional[float]:
+        """Most bytes copied per second, ``None`` for no limit. Settable."""
+        return None if self._bytes is None else self._bytes.rate
+
+    @bytes_per_second.setter
+    def bytes_per_second(self, rate: Optional[float]) -> None:
+        with self._lock:
+            self._bytes = self._rebucket(self._bytes, rate)
+
+    @property
+    def files_per_second(self) -> Optional[float]:
+        """Most files copied or moved per second, ``None`` for no limit. Settable."""
+        return None if self._files is None else self._files.rate
+
+    @files_per_second.setter
+    def files_per_second(self, rate: Optional[float]) -> None:
+        with self._lock:
+            self._files = self._rebucket(self._files, rate)
+
+    def _rebucket(
+        self, bucket: Optional[_Bucket], rate: Optional[float]
+    ) -> Optional[_Bucket]:
+        """bucket at a new rate, keeping tokens already saved up or owed"""
+        if rate is None:
+            return None
+        if rate <= 0:
+            raise ValueError("rates must be positive, or None for no limit")
+        if bucket is None:
+            return _Bucket(rate, self._burst, time.monotonic())
+
+        bucket.take(0, time.monotonic())
+        bucket.rate = rate
+        bucket.tokens = min(bucket.tokens, rate * self._burst)
+        return bucket
+
+    def acquire(self, nbytes: int = 0, files: int = 0) -> float:
+        """
+        Blocks until ``nbytes`` and ``files`` can be transferred within the limit.
+
+        :return: seconds spent waiting.
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            if self._bytes is not None and nbytes:
+                wait = self._bytes.take(nbytes, now)
+            if self._files is not None and files:
+                wait = max(wait, self._files.take(files, now))
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def apply_to(self, folder: Union[str, Path]) -> None:
+        """
+        Limits every copy and move into ``folder`` and its sub-folders. Where folders
+        with limits are nested, the limit of the deepest one applies.
+        """
+        with _REGISTRY_LOCK:
+            _DESTINATIONS[_init_path(folder)] = self
+
+    @staticmethod
+    def remove_from(folder: Union[str, Path]) -> None:
+        """Removes the limit applied to ``folder`` with :func:`RateLimit.apply_to`."""
+        with _REGISTRY_LOCK:
+            _DESTINATIONS.pop(_init_path(folder), None)
+
+    @staticmethod
+    def set_global(limit: Optional["RateLimit"]) -> None:
+        """
+        Limits every copy and move in this process, on top of any other limit.
+        ``None`` removes the global limit.
+        """
+        global _GLOBAL
+        _GLOBAL = limit
+
+
+_REGISTRY_LOCK = threading.Lock()
+_DESTINATIONS: Dict[Path, RateLimit] = dict()
+_GLOBAL: Optional[RateLimit] = None
+
+
+def limits_for(dst_folder: Path, limit: Optional[RateLimit]) -> List[RateLimit]:
+    """limits of a call into ``dst_folder``: its own, its folder's and the global one"""
+    limits = [] if limit is None else [limit]
+
+    if _DESTINATIONS:
+        with _REGISTRY_LOCK:
+            for folder in (dst_folder, *dst_folder.parents):
+                found = _DESTINATIONS.get(folder)
+                if found is not None:
+                    limits.append(found)
+                    break
+
+    if _GLOBAL is not None:
+        limits.append(_GLOBAL)
+    return list(dict.fromkeys(limits))
+
+
+def acquire_size(
+    limits: List[RateLimit], size_of: Callable[[Path], int], path: Path
+) -> None:
+    """
+    acquires the size of ``path`` from every limit on bytes, for files a move copies
+    between devices rather than renames
+    """
+    byte_limits = [limit for limit in limits if limit.bytes_per_second]
+    if byte_limits:
+        nbytes = size_of(path)
+        for limit in byte_limits:
+            limit.acquire(nbytes)
+
+
+def throttle_pairs(
+    pairs: PairsType,
+    limits: List[RateLimit],
+    size_of: Optional[Callable[[Path], int]] = None,
+) -> PairsType:
+    """
+    passes through ``pairs``, acquiring each file from every limit first. Files are
+    weighed by ``size_of`` their source, or count only towards files per second.
+    """
+    for src, dst in pairs:
+        nbytes = 0
+        # sources are only stat-ed while some limit is on bytes.
+        if size_of is not None and any(limit.bytes_per_second for limit in limits):
+            nbytes = size_of(src)
+        for limit in limits:
+            limit.acquire(nbytes, 1)
+        yield src, dst
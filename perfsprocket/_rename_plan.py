@@ -0,0 +1,153 @@
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from ._storage import Storage, LOCAL_STORAGE
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._transaction import Transaction
+
+
+class RenameStep(NamedTuple):
+    """One rename of a plan from :func:`plan_renames`"""
+
+    src: str
+    dst: str
+    # Name the file had before the plan ran, ``None`` for the first half of a rename
+    #   through a temporary name.
+    original: Optional[str]
+
+
+def plan_renames(
+    pairs: Sequence[Tuple[str, str]], existing: Iterable[str]
+) -> List[RenameStep]:
+    """
+    Orders renames of files within one folder so no rename overwrites a file that has
+    not been renamed yet.
+
+    Each destination can only be blocked by the one source of the same name, so
+    renames form simple chains, which run from the free end, and cycles, which are
+    broken with a single rename to a temporary name. The whole plan is computed
+    before any file is touched.
+
+    :param pairs: ``(old name, new name)`` pairs.
+    :param existing: names of everything in the folder, from one directory scan.
+
+    :raises FileNotFoundError: if an old name does not exist.
+    :raises FileExistsError: if a new name belongs to a file not being renamed.
+    :raises ValueError: if two files would get the same new name.
+    """
+    existing = set(existing)
+    sources: Dict[str, int] = {src: i for i, (src, _) in enumerate(pairs)}
+    _check_pairs(pairs, sources, existing)
+
+    # blocker[i] is the index of the file sitting on the new name of file i.
+    blocker: List[Optional[int]] = list()
+    for i, (_, dst) in enumerate(pairs):
+        j = sources.get(dst)
+        blocker.append(None if j == i else j)
+
+    plan: List[RenameStep] = list()
+    done = [False] * len(pairs)
+    taken = existing | {dst for _, dst in pairs}
+
+    for i in range(len(pairs)):
+        if done[i]:
+            continue
+
+        # Walk to the end of the chain, or until the chain loops back on itself.
+        chain = [i]
+        in_chain = {i}
+        j = blocker[i]
+        while j is not None and not done[j] and j not in in_chain:
+            chain.append(j)
+            in_chain.add(j)
+            j = blocker[j]
+
+        plan.extend(_plan_chain(pairs, chain, j if j in in_chain else None, taken))
+        for k in chain:
+            done[k] = True
+
+    return plan
+
+
+def _check_pairs(
+    pairs: Sequence[Tuple[str, str]], sources: Dict[str, int], existing: Set[str]
+) -> None:
+    destinations: Set[str] = set()
+    for src, dst in pairs:
+        if src not in existing:
+            raise FileNotFoundError(src)
+        if dst in destinations:
+            raise ValueError(f"more than one file would be renamed to '{dst}'")
+        if dst in existing and dst not in sources:
+            raise FileExistsError(dst)
+        destinations.add(dst)
+
+
+def _plan_chain(
+    pairs: Sequence[Tuple[str, str]],
+    chain: List[int],
+    loop_start: Optional[int],
+    taken: Set[str],
+) -> List[RenameStep]:
+    """
+    renames for a chain of files, each blocked by the next. If the last file is
+    blocked by ``loop_start``, that file is first moved out of the way.
+    """
+    steps: List[RenameStep] = list()
+    parked: Optional[str] = None
+
+    if loop_start is not None:
+        parked = _temp_name(pairs[loop_start][0], taken)
+        steps.append(RenameStep(pairs[loop_start][0], parked, None))
+
+    for k in reversed(chain):
+        src, dst = pairs[k]
+        if k == loop_start:
+            steps.append(RenameStep(parked, dst, src))  # type: ignore
+        elif src != dst:
+            steps.append(RenameStep(src, dst, src))
+
+    return steps
+
+
+def _temp_name(name: str, taken: Set[str]) -> str:
+    i = 0
+    while True:
+        candidate = f".{name}.renaming-{i}"
+        if candidate not in taken:
+            taken.add(candidate)
+            return candidate
+        i += 1
+
+
+def run_plan(
+    folder: Path,
+    plan: List[RenameStep],
+    transaction: Optional["Transaction"] = None,
+    storage: Optional[Storage] = None,
+) -> Iterable[Tuple[Path, Path]]:
+    """
+    Runs renames from :func:`plan_renames` on ``storage``, yielding
+    ``(old path, new path)`` for each file once it has its new name. Every rename is
+    logged to ``transaction``, if given. Defaults to local files.
+    """
+    if storage is None:
+        storage = LOCAL_STORAGE
+
+    pairs = ((folder / step.src, folder / step.dst) for step in plan)
+    for step, (src, dst) in zip(plan, storage.rename_pairs(pairs)):
+        if transaction is not None:
+            transaction.record(src, dst, storage)
+        if step.original is not None:
+            yield folder / step.original, dst
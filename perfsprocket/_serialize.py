@@ -0,0 +1,185 @@
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from ._class_file import File
+from ._class_file_sequence import FileSequence
+from ._file_name import SeqName, braces_from_chars
+
+
+MAGIC = b"PSPK"
+VERSION = 2
+
+# Layout: MAGIC, version byte, string table, record count, records.
+#
+# The string table is the number of strings and their utf-8 size, followed by every
+#   distinct string joined by NUL, which file names cannot contain. Records refer to
+#   strings by index, so the folder and name of many sequences are stored once.
+#
+# Each record is: kind, folder, base, extension, delim, brackets, tail, pad, start,
+#   end, step. Files store their whole file name as base and zero for the rest.
+_HEADER = struct.Struct("<4sB")
+_COUNT = struct.Struct("<I")
+_RECORD = struct.Struct("<BIIIIIIHqqI")
+
+_FILE = 0
+_SEQUENCE = 1
+
+# string index for None
+_NONE = 0xFFFFFFFF
+
+
+class _StringTable:
+    """Assigns each distinct string an index, in order of first use."""
+
+    def __init__(self) -> None:
+        self.indexes: Dict[str, int] = dict()
+        self.strings: List[str] = list()
+
+    def index(self, text: Optional[str]) -> int:
+        if text is None:
+            return _NONE
+
+        i = self.indexes.get(text)
+        if i is None:
+            i = len(self.strings)
+            self.indexes[text] = i
+            self.strings.append(text)
+        return i
+
+
+def encode_files(items: Iterable[Union[File, FileSequence]]) -> bytes:
+    """
+    Packs files and sequences into compact bytes for :func:`decode_files`. Folders and
+    names shared by many items are stored once, and sequences are stored as parsed
+    fields, so decoding does not parse any names.
+
+    :param items: :class:`File` and :class:`FileSequence` objects to pack.
+
+    :raises TypeError: for any other kind of item.
+    """
+    table = _StringTable()
+    index = table.index
+    records: List[bytes] = list()
+    pack = _RECORD.pack
+
+    for item in items:
+        if isinstance(item, FileSequence):
+            name = item.name
+            brackets = name.brackets
+            chars = None if brackets is None else f"{brackets.open}{brackets.close}"
+            record = pack(
+                _SEQUENCE,
+                index(str(item.path.parent)),
+                index(name.base),
+                index(name.extension),
+                index(name.delim),
+                index(chars),
+                index(name.tail),
+                name.pad,
+                item.start,
+                item.end,
+                item.step,
+            )
+        elif isinstance(item, File):
+            path = item.path
+            record = pack(
+                _FILE, index(str(path.parent)), index(path.name), 0, 0, 0, 0, 0, 0, 0, 0
+            )
+        else:
+            raise TypeError(f"cannot encode {type(item).__name__}")
+        records.append(record)
+
+    strings = "\0".join(table.strings).encode("utf-8", "surrogateescape")
+    return b"".join(
+        (
+            _HEADER.pack(MAGIC, VERSION),
+            _COUNT.pack(len(table.strings)),
+            _COUNT.pack(len(strings)),
+            strings,
+            _COUNT.pack(len(records)),
+            b"".join(records),
+        )
+    )
+
+
+def decode_files(data: bytes) -> List[Union[File, FileSequence]]:
+    """
+    Unpacks bytes from :func:`encode_files`. Items sharing a name share one
+    :class:`SeqName` object.
+
+    :raises ValueError: if ``data`` was not made by :func:`encode_files`.
+    """
+    view = memoryview(data)
+    strings, offset = _read_table(view)
+
+    (count,) = _COUNT.unpack_from(view, offset)
+    offset += _COUNT.size
+    if len(view) - offset != count * _RECORD.size:
+        raise ValueError("truncated or corrupt data")
+
+    folders: Dict[int, Path] = dict()
+    names: Dict[Tuple[int, int, int, int, int, int], SeqName] = dict()
+    items: List[Union[File, FileSequence]] = list()
+
+    for record in _RECORD.iter_unpack(view[offset:]):
+        kind, folder_i, base_i, ext_i, delim_i, braces_i, tail_i = record[:7]
+        pad, start, end, step = record[7:]
+
+        folder = folders.get(folder_i)
+        if folder is None:
+            folder = Path(strings[folder_i])
+            folders[folder_i] = folder
+
+        if kind == _FILE:
+            items.append(File(folder / strings[base_i]))
+            continue
+
+        key = (base_i, ext_i, delim_i, braces_i, tail_i, pad)
+        name = names.get(key)
+        if name is None:
+            name = SeqName(
+                base=strings[base_i],
+                extension=_optional(strings, ext_i),
+                delim=_optional(strings, delim_i),
+                start="#",
+                pad=pad,
+                brackets=braces_from_chars(_optional(strings, braces_i)),
+                tail=_optional(strings, tail_i),
+            )
+            names[key] = name
+
+        items.append(FileSequence._from_parts(folder, name, start, end, step))
+
+    return items
+
+
+def _read_table(view: memoryview) -> Tuple[List[str], int]:
+    """string table of encoded data and the offset of the record count after it"""
+    if len(view) < _HEADER.size + _COUNT.size * 3:
+        raise ValueError("truncated or corrupt data")
+
+    magic, version = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("data was not made by perfsprocket.encode_files")
+    if version != VERSION:
+        raise ValueError(f"unsupported version {version}")
+
+    offset = _HEADER.size
+    (string_count,) = _COUNT.unpack_from(view, offset)
+    (size,) = _COUNT.unpack_from(view, offset + _COUNT.size)
+    offset += _COUNT.size * 2
+
+    end = offset + size
+    if end + _COUNT.size > len(view):
+        raise ValueError("truncated or corrupt data")
+
+    text = bytes(view[offset:end]).decode("utf-8", "surrogateescape")
+    strings = text.split("\0") if string_count else []
+    if len(strings) != string_count:
+        raise ValueError("truncated or corrupt data")
+    return strings, end
+
+
+def _optional(strings: List[str], i: int) -> Optional[str]:
+    return None if i == _NONE else strings[i]
@@ -0,0 +1,304 @@
+import errno
+import itertools
+import os
+import shutil
+from collections import deque
+from pathlib import Path
+from typing import (
+    IO,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from ._copy_engine import CopyEngine, SHUTIL_ENGINE
+from ._durability import fsync_folder, fsync_path, syncfs_path
+from ._sync import _scan_stats
+
+PairsType = Iterable[Tuple[Path, Path]]
+
+
+class Storage:
+    """
+    Interface to where files live. :class:`File` and :class:`FileSequence` send their
+    file operations through the storage they were created with.
+
+    Backends implement the single file methods. Operations call the bulk methods,
+    which receive every path of an operation up front and by default loop over the
+    single file methods, so backends with native batching only need to override the
+    bulk methods that benefit.
+
+    Single file methods raise the same ``OSError`` subclasses as the ``os`` module:
+    ``FileNotFoundError`` for missing paths, ``PermissionError`` for denied access.
+    """
+
+    def stat(self, path: Path) -> os.stat_result:
+        """stat result of the file at ``path``"""
+        raise NotImplementedError
+
+    def list_names(self, folder: Path) -> List[str]:
+        """names of everything in ``folder``"""
+        raise NotImplementedError
+
+    def rename(self, src: Path, dst: Path) -> None:
+        """renames ``src`` to ``dst``, replacing any file at ``dst``"""
+        raise NotImplementedError
+
+    def copy(self, src: Path, dst: Path) -> None:
+        """copies the contents and permissions of ``src`` to ``dst``"""
+        raise NotImplementedError
+
+    def delete(self, path: Path) -> None:
+        """removes the file at ``path``"""
+        raise NotImplementedError
+
+    def chmod(self, path: Path, mode: int) -> None:
+        """sets the permission bits of ``path`` to ``mode``"""
+        raise NotImplementedError
+
+    def open(self, path: Path, mode: str = "rb") -> IO[bytes]:
+        """
+        binary file object of ``path``. ``mode`` is ``'rb'`` or ``'wb'``. Data written
+        is stored once the file object is closed.
+        """
+        raise NotImplementedError
+
+    def utime(self, path: Path, ns: Tuple[int, int]) -> None:
+        """sets the access and modification times of ``path``, in nanoseconds"""
+        raise NotImplementedError
+
+    def makedirs(self, folder: Path) -> None:
+        """
+        creates ``folder`` and any missing parents. Does nothing by default, for
+        backends without real folders.
+        """
+
+    def sync(self, path: Path) -> None:
+        """
+        flushes the contents of ``path`` to stable storage. Does nothing by default,
+        for backends where a written file is stored once closed.
+        """
+
+    def sync_folder(self, folder: Path) -> None:
+        """
+        flushes the entries of ``folder``, so new and renamed files survive a crash.
+        Does nothing by default.
+        """
+
+    def move(self, src: Path, dst: Path) -> None:
+        """
+        Renames ``src`` to ``dst``, or copies then deletes it where the two are on
+        different devices. The copy is synced before ``src`` is deleted.
+        """
+        try:
+            self.rename(src, dst)
+        except OSError as error:
+            if error.errno != errno.EXDEV:
+                raise
+            self.copy(src, dst)
+            self.sync(dst)
+            self.delete(src)
+
+    def stat_paths(self, paths: Iterable[Path]) -> Dict[Path, os.stat_result]:
+        """
+        Stat results of every path that exists. Missing paths are left out rather than
+        raising.
+        """
+        stats = dict()
+        for path in paths:
+            try:
+                stats[path] = self.stat(path)
+            except FileNotFoundError:
+                pass
+        return stats
+
+    def stat_folder(
+        self, folder: Path, keep: Callable[[str], bool]
+    ) -> Dict[str, os.stat_result]:
+        """
+        Stats of the entries of ``folder`` whose names ``keep`` returns ``True`` for,
+        by name, from one listing of the folder. Missing folders and entries are left
+        out rather than raising.
+        """
+        try:
+            names = [name for name in self.list_names(folder) if keep(name)]
+        except FileNotFoundError:
+            return dict()
+        stats = self.stat_paths(folder / name for name in names)
+        return {path.name: path_stat for path, path_stat in stats.items()}
+
+    def rename_pairs(
+        self, pairs: PairsType
+    ) -> Generator[Tuple[Path, Path], None, None]:
+        """
+        Renames each ``src`` to ``dst``, yielding the pair *after* the rename, in the
+        same order as ``pairs``.
+        """
+        for src, dst in pairs:
+            self.rename(src, dst)
+            yield src, dst
+
+    def move_pairs(
+        self,
+        pairs: PairsType,
+        before_copy: Optional[Callable[[Path], None]] = None,
+    ) -> Generator[Tuple[Path, Path], None, None]:
+        """
+        Moves each ``src`` to ``dst`` with :func:`Storage.rename_pairs`, yielding the
+        pair *after* the move. Pairs are taken from ``pairs`` only as they are moved,
+        so a paced iterator of pairs moves one file at a time. Once a rename fails
+        because the two paths are on different devices, the remaining pairs are
+        copied with :func:`Storage.copy_pairs`, and each source deleted once its copy
+        is synced with :func:`Storage.sync`.
+
+        :param before_copy: called with each source before it is handed on to be
+            copied rather than renamed, EX: to charge its size to a rate limit.
+        """
+        # pairs taken from 'pairs' but not yet yielded, in order.
+        taken: Deque[Tuple[Path, Path]] = deque()
+        pairs = iter(pairs)
+        try:
+            for pair in self.rename_pairs(_taken_from(pairs, taken)):
+                taken.popleft()
+                yield pair
+            return
+        except OSError as error:
+            if error.errno != errno.EXDEV:
+                raise
+
+        remaining = itertools.chain(list(taken), pairs)
+        taken.clear()
+        for _ in self.copy_pairs(_taken_from(remaining, taken, before_copy)):
+            src, dst = taken.popleft()
+            self.sync(dst)
+            self.delete(src)
+            yield src, dst
+
+    def copy_pairs(self, pairs: PairsType) -> Generator[Path, None, None]:
+        """
+        Copies each ``src`` to ``dst``, yielding ``dst`` once it is fully written, in
+        the same order as ``pairs``.
+        """
+        for src, dst in pairs:
+            self.copy(src, dst)
+            yield dst
+
+    def delete_paths(self, paths: Iterable[Path]) -> Generator[Path, None, None]:
+        """Removes each path, yielding it *after* it is removed."""
+        for path in paths:
+            self.delete(path)
+            yield path
+
+    def sync_paths(self, paths: List[Path]) -> None:
+        """Flushes the contents of every path with :func:`Storage.sync`."""
+        for path in paths:
+            self.sync(path)
+
+    def chmod_paths(
+        self, paths: Iterable[Path], mode: int
+    ) -> Generator[Path, None, None]:
+        """Changes permissions on each path, yielding it once changed."""
+        for path in paths:
+            self.chmod(path, mode)
+            yield path
+
+
+class LocalStorage(Storage):
+    def __init__(self, engine: Optional[CopyEngine] = None):
+        """
+        Files on the local filesystems, through the ``os`` module. The default storage.
+
+        Stats of many paths are taken with a single ``os.scandir`` per folder.
+
+        :param engine: :class:`CopyEngine` that does the copying. Defaults to
+            :class:`ShutilEngine`.
+        """
+        self.engine: CopyEngine = SHUTIL_ENGINE if engine is None else engine
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(engine={self.engine!r})"
+
+    def stat(self, path: Path) -> os.stat_result:
+        return os.stat(str(path))
+
+    def list_names(self, folder: Path) -> List[str]:
+        with os.scandir(str(folder)) as entries:
+            return [entry.name for entry in entries]
+
+    def rename(self, src: Path, dst: Path) -> None:
+        os.rename(str(src), str(dst))
+
+    def copy(self, src: Path, dst: Path) -> None:
+        shutil.copy(str(src), str(dst))
+
+    def delete(self, path: Path) -> None:
+        os.remove(str(path))
+
+    def chmod(self, path: Path, mode: int) -> None:
+        os.chmod(str(path), mode)
+
+    def open(self, path: Path, mode: str = "rb") -> IO[bytes]:
+        return open(str(path), mode)  # type: ignore
+
+    def utime(self, path: Path, ns: Tuple[int, int]) -> None:
+        os.utime(str(path), ns=ns)
+
+    def makedirs(self, folder: Path) -> None:
+        os.makedirs(str(folder), exist_ok=True)
+
+    def sync(self, path: Path) -> None:
+        fsync_path(path)
+
+    def sync_folder(self, folder: Path) -> None:
+        fsync_folder(folder)
+
+    def sync_paths(self, paths: List[Path]) -> None:
+        """
+        Flushes the whole filesystem of the first path with one ``syncfs`` where
+        available, otherwise fsyncs each path.
+        """
+        if paths and not syncfs_path(paths[0]):
+            super().sync_paths(paths)
+
+    def stat_paths(self, paths: Iterable[Path]) -> Dict[Path, os.stat_result]:
+        by_folder: Dict[Path, Dict[str, Path]] = dict()
+        for path in paths:
+            by_folder.setdefault(path.parent, dict())[path.name] = path
+
+        stats = dict()
+        for folder, names in by_folder.items():
+            for name, stat in _scan_stats(folder, names.__contains__).items():
+                stats[names[name]] = stat
+        return stats
+
+    def stat_folder(
+        self, folder: Path, keep: Callable[[str], bool]
+    ) -> Dict[str, os.stat_result]:
+        return _scan_stats(folder, keep)
+
+    def copy_pairs(self, pairs: PairsType) -> Generator[Path, None, None]:
+        return self.engine.copy_pairs(pairs)
+
+
+LOCAL_STORAGE = LocalStorage()
+
+
+def _taken_from(
+    pairs: Iterable[Tuple[Path, Path]],
+    taken: Deque[Tuple[Path, Path]],
+    before: Optional[Callable[[Path], None]] = None,
+) -> Generator[Tuple[Path, Path], None, None]:
+    """
+    passes through ``pairs``, appending each to ``taken`` as it is handed on. Calls
+    ``before`` with each source first.
+    """
+    for pair in pairs:
+        if before is not None:
+            before(pair[0])
+        taken.append(pair)
+        yield pair
@@ -0,0 +1,230 @@
+import errno
+import os
+import stat
+from functools import partial
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Union,
+    cast,
+)
+
+from ._file_name import SeqName
+from ._frame_set import FrameSet
+from ._hashing import hash_stream
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._class_file_sequence import FileSequence
+    from ._rate_limit import RateLimit
+    from ._storage import Storage
+
+
+NEW = "new"
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+DELETED = "deleted"
+
+
+class SyncAction(NamedTuple):
+    """
+    Action taken for a single frame by :func:`FileSequence.sync_to_iter`.
+
+    ``action`` is one of ``'new'``, ``'changed'``, ``'unchanged'`` or ``'deleted'``.
+    ``src`` is ``None`` for frames deleted from the destination.
+    """
+
+    action: str
+    src: Optional[Path]
+    dst: Path
+
+
+SyncIterType = Generator[Union[SyncAction, "FileSequence"], None, None]
+
+
+def _scan_stats(folder: Path, keep: Callable[[str], bool]) -> Dict[str, os.stat_result]:
+    """
+    Stats every entry of ``folder`` that ``keep`` returns ``True`` for, from a single
+    ``os.scandir``. Missing folders return an empty dict, and entries removed during
+    the scan are left out.
+    """
+    stats = dict()
+    try:
+        with os.scandir(str(folder)) as entries:
+            for entry in entries:
+                if keep(entry.name):
+                    try:
+                        stats[entry.name] = entry.stat()
+                    except FileNotFoundError:
+                        pass
+    except FileNotFoundError:
+        pass
+    return stats
+
+
+def _stats_by_name(
+    storage: "Storage", folder: Path, names: Iterable[str]
+) -> Dict[str, os.stat_result]:
+    """stats of every name in ``folder`` that exists, from one batch stat"""
+    stats = storage.stat_paths(folder / name for name in names)
+    return {path.name: path_stat for path, path_stat in stats.items()}
+
+
+def _is_frame_of(seq: "FileSequence", entry: str) -> bool:
+    """
+    whether ``entry`` is named as a frame of ``seq``, in or out of its range. Names
+    padded differently belong to other sequences.
+    """
+    try:
+        name = SeqName.from_path(entry)
+    except ValueError:
+        return False
+    if not isinstance(name.start, int) or name.end is not None:
+        return False
+    return seq.frame_name(name.start) == entry
+
+
+def _extras_of(
+    dst_folder: Path, dst_stats: Dict[str, os.stat_result], names: Set[str]
+) -> List[Path]:
+    """files scanned in ``dst_folder`` that are not frames of ``names``"""
+    # folders can be named like frames too.
+    return sorted(
+        dst_folder / name
+        for name, dst_stat in dst_stats.items()
+        if name not in names and stat.S_ISREG(dst_stat.st_mode)
+    )
+
+
+def _frame_differs(
+    storage: "Storage",
+    src: Path,
+    dst: Path,
+    src_stat: os.stat_result,
+    dst_stat: os.stat_result,
+    checksum: bool,
+) -> bool:
+    """compares a frame by size, then by mtime or contents"""
+    if src_stat.st_size != dst_stat.st_size:
+        return True
+    if checksum:
+        return _hash_of(storage, src) != _hash_of(storage, dst)
+    return src_stat.st_mtime_ns != dst_stat.st_mtime_ns
+
+
+def _hash_of(storage: "Storage", path: Path) -> str:
+    with storage.open(path) as source:
+        return hash_stream(source)
+
+
+def sync_to_iter(
+    seq: "FileSequence",
+    dst_folder: Path,
+    checksum: bool = False,
+    delete_extra: bool = False,
+    rate_limit: Optional["RateLimit"] = None,
+) -> SyncIterType:
+    """implementation of :func:`FileSequence.sync_to_iter`"""
+    frames = range(seq.start, seq.end + 1, seq.step)
+    names = seq.name.format_frames(frames)
+    name_set = set(names)
+
+    src_stats = _stats_by_name(seq.storage, seq.path.parent, names)
+    # frames outside the range are found in the same scan as those in it.
+    keep: Callable[[str], bool] = name_set.__contains__
+    if delete_extra:
+        keep = partial(_is_frame_of, seq)
+    dst_stats = seq.storage.stat_folder(dst_folder, keep)
+
+    actions: List[str] = list()
+    for name in names:
+        if name not in src_stats:
+            raise FileNotFoundError(str(seq.path.parent / name))
+
+        dst_stat = dst_stats.get(name)
+        if dst_stat is None:
+            actions.append(NEW)
+        elif _frame_differs(
+            seq.storage,
+            seq.path.parent / name,
+            dst_folder / name,
+            src_stats[name],
+            dst_stat,
+            checksum,
+        ):
+            actions.append(CHANGED)
+        else:
+            actions.append(UNCHANGED)
+
+    yield from _copy_runs(
+        seq, dst_folder, names, actions, src_stats, checksum, rate_limit
+    )
+
+    if delete_extra:
+        for path in _extras_of(dst_folder, dst_stats, name_set):
+            seq.storage.delete(path)
+            yield SyncAction(DELETED, None, path)
+
+    yield seq.init_new(dst_folder / seq.path.name)
+
+
+def _copy_runs(
+    seq: "FileSequence",
+    dst_folder: Path,
+    names: List[str],
+    actions: List[str],
+    src_stats: Dict[str, os.stat_result],
+    checksum: bool,
+    rate_limit: Optional["RateLimit"] = None,
+) -> Iterable[SyncAction]:
+    """
+    Copies each contiguous run of new or changed frames with ``copy_iter``, yielding
+    actions in frame order. Copies get the source mtime so the next sync sees them as
+    unchanged.
+    """
+    src_folder = seq.path.parent
+    to_copy = FrameSet.from_frames(
+        seq.start + i * seq.step
+        for i, action in enumerate(actions)
+        if action != UNCHANGED
+    )
+
+    index = 0
+    for run in seq.subsequences(to_copy):
+        run_first = (run.start - seq.start) // seq.step
+
+        for i in range(index, run_first):
+            yield SyncAction(UNCHANGED, src_folder / names[i], dst_folder / names[i])
+
+        copied = run.copy_iter(dst_folder, rate_limit=rate_limit)
+        for i in range(run_first, run_first + len(run)):
+            dst = cast(Path, next(copied))
+            _copy_times(seq.storage, dst, src_stats[names[i]], checksum)
+            yield SyncAction(actions[i], src_folder / names[i], dst)
+        copied.close()
+
+        index = run_first + len(run)
+
+    for i in range(index, len(names)):
+        yield SyncAction(UNCHANGED, src_folder / names[i], dst_folder / names[i])
+
+
+def _copy_times(
+    storage: "Storage", dst: Path, src_stat: os.stat_result, checksum: bool
+) -> None:
+    """
+    gives ``dst`` the times of its source. Syncs by checksum do not compare mtimes,
+    so carry on where the storage cannot set them.
+    """
+    try:
+        storage.utime(dst, (src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    except OSError as error:
+        if not checksum or error.errno != errno.ENOTSUP:
+            raise
@@ -0,0 +1,84 @@
+from pathlib import Path
+from typing import Any, Generator, List, Optional, Tuple
+
+from ._storage import Storage, LOCAL_STORAGE
+
+
+class Transaction:
+    def __init__(self) -> None:
+        """
+        Log of completed renames, which can be undone as a unit. Pass to the
+        ``transaction`` argument of :func:`FileBase.move_iter`,
+        :func:`FileBase.rename_iter` or :func:`FileSequence.renumber_iter`, and
+        each file is logged once it has its new path.
+
+        Used as a context manager, the transaction rolls back if the block raises and
+        commits if it does not:
+
+        >>> with Transaction() as transaction:
+        ...     moved = sequence.move("/Volumes/shots", transaction=transaction)
+        ...     renamed = moved.rename("plate_####.exr", transaction=transaction)
+
+        The log holds the path objects the operations already made, so logging adds no
+        system calls to operations that succeed.
+        """
+        self._steps: List[Tuple[Path, Path, Storage]] = list()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {len(self._steps)} steps>"
+
+    def __len__(self) -> int:
+        """number of steps that would be undone by a rollback"""
+        return len(self._steps)
+
+    def __enter__(self) -> "Transaction":
+        return self
+
+    def __exit__(self, exc_type: Optional[type], *args: Any) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def record(self, src: Path, dst: Path, storage: Optional[Storage] = None) -> None:
+        """
+        Logs a completed rename of ``src`` to ``dst``, made on ``storage``. Defaults
+        to local files.
+        """
+        self._steps.append((src, dst, LOCAL_STORAGE if storage is None else storage))
+
+    def commit(self) -> None:
+        """Forgets all logged steps, so they can no longer be rolled back."""
+        self._steps.clear()
+
+    def rollback_iter(self) -> Generator[Tuple[Path, Path], None, None]:
+        """
+        Undoes logged steps, last first, yielding a CurrentPath, OriginalPath pair
+        *after* each file is back at its original path.
+
+        If a step cannot be undone, the remaining steps are still tried, then the
+        first error is raised. Steps that failed stay logged, so the rollback can be
+        retried once the cause is fixed.
+        """
+        failed: List[Tuple[Path, Path, Storage]] = list()
+        error: Optional[OSError] = None
+
+        while self._steps:
+            src, dst, storage = self._steps.pop()
+            try:
+                storage.move(dst, src)
+            except OSError as this_error:
+                failed.append((src, dst, storage))
+                error = error or this_error
+                continue
+            yield dst, src
+
+        # failed steps are kept in their original order.
+        self._steps.extend(reversed(failed))
+        if error is not None:
+            raise error
+
+    def rollback(self) -> None:
+        """Executes :func:`Transaction.rollback_iter`."""
+        for _ in self.rollback_iter():
+            pass
@@ -0,0 +1,86 @@
+import os
+from typing import Iterable, List, NamedTuple, Optional
+
+
+class Usage(NamedTuple):
+    """
+    Disk usage of a file or sequence, from :func:`FileBase.du` or :func:`usage`.
+
+    ``apparent`` is the sum of file sizes, ``allocated`` the space the files take up
+    on disk, which is lower for sparse or compressed files and higher for small files
+    on large blocks. Where the OS does not report allocated space, it is the
+    apparent size. ``min_size`` and ``max_size`` are ``None`` when no files were
+    found.
+    """
+
+    files: int
+    missing: int
+    apparent: int
+    allocated: int
+    min_size: Optional[int]
+    max_size: Optional[int]
+
+    @property
+    def mean_size(self) -> Optional[float]:
+        """average size of the files found, ``None`` when no files were found"""
+        if not self.files:
+            return None
+        return self.apparent / self.files
+
+    @classmethod
+    def from_stats(cls, stats: Iterable[os.stat_result], missing: int = 0) -> "Usage":
+        """
+        Usage of files from stat results already in hand.
+
+        :param stats: stat results of the files found.
+        :param missing: number of files expected but not found.
+        """
+        files = 0
+        apparent = 0
+        allocated = 0
+        min_size: Optional[int] = None
+        max_size: Optional[int] = None
+
+        for stat in stats:
+            size = stat.st_size
+            files += 1
+            apparent += size
+            allocated += allocated_size(stat)
+            if min_size is None or size < min_size:
+                min_size = size
+            if max_size is None or size > max_size:
+                max_size = size
+
+        return cls(files, missing, apparent, allocated, min_size, max_size)
+
+    @classmethod
+    def total(cls, usages: Iterable["Usage"]) -> "Usage":
+        """Combined usage of many files and sequences."""
+        files = missing = apparent = allocated = 0
+        sizes: List[int] = list()
+
+        for usage in usages:
+            files += usage.files
+            missing += usage.missing
+            apparent += usage.apparent
+            allocated += usage.allocated
+            if usage.min_size is not None and usage.max_size is not None:
+                sizes.extend((usage.min_size, usage.max_size))
+
+        return cls(
+            files,
+            missing,
+            apparent,
+            allocated,
+            min(sizes) if sizes else None,
+            max(sizes) if sizes else None,
+        )
+
+
+def allocated_size(stat: os.stat_result) -> int:
+    """bytes allocated on disk, the apparent size where the OS does not report it"""
+    blocks = getattr(stat, "st_blocks", None)
+    if blocks is None:
+        return stat.st_size
+    # st_blocks is always in 512 byte units, whatever the filesystem block size.
+    return int(blocks) * 512
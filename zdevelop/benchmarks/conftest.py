@@ -0,0 +1,116 @@
+import pytest
+import random
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Callable, Generator, List, Tuple
+
+from perfsprocket import FileSequence
+
+
+# Frame counts used by the synthetic fixtures. Counts above --bench-max-frames are
+# skipped so the default run stays reasonably fast; pass --bench-max-frames=1000000 to
+# include the 1M frame cases.
+FRAME_COUNTS = [1_000, 100_000, 1_000_000]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-max-frames",
+        action="store",
+        type=int,
+        default=100_000,
+        help="largest synthetic sequence size to benchmark",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    max_frames = config.getoption("--bench-max-frames")
+    skip = pytest.mark.skip(reason="frame count above --bench-max-frames")
+
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is None:
+            continue
+        frames = callspec.params.get("frame_count")
+        if frames is not None and frames > max_frames:
+            item.add_marker(skip)
+
+
+def _scratch_root() -> Path:
+    """tmpfs when available so disk benchmarks measure the library, not the disk."""
+    shm = Path("/dev/shm")
+    if shm.is_dir():
+        return shm
+    return Path(tempfile.gettempdir())
+
+
+@pytest.fixture
+def scratch_dir() -> Generator[Path, None, None]:
+    """Empty directory on tmpfs, removed after the benchmark."""
+    path = Path(
+        tempfile.mkdtemp(prefix="perfsprocket_bench_", dir=str(_scratch_root()))
+    )
+    yield path
+    shutil.rmtree(str(path), ignore_errors=True)
+
+
+def write_sequence(folder: Path, frame_count: int, start: int = 1001) -> FileSequence:
+    """Writes a small file for each frame and returns the matching sequence."""
+    folder.mkdir(parents=True, exist_ok=True)
+    seq = FileSequence(folder / "plate.####.exr", start, start + frame_count - 1)
+    for path in seq:
+        with path.open("wb") as f:
+            f.write(b"x" * 64)
+    return seq
+
+
+@pytest.fixture
+def make_sequence(
+    scratch_dir: Path,
+) -> Callable[[int], Tuple[Callable[[], Tuple[tuple, dict]], Path]]:
+    """
+    Returns factory taking a frame count. The factory returns a ``setup`` callable for
+    ``benchmark.pedantic`` that writes a fresh sequence under a new source folder each
+    round, and the destination folder.
+    """
+    counter = [0]
+
+    def factory(frame_count: int) -> Tuple[Callable[[], Tuple[tuple, dict]], Path]:
+        dst = scratch_dir / "dst"
+        dst.mkdir(exist_ok=True)
+
+        def setup() -> Tuple[tuple, dict]:
+            counter[0] += 1
+            for child in dst.iterdir():
+                child.unlink()
+            src = write_sequence(scratch_dir / f"src_{counter[0]}", frame_count)
+            return (src,), dict()
+
+        return setup, dst
+
+    return factory
+
+
+@pytest.fixture(scope="session")
+def name_corpus() -> List[str]:
+    """Generated file names covering the naming conventions SeqName parses."""
+    rng = random.Random(1001)
+    templates = [
+        "shot_{shot:03d}.{frame:04d}.exr",
+        "plate_{shot:03d}_{frame:06d}.dpx",
+        "render.v{shot:03d}.{frame:07d}.tif",
+        "comp_{shot:03d}.[{frame:04d}-{end:04d}].exr",
+        "comp_{shot:03d}.{{{frame:04d}-{end:04d}}}.exr",
+        "scan_{shot:03d}.####.dpx",
+        "scan_{shot:03d}_{frame:04d}",
+    ]
+
+    corpus = list()
+    for i in range(100_000):
+        template = templates[i % len(templates)]
+        frame = rng.randint(1, 9000)
+        corpus.append(
+            template.format(shot=rng.randint(1, 999), frame=frame, end=frame + 100)
+        )
+    return corpus
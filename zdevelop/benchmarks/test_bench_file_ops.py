@@ -0,0 +1,43 @@
+import pytest
+
+from .conftest import FRAME_COUNTS
+
+
+# Disk operations write real files, so the 1M case is left to --bench-max-frames.
+DISK_ROUNDS = 3
+
+
+@pytest.mark.parametrize("frame_count", FRAME_COUNTS)
+def test_copy(benchmark, make_sequence, frame_count):
+    setup, dst = make_sequence(frame_count)
+    benchmark.pedantic(
+        lambda seq: seq.copy(dst), setup=setup, rounds=DISK_ROUNDS, iterations=1
+    )
+
+
+@pytest.mark.parametrize("frame_count", FRAME_COUNTS)
+def test_move(benchmark, make_sequence, frame_count):
+    setup, dst = make_sequence(frame_count)
+    benchmark.pedantic(
+        lambda seq: seq.move(dst), setup=setup, rounds=DISK_ROUNDS, iterations=1
+    )
+
+
+@pytest.mark.parametrize("frame_count", FRAME_COUNTS)
+def test_delete(benchmark, make_sequence, frame_count):
+    setup, _ = make_sequence(frame_count)
+    benchmark.pedantic(
+        lambda seq: seq.delete(), setup=setup, rounds=DISK_ROUNDS, iterations=1
+    )
+
+
+@pytest.mark.parametrize("frame_count", FRAME_COUNTS)
+@pytest.mark.parametrize("new_name", ["plate.0001.exr", "renamed.####.exr"])
+def test_rename_iter(benchmark, make_sequence, frame_count, new_name):
+    setup, _ = make_sequence(frame_count)
+
+    def rename(seq):
+        for _ in seq.rename_iter(new_name):
+            pass
+
+    benchmark.pedantic(rename, setup=setup, rounds=DISK_ROUNDS, iterations=1)
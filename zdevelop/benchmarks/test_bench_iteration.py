@@ -0,0 +1,56 @@
+import pytest
+
+from perfsprocket import FileSequence
+
+from .conftest import FRAME_COUNTS
+
+
+def _theory(frame_count: int) -> FileSequence:
+    return FileSequence("/mnt/show/shot/plate.####.exr", 1001, 1000 + frame_count)
+
+
+@pytest.mark.parametrize("frame_count", FRAME_COUNTS)
+def test_iter(benchmark, frame_count):
+    seq = _theory(frame_count)
+
+    def consume():
+        for _ in seq:
+            pass
+
+    benchmark.pedantic(consume, rounds=3, iterations=1)
+
+
+@pytest.mark.parametrize("frame_count", FRAME_COUNTS)
+def test_reversed(benchmark, frame_count):
+    seq = _theory(frame_count)
+
+    def consume():
+        for _ in reversed(seq):
+            pass
+
+    benchmark.pedantic(consume, rounds=3, iterations=1)
+
+
+@pytest.mark.parametrize("frame_count", FRAME_COUNTS)
+def test_get_slice(benchmark, frame_count):
+    seq = _theory(frame_count)
+    benchmark(seq.__getitem__, slice(10, -10))
+
+
+@pytest.mark.parametrize("frame_count", FRAME_COUNTS)
+def test_get_index(benchmark, frame_count):
+    seq = _theory(frame_count)
+    benchmark(seq.__getitem__, frame_count // 2)
+
+
+@pytest.mark.parametrize("frame_count", FRAME_COUNTS)
+def test_files_frame_num(benchmark, frame_count):
+    seq = _theory(frame_count)
+    benchmark(seq.files.__getitem__, 1000 + frame_count // 2)
+
+
+@pytest.mark.parametrize("frame_count", FRAME_COUNTS)
+def test_accessor_path(benchmark, frame_count):
+    seq = _theory(frame_count)
+    accessor = seq.accessor()
+    benchmark(accessor.path, 1000 + frame_count // 2)
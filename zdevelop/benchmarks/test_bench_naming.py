@@ -0,0 +1,42 @@
+import pytest
+
+from perfsprocket import SeqName
+
+
+def test_from_path_throughput(benchmark, name_corpus):
+    def parse_all():
+        for name in name_corpus:
+            SeqName.from_path(name)
+
+    benchmark.pedantic(parse_all, rounds=5, iterations=1)
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["plate.1001.exr", "/mnt/show/seq/shot/plate_[1001-1100].dpx", "render.####.tif"],
+)
+def test_from_path_single(benchmark, path):
+    benchmark(SeqName.from_path, path)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        SeqName("plate", ".exr", start=1001, pad=4),
+        SeqName("plate", ".exr", start=1001, end=1100, pad=4),
+        SeqName("plate", ".exr", start="#", pad=4),
+    ],
+    ids=["frame", "range", "generic"],
+)
+def test_formatted(benchmark, name):
+    benchmark(name.formatted)
+
+
+def test_alter_formatted(benchmark):
+    name = SeqName("plate", ".exr", pad=4)
+
+    def alter_all():
+        for frame in range(1001, 11001):
+            name.alter(start=frame, end=None).formatted()
+
+    benchmark.pedantic(alter_all, rounds=5, iterations=1)
@@ -0,0 +1,141 @@
+import io
+import os
+import tarfile
+import zipfile
+import pytest
+from pathlib import Path
+
+from perfsprocket import File, FileSequence, MemoryStorage, unpack
+
+
+FORMATS = [("tar", None), ("tar", "gzip"), ("zip", None), ("zip", "deflate")]
+
+
+def contents(item) -> list:
+    return [path.read_bytes() for path in item]
+
+
+@pytest.mark.parametrize("format, compression", FORMATS)
+def test_pack_unpack(file_seq_for_operation, format, compression):
+    seq, dst = file_seq_for_operation
+    archive = dst / f"archive.{format}"
+
+    seq.pack(archive, format, compression, workers=2)
+    found = unpack(archive, dst / "out")
+
+    assert len(found) == 1
+    unpacked = found[0]
+    assert isinstance(unpacked, FileSequence)
+    assert unpacked.to_spec() == seq.to_spec().replace(
+        str(seq.path.parent), str(dst / "out")
+    )
+    assert contents(unpacked) == contents(seq)
+
+
+@pytest.mark.parametrize("format, compression", FORMATS)
+def test_standard_readers(file_seq_for_operation, format, compression):
+    seq, dst = file_seq_for_operation
+    archive = dst / "archive"
+    seq.pack(archive, format, compression, arcdir="shots/plate")
+
+    names = [f"shots/plate/{path.name}" for path in seq]
+    first = seq.path.parent / "file.100.txt"
+    if format == "zip":
+        with zipfile.ZipFile(str(archive)) as reader:
+            assert reader.namelist() == names
+            assert reader.read(names[0]) == first.read_bytes()
+    else:
+        with tarfile.open(str(archive)) as reader:
+            assert reader.getnames() == names
+            data = reader.extractfile(names[0]).read()  # type: ignore
+            assert data == first.read_bytes()
+
+
+def test_pack_stream(file_seq_for_operation):
+    seq, dst = file_seq_for_operation
+    stream = io.BytesIO()
+
+    packed = list(seq.pack_iter(stream))
+    assert packed == list(seq)
+
+    stream.seek(0)
+    found = unpack(stream, dst)
+    assert [item.path.parent for item in found] == [dst]
+    assert contents(found[0]) == contents(seq)
+
+
+def test_pack_pipe(file_seq_for_operation):
+    seq, dst = file_seq_for_operation
+    read_fd, write_fd = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        os.close(read_fd)
+        with open(write_fd, "wb") as pipe:
+            seq.pack(pipe)
+        os._exit(0)
+
+    os.close(write_fd)
+    with open(read_fd, "rb") as pipe:
+        found = unpack(pipe, dst)
+    os.waitpid(pid, 0)
+
+    assert contents(found[0]) == contents(seq)
+
+
+def test_pack_file(single_file_for_operation):
+    file, dst = single_file_for_operation
+    os.chmod(str(file.path), 0o640)
+
+    file.pack(dst / "archive.tar")
+    found = unpack(dst / "archive.tar", dst / "out")
+
+    assert len(found) == 1
+    assert isinstance(found[0], File)
+    assert found[0].path == dst / "out" / file.path.name
+    assert found[0].path.read_bytes() == file.path.read_bytes()
+    stat = found[0].path.stat()
+    assert stat.st_mode & 0o777 == 0o640
+    assert int(stat.st_mtime) == int(file.path.stat().st_mtime)
+
+
+@pytest.mark.parametrize("format, compression", FORMATS)
+def test_pack_unpack_other_storage(format, compression):
+    storage = MemoryStorage()
+    storage.create_files(
+        (Path(f"/shots/plate.{i:04}.exr") for i in range(1, 11)), data=b"pixels"
+    )
+    storage.chmod(Path("/shots/plate.0001.exr"), 0o640)
+    seq = FileSequence("/shots/plate.####.exr", 1, 10, storage=storage)
+
+    seq.pack("/shots/plate.archive", format, compression, workers=2)
+    found = unpack("/shots/plate.archive", "/ingest/plate", storage=storage)
+
+    assert len(found) == 1
+    assert found[0].to_spec() == "/ingest/plate/plate.[0001-0010].exr"
+    assert found[0].storage is storage
+    assert storage.read_bytes("/ingest/plate/plate.0010.exr") == b"pixels"
+    first = storage.stat(Path("/ingest/plate/plate.0001.exr"))
+    assert first.st_mode & 0o777 == 0o640
+    # zip archives keep times to 2 seconds.
+    assert abs(first.st_mtime - storage.stat(seq.path).st_mtime) <= 2
+
+
+def test_unpack_outside_folder(tmp_path):
+    archive = tmp_path / "archive.tar"
+    with tarfile.open(str(archive), "w") as writer:
+        info = tarfile.TarInfo("../escaped.txt")
+        writer.addfile(info, io.BytesIO())
+
+    with pytest.raises(ValueError):
+        unpack(archive, tmp_path / "out")
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+@pytest.mark.parametrize(
+    "format, compression", [("rar", None), ("tar", "deflate"), ("zip", "gzip")]
+)
+def test_pack_bad_format(file_seq_for_operation, format, compression):
+    seq, dst = file_seq_for_operation
+    with pytest.raises(ValueError):
+        seq.pack(dst / "archive", format, compression)
@@ -0,0 +1,170 @@
+import argparse
+import json
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+
+from perfsprocket import FileSequence
+from perfsprocket._cli import byte_rate, main
+
+
+@pytest.fixture
+def spec(file_seq_for_operation) -> str:
+    return file_seq_for_operation[0].to_spec()
+
+
+def run(capsys, *args: str) -> list:
+    assert main(["--json" if arg == "JSON" else arg for arg in args]) == 0
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_ls(capsys, file_seq_for_operation):
+    folder = file_seq_for_operation[0].path.parent
+    (folder / "notes.txt").touch()
+
+    records = run(capsys, "ls", "JSON", str(folder))
+
+    assert [record["type"] for record in records] == ["FileSequence", "File"]
+    assert records[0]["files"] == 101
+    assert records[0]["spec"] == file_seq_for_operation[0].to_spec()
+
+
+def test_ls_text(capsys, file_seq_for_operation):
+    folder = file_seq_for_operation[0].path.parent
+    assert main(["ls", "--workers", "1", str(folder)]) == 0
+    assert capsys.readouterr().out == file_seq_for_operation[0].to_spec() + "\n"
+
+
+def test_cp(capsys, file_seq_for_operation, spec):
+    dst = file_seq_for_operation[1]
+
+    records = run(capsys, "cp", "JSON", spec, str(dst))
+
+    assert records == [
+        {"op": "cp", "src": spec, "dst": str(dst / Path(spec).name)},
+    ]
+    assert all(path.is_file() for path in FileSequence.from_spec(records[0]["dst"]))
+
+
+def test_cp_link_workers(capsys, file_seq_for_operation, spec):
+    src, dst = file_seq_for_operation
+
+    run(capsys, "cp", "JSON", "--link", "hard", "--workers", "2", spec, str(dst))
+
+    assert (dst / src.path.name).stat().st_nlink == 2
+
+
+def test_cp_limit_rate(capsys, file_seq_for_operation, spec):
+    dst = file_seq_for_operation[1]
+
+    limits = ["--limit-rate", "1G", "--limit-files", "1e6"]
+    run(capsys, "cp", "JSON", *limits, spec, str(dst))
+
+    assert len(list(dst.iterdir())) == 101
+
+
+@pytest.mark.parametrize(
+    "arg, rate", [("512", 512), ("500K", 500 << 10), ("1.5mb", 1.5 * (1 << 20))]
+)
+def test_byte_rate(arg, rate):
+    assert byte_rate(arg) == rate
+
+
+@pytest.mark.parametrize("arg", ["fast", "0", "-1M"])
+def test_byte_rate_invalid(arg):
+    with pytest.raises(argparse.ArgumentTypeError):
+        byte_rate(arg)
+
+
+def test_cp_dry_run(capsys, file_seq_for_operation, spec):
+    dst = file_seq_for_operation[1]
+
+    records = run(capsys, "cp", "JSON", "--dry-run", spec, str(dst))
+
+    assert len(records) == 101
+    assert records[0]["dst"] == str(dst / "file.100.txt")
+    assert not list(dst.iterdir())
+
+
+def test_mv_rm(capsys, file_seq_for_operation, spec):
+    dst = file_seq_for_operation[1]
+    run(capsys, "mv", "JSON", spec, str(dst))
+    assert not list(file_seq_for_operation[0].path.parent.iterdir())
+
+    moved = str(dst / Path(spec).name)
+    assert len(run(capsys, "rm", "JSON", "-n", moved)) == 101
+    assert len(list(dst.iterdir())) == 101
+
+    assert len(run(capsys, "rm", "JSON", moved)) == 101
+    assert not list(dst.iterdir())
+
+
+def test_renumber(capsys, file_seq_for_operation, spec):
+    folder = file_seq_for_operation[0].path.parent
+
+    records = run(capsys, "renumber", "JSON", "-n", spec, "--start", "1", "--pad", "4")
+    assert records[0] == {
+        "op": "renumber",
+        "src": str(folder / "file.100.txt"),
+        "dst": str(folder / "file.0001.txt"),
+    }
+    assert (folder / "file.100.txt").is_file()
+
+    records = run(capsys, "renumber", "JSON", spec, "--start", "1001")
+    assert len(records) == 101
+    assert (folder / "file.1001.txt").is_file()
+    assert not (folder / "file.100.txt").exists()
+
+
+def test_verify(capsys, file_seq_for_operation, spec):
+    dst = file_seq_for_operation[1]
+    run(capsys, "cp", "JSON", spec, str(dst))
+
+    records = run(capsys, "verify", "JSON", spec, str(dst))
+    assert {record["status"] for record in records} == {"ok"}
+
+    (dst / "file.150.txt").write_text("changed")
+    (dst / "file.151.txt").unlink()
+
+    assert main(["verify", "--json", spec, str(dst)]) == 1
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    statuses = {Path(record["dst"]).name: record["status"] for record in records}
+    assert statuses["file.150.txt"] == "mismatch"
+    assert statuses["file.151.txt"] == "missing"
+    assert statuses["file.152.txt"] == "ok"
+
+
+def test_du(capsys, file_seq_for_operation, spec):
+    folder = file_seq_for_operation[0].path.parent
+    sizes = sum(path.stat().st_size for path in folder.iterdir())
+
+    records = run(capsys, "du", "JSON", "--workers", "2", str(folder))
+
+    assert records[0]["path"] == spec
+    assert records[0]["files"] == 101
+    assert records[0]["apparent"] == sizes
+    assert records[-1]["path"] is None
+    assert records[-1]["apparent"] == sizes
+
+    records = run(capsys, "du", "JSON", spec)
+    assert records[0]["apparent"] == sizes
+
+
+def test_error(capsys, tmp_path):
+    assert main(["rm", str(tmp_path / "missing.txt")]) == 1
+    assert "missing.txt" in capsys.readouterr().err
+
+
+def test_renumber_not_sequence(capsys, tmp_path):
+    assert main(["renumber", str(tmp_path / "file.txt"), "--start", "1"]) == 1
+
+
+def test_module_entry_point():
+    result = subprocess.run(
+        [sys.executable, "-m", "perfsprocket", "--help"],
+        stdout=subprocess.PIPE,
+        cwd=str(Path(__file__).parents[2]),
+    )
+    assert result.returncode == 0
+    assert b"renumber" in result.stdout
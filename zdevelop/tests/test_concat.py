@@ -0,0 +1,149 @@
+import pytest
+from pathlib import Path
+
+from perfsprocket import FileSequence, MemoryStorage, Transaction
+
+
+@pytest.fixture
+def storage() -> MemoryStorage:
+    storage = MemoryStorage()
+    for base, end in (("shot_a", 1100), ("shot_b", 1050)):
+        storage.create_files(
+            Path(f"/shots/{base}.{frame:04}.exr") for frame in range(1001, end + 1)
+        )
+    storage.write_bytes("/shots/shot_b.1050.exr", b"last")
+    storage.mkdir("/edit")
+    return storage
+
+
+@pytest.fixture
+def shot_a(storage) -> FileSequence:
+    return FileSequence("/shots/shot_a.####.exr", 1001, 1100, storage=storage)
+
+
+@pytest.fixture
+def shot_b(storage) -> FileSequence:
+    return FileSequence("/shots/shot_b.####.exr", 1001, 1050, storage=storage)
+
+
+def test_concat_in_place(storage, shot_a, shot_b):
+    joined = FileSequence.concat(shot_a, shot_b)
+
+    assert joined.to_spec() == "/shots/shot_a.[1001-1150].exr"
+    assert storage.read_bytes(Path("/shots/shot_a.1150.exr")) == b"last"
+    assert len(storage.list_names(Path("/shots"))) == 150
+
+
+def test_concat_renumber(storage, shot_a, shot_b):
+    # new names of shot_a's frames are taken by each other, so renames are ordered.
+    joined = FileSequence.concat(shot_a, shot_b, start=1051)
+
+    assert joined.to_spec() == "/shots/shot_a.[1051-1200].exr"
+    assert storage.read_bytes(Path("/shots/shot_a.1200.exr")) == b"last"
+
+
+def test_concat_other_folder(storage, shot_a, shot_b):
+    joined = FileSequence.concat(
+        shot_a, shot_b, name="edit.0001.exr", folder="/edit", mode="copy"
+    )
+
+    assert joined.to_spec() == "/edit/edit.[0001-0150].exr"
+    assert len(storage) == 300
+
+
+def test_concat_collision(storage, shot_a, shot_b):
+    storage.create_files([Path("/edit/edit.0150.exr")])
+
+    with pytest.raises(FileExistsError):
+        FileSequence.concat(shot_a, shot_b, name="edit.0001.exr", folder="/edit")
+    assert len(storage.list_names(Path("/edit"))) == 1
+    assert len(storage.list_names(Path("/shots"))) == 150
+
+
+def test_concat_missing(storage, shot_a, shot_b):
+    storage.delete(Path("/shots/shot_b.1025.exr"))
+    with pytest.raises(FileNotFoundError):
+        FileSequence.concat(shot_a, shot_b, folder="/edit")
+    assert storage.list_names(Path("/edit")) == []
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(mode="teleport"), dict(mode="copy", transaction=Transaction())],
+)
+def test_concat_invalid(shot_a, shot_b, kwargs):
+    with pytest.raises(ValueError):
+        FileSequence.concat(shot_a, shot_b, folder="/edit", **kwargs)
+
+
+def test_concat_twice(shot_a):
+    with pytest.raises(ValueError):
+        FileSequence.concat(shot_a, shot_a)
+
+
+def test_concat_rollback(storage, shot_a, shot_b):
+    with pytest.raises(RuntimeError):
+        with Transaction() as transaction:
+            FileSequence.concat(shot_a, shot_b, start=1, transaction=transaction)
+            raise RuntimeError
+
+    assert len(storage.list_names(Path("/shots"))) == 150
+    assert storage.read_bytes(Path("/shots/shot_b.1050.exr")) == b"last"
+
+
+def test_concat_link(file_seq_for_operation):
+    seq, dst = file_seq_for_operation
+    first, second = seq[:50], seq[50:]
+
+    joined = FileSequence.concat(first, second, start=1, folder=dst, mode="hard")
+
+    assert joined.to_spec() == str(dst / "file.[001-101].txt")
+    assert (dst / "file.101.txt").stat().st_nlink == 2
+
+
+def test_split_without_renames(storage, shot_a):
+    pieces = shot_a.split(at=[1051, 1081])
+
+    assert [piece.to_spec() for piece in pieces] == [
+        "/shots/shot_a.[1001-1050].exr",
+        "/shots/shot_a.[1051-1080].exr",
+        "/shots/shot_a.[1081-1100].exr",
+    ]
+
+
+def test_split_reels(storage, shot_a):
+    reels = shot_a.split(
+        at=[1051], start=1, names=["reel_1.####.exr", "reel_2.####.exr"]
+    )
+
+    assert [reel.to_spec() for reel in reels] == [
+        "/shots/reel_1.[0001-0050].exr",
+        "/shots/reel_2.[0001-0050].exr",
+    ]
+    assert sorted(storage.list_names(Path("/shots")))[100:] == [
+        f"shot_b.{frame}.exr" for frame in range(1001, 1051)
+    ]
+
+
+def test_split_stepped(storage, shot_a):
+    pieces = shot_a[::2].split(at=[1051], folder="/edit", mode="copy")
+
+    assert [piece.to_spec() for piece in pieces] == [
+        "/edit/shot_a.[1001-1049x2].exr",
+        "/edit/shot_a.[1051-1099x2].exr",
+    ]
+    assert len(storage.list_names(Path("/edit"))) == 50
+
+
+@pytest.mark.parametrize("at", [[1001], [1200], [1050.5]])
+def test_split_outside(shot_a, at):
+    with pytest.raises(IndexError):
+        shot_a.split(at=at)
+
+
+def test_split_same_names(storage, shot_a):
+    with pytest.raises(ValueError):
+        shot_a.split(at=[1051], start=1)
+    with pytest.raises(ValueError):
+        shot_a.split(at=[1051], names=["reel_1.####.exr"])
+    assert len(storage) == 150
@@ -0,0 +1,320 @@
+import pytest
+import errno
+import mmap
+import os
+import shutil
+import stat
+import threading
+from pathlib import Path
+
+from perfsprocket import BufferedEngine, ShutilEngine, LinkEngine, FileSequence, File
+from perfsprocket import _copy_engine
+
+
+PAGE = mmap.PAGESIZE
+
+
+@pytest.fixture
+def sized_files(tmp_path):
+    """source files of sizes around the buffer boundaries, and destination folder"""
+    src_folder = tmp_path / "src"
+    dst_folder = tmp_path / "dst"
+    src_folder.mkdir()
+    dst_folder.mkdir()
+
+    sizes = [0, 1, PAGE - 1, PAGE, PAGE + 1, PAGE * 5 + 17]
+    pairs = list()
+    for i, size in enumerate(sizes):
+        src = src_folder / f"file.{i}.bin"
+        src.write_bytes(os.urandom(size))
+        src.chmod(0o640)
+        pairs.append((src, dst_folder / src.name))
+
+    return pairs
+
+
+class TestBufferedEngine:
+    def test_block_size_rounded(self):
+        assert BufferedEngine(block_size=1).block_size == PAGE
+        assert BufferedEngine(block_size=PAGE + 1).block_size == PAGE * 2
+
+    @pytest.mark.parametrize("block_size,queue_size", [(0, 1), (PAGE, 0)])
+    def test_invalid_raises(self, block_size, queue_size):
+        with pytest.raises(ValueError):
+            BufferedEngine(block_size=block_size, queue_size=queue_size)
+
+    @pytest.mark.parametrize(
+        "engine",
+        [
+            ShutilEngine(),
+            BufferedEngine(block_size=PAGE, queue_size=1),
+            BufferedEngine(block_size=PAGE, queue_size=3),
+            BufferedEngine(block_size=PAGE * 2, queue_size=2, fadvise=False),
+        ],
+    )
+    def test_copy_pairs(self, sized_files, engine):
+        copied = list(engine.copy_pairs(iter(sized_files)))
+
+        assert copied == [dst for _, dst in sized_files]
+        for src, dst in sized_files:
+            assert dst.read_bytes() == src.read_bytes()
+            assert stat.S_IMODE(dst.stat().st_mode) == stat.S_IMODE(src.stat().st_mode)
+
+    def test_close_early_stops_threads(self, sized_files):
+        threads_before = threading.active_count()
+        engine = BufferedEngine(block_size=PAGE, queue_size=1)
+
+        copying = engine.copy_pairs(iter(sized_files))
+        assert next(copying) == sized_files[0][1]
+        copying.close()
+
+        assert threading.active_count() == threads_before
+
+    def test_missing_source_raises(self, sized_files):
+        src, dst = sized_files[-1]
+        src.unlink()
+
+        engine = BufferedEngine(block_size=PAGE)
+        with pytest.raises(FileNotFoundError):
+            list(engine.copy_pairs(iter(sized_files)))
+
+    def test_same_file_raises(self, sized_files):
+        # copying a folder onto itself must not truncate the sources.
+        pairs = [(src, src) for src, _ in sized_files]
+        data = [src.read_bytes() for src, _ in pairs]
+
+        engine = BufferedEngine(block_size=PAGE, queue_size=1)
+        with pytest.raises(shutil.SameFileError):
+            list(engine.copy_pairs(iter(pairs)))
+
+        assert [src.read_bytes() for src, _ in pairs] == data
+
+    def test_hard_linked_destination_raises(self, sized_files):
+        src, dst = sized_files[-1]
+        os.link(str(src), str(dst))
+        data = src.read_bytes()
+
+        with pytest.raises(shutil.SameFileError):
+            list(BufferedEngine(block_size=PAGE).copy_pairs([(src, dst)]))
+        assert src.read_bytes() == data
+
+    def test_replaces_existing(self, sized_files, tmp_path):
+        # existing destinations are replaced whole, so other links to them keep
+        #   their old data.
+        src, dst = sized_files[-1]
+        dst.write_bytes(b"old")
+        other = tmp_path / "other.bin"
+        os.link(str(dst), str(other))
+
+        list(BufferedEngine(block_size=PAGE).copy_pairs([(src, dst)]))
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert other.read_bytes() == b"old"
+        assert sorted(os.listdir(str(dst.parent))) == [dst.name]
+
+    def test_missing_destination_raises(self, sized_files, tmp_path):
+        pairs = [(src, tmp_path / "missing" / src.name) for src, _ in sized_files]
+
+        engine = BufferedEngine(block_size=PAGE)
+        with pytest.raises(FileNotFoundError):
+            list(engine.copy_pairs(iter(pairs)))
+
+
+@pytest.mark.parametrize("use_iter", [True, False])
+def test_sequence_copy(file_seq_for_operation, use_iter):
+    src, dst = file_seq_for_operation
+    engine = BufferedEngine(block_size=PAGE, queue_size=2)
+
+    if use_iter:
+        items = list(src.copy_iter(dst, engine=engine))
+        new_seq = items.pop(-1)
+        assert items == list(new_seq)
+    else:
+        new_seq = src.copy(dst, engine=engine)
+
+    assert isinstance(new_seq, FileSequence)
+    for old, new in zip(src, new_seq):
+        assert new.read_text() == old.read_text()
+
+
+def test_file_copy(single_file_for_operation):
+    src, dst = single_file_for_operation
+    src.path.write_text("contents")
+
+    new_file = src.copy(dst, engine=BufferedEngine())
+
+    assert isinstance(new_file, File)
+    assert new_file.path == Path(dst) / "file.txt"
+    assert new_file.path.read_text() == "contents"
+
+
+@pytest.mark.parametrize("block_size", [PAGE, PAGE * 2])
+def test_direct(sized_files, block_size):
+    engine = BufferedEngine(block_size=block_size, queue_size=2, direct=True)
+    list(engine.copy_pairs(iter(sized_files)))
+
+    for src, dst in sized_files:
+        assert dst.read_bytes() == src.read_bytes()
+
+
+class TestLinkEngine:
+    @pytest.mark.parametrize("kwargs", [{"mode": "soft"}, {"workers": 0}])
+    def test_invalid_raises(self, kwargs):
+        with pytest.raises(ValueError):
+            LinkEngine(**kwargs)
+
+    def test_hard(self, sized_files):
+        engine = LinkEngine("hard", workers=2)
+        copied = list(engine.copy_pairs(iter(sized_files)))
+
+        assert copied == [dst for _, dst in sized_files]
+        for src, dst in sized_files:
+            assert os.path.samefile(str(src), str(dst))
+
+    def test_sym(self, sized_files):
+        engine = LinkEngine("sym", workers=2)
+        list(engine.copy_pairs(iter(sized_files)))
+
+        for src, dst in sized_files:
+            assert dst.is_symlink()
+            assert Path(os.readlink(str(dst))).is_absolute()
+            assert dst.read_bytes() == src.read_bytes()
+
+    def test_reflink(self, sized_files):
+        # Falls back to copying where the filesystem cannot clone.
+        engine = LinkEngine("reflink", workers=2)
+        list(engine.copy_pairs(iter(sized_files)))
+
+        for src, dst in sized_files:
+            assert not dst.is_symlink()
+            assert dst.read_bytes() == src.read_bytes()
+            assert stat.S_IMODE(dst.stat().st_mode) == stat.S_IMODE(src.stat().st_mode)
+
+    def test_replaces_existing(self, sized_files):
+        for _, dst in sized_files:
+            dst.write_bytes(b"old")
+
+        list(LinkEngine("hard").copy_pairs(iter(sized_files)))
+
+        for src, dst in sized_files:
+            assert os.path.samefile(str(src), str(dst))
+
+    @pytest.mark.parametrize("mode", ["hard", "sym"])
+    def test_same_file_raises(self, sized_files, mode):
+        # linking a folder onto itself must leave the sources untouched.
+        pairs = [(src, src) for src, _ in sized_files]
+        data = [src.read_bytes() for src, _ in pairs]
+
+        with pytest.raises(shutil.SameFileError):
+            list(LinkEngine(mode, workers=2).copy_pairs(iter(pairs)))
+
+        for (src, _), src_data in zip(pairs, data):
+            assert not src.is_symlink()
+            assert src.read_bytes() == src_data
+
+    def test_replaces_existing_keeps_other_links(self, sized_files, tmp_path):
+        src, dst = sized_files[-1]
+        dst.write_bytes(b"old")
+        other = tmp_path / "other.bin"
+        os.link(str(dst), str(other))
+
+        list(LinkEngine("sym").copy_pairs([(src, dst)]))
+
+        assert dst.is_symlink()
+        assert other.read_bytes() == b"old"
+        assert sorted(os.listdir(str(dst.parent))) == [dst.name]
+
+    def test_cross_device_fallback(self, sized_files, monkeypatch):
+        def link(src, dst):
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+        monkeypatch.setattr(_copy_engine.os, "link", link)
+
+        engine = LinkEngine("hard", fallback=BufferedEngine(block_size=PAGE))
+        list(engine.copy_pairs(iter(sized_files)))
+
+        for src, dst in sized_files:
+            assert not os.path.samefile(str(src), str(dst))
+            assert dst.read_bytes() == src.read_bytes()
+
+    def test_fallback_one_stream(self, sized_files, monkeypatch):
+        link = os.link
+
+        def link_odd(src, dst):
+            if int(Path(src).name.split(".")[1]) % 2:
+                raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+            link(src, dst)
+
+        monkeypatch.setattr(_copy_engine.os, "link", link_odd)
+        fallback = BufferedEngine(block_size=PAGE)
+        calls = list()
+        copy_pairs = fallback.copy_pairs
+
+        def record(pairs):
+            calls.append(pairs)
+            return copy_pairs(pairs)
+
+        monkeypatch.setattr(fallback, "copy_pairs", record)
+
+        engine = LinkEngine("hard", workers=3, fallback=fallback)
+        copied = list(engine.copy_pairs(iter(sized_files)))
+
+        # unlinked pairs share one pipeline, and results keep the input order.
+        assert len(calls) == 1
+        assert copied == [dst for _, dst in sized_files]
+        for i, (src, dst) in enumerate(sized_files):
+            assert os.path.samefile(str(src), str(dst)) is (i % 2 == 0)
+            assert dst.read_bytes() == src.read_bytes()
+
+    def test_fallback_error_raises(self, sized_files, monkeypatch):
+        def link(src, dst):
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+        monkeypatch.setattr(_copy_engine.os, "link", link)
+        sized_files[2][0].unlink()
+
+        with pytest.raises(FileNotFoundError):
+            list(LinkEngine("hard").copy_pairs(iter(sized_files)))
+
+    def test_error_raises(self, sized_files):
+        src, _ = sized_files[-1]
+        src.unlink()
+
+        with pytest.raises(FileNotFoundError):
+            list(LinkEngine("hard").copy_pairs(iter(sized_files)))
+
+    def test_many_pairs_in_order(self, tmp_path):
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"data")
+        pairs = [(src, tmp_path / f"link.{i}.bin") for i in range(100)]
+
+        copied = list(LinkEngine("hard", workers=3).copy_pairs(iter(pairs)))
+
+        assert copied == [dst for _, dst in pairs]
+
+
+@pytest.mark.parametrize("link", ["hard", "sym", "reflink"])
+def test_sequence_copy_link(file_seq_for_operation, link):
+    src, dst = file_seq_for_operation
+
+    new_seq = src.copy(dst, link=link)
+
+    assert isinstance(new_seq, FileSequence)
+    for old, new in zip(src, new_seq):
+        assert new.read_text() == old.read_text()
+        assert os.path.samefile(str(old), str(new)) == (link != "reflink")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(engine=BufferedEngine(block_size=PAGE)), dict(link="hard"), dict(link="sym")],
+)
+def test_sequence_copy_same_folder(file_seq_for_operation, kwargs):
+    src, _ = file_seq_for_operation
+    data = [path.read_bytes() for path in src]
+
+    with pytest.raises(shutil.SameFileError):
+        src.copy(src.path.parent, **kwargs)
+
+    assert [path.read_bytes() for path in src] == data
+    assert not any(path.is_symlink() for path in src)
@@ -0,0 +1,119 @@
+import pytest
+from pathlib import Path
+
+from perfsprocket import (
+    File,
+    FileSequence,
+    NamePatterns,
+    ProcessBackend,
+    find_sequences,
+    usage,
+)
+
+
+@pytest.fixture
+def mixed_folder(tmp_path) -> Path:
+    """folder of sequences with gaps, unpadded and mid-name frames, and loose files"""
+    names = (
+        [f"plate.{i:04d}.exr" for i in range(1, 11)]
+        + [f"plate.{i:04d}.exr" for i in range(20, 31)]
+        + [f"render_{i}.tif" for i in range(5, 12)]
+        + [f"shot_{i:04d}_v001.exr" for i in range(100, 103)]
+        + ["notes.txt", "single.0001.exr", "plate.####.exr"]
+    )
+    for name in names:
+        (tmp_path / name).touch()
+    (tmp_path / "sub.0001.exr").mkdir()
+
+    return tmp_path
+
+
+def expected_files(folder: Path) -> list:
+    return [
+        File(folder / "notes.txt"),
+        FileSequence(folder / "plate.####.exr", 1, 10),
+        FileSequence(folder / "plate.####.exr", 20, 30),
+        File(folder / "plate.####.exr"),
+        FileSequence(folder / "render_#.tif", 5, 11),
+        FileSequence(folder / "shot_####_v001.exr", 100, 102),
+        File(folder / "single.0001.exr"),
+    ]
+
+
+def assert_same_files(found: list, expected: list) -> None:
+    assert sorted(map(repr, found)) == sorted(map(repr, expected))
+    for item in found:
+        assert len(list(item)) == len(item)
+        assert all(path.is_file() for path in item)
+
+
+def test_find_sequences(mixed_folder):
+    found = find_sequences(mixed_folder)
+    assert_same_files(found, expected_files(mixed_folder))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+def test_find_sequences_backend(mixed_folder, chunk_size):
+    with ProcessBackend(workers=2, chunk_size=chunk_size) as backend:
+        found = find_sequences(mixed_folder, backend=backend)
+
+    assert_same_files(found, expected_files(mixed_folder))
+
+
+def test_find_sequences_patterns(tmp_path):
+    for i in range(1, 4):
+        (tmp_path / f"plate-v{i}.exr").touch()
+
+    patterns = NamePatterns(
+        [("version", r"(?P<base>.+)(?P<sep>-v)(?P<start>\d+)(?P<extension>\..+)")]
+    )
+
+    found = find_sequences(tmp_path, patterns=patterns)
+    assert len(found) == 1
+    assert found[0].start == 1
+    assert found[0].end == 3
+    assert list(found[0]) == [tmp_path / f"plate-v{i}.exr" for i in range(1, 4)]
+
+    with ProcessBackend(workers=2, chunk_size=1) as backend:
+        found_parallel = find_sequences(tmp_path, patterns=patterns, backend=backend)
+    assert sorted(map(repr, found_parallel)) == sorted(map(repr, found))
+
+
+@pytest.fixture
+def mixed_padding(tmp_path) -> Path:
+    names = [
+        "p.1.exr",
+        "p.0002.exr",
+        "p.0003.exr",
+        "q.0998.exr",
+        "q.0999.exr",
+        "q.1000.exr",
+        "q.1001.exr",
+        "r.8.exr",
+        "r.9.exr",
+        "r.10.exr",
+        "s.[0001].exr",
+    ]
+    for name in names:
+        (tmp_path / name).write_bytes(b"xx")
+    return tmp_path
+
+
+def test_find_sequences_mixed_padding(mixed_padding):
+    found = find_sequences(mixed_padding)
+
+    assert_same_files(
+        found,
+        [
+            File(mixed_padding / "p.1.exr"),
+            FileSequence(mixed_padding / "p.####.exr", 2, 3),
+            FileSequence(mixed_padding / "q.####.exr", 998, 1001),
+            FileSequence(mixed_padding / "r.#.exr", 8, 10),
+            File(mixed_padding / "s.[0001].exr"),
+        ],
+    )
+
+
+def test_usage_mixed_padding(mixed_padding):
+    found = usage(mixed_padding)
+    assert sum(used.files for _, used in found) == 11
@@ -0,0 +1,82 @@
+import os
+import pytest
+from pathlib import Path
+
+from perfsprocket import File, FileSequence, LinkEngine, find_duplicates
+from perfsprocket import _duplicates
+
+
+def write_seq(folder: Path, base: str, frames: list) -> None:
+    folder.mkdir(parents=True, exist_ok=True)
+    for i, data in enumerate(frames, start=1):
+        (folder / f"{base}.{i:04d}.exr").write_bytes(data)
+
+
+@pytest.fixture
+def project(tmp_path) -> Path:
+    frames = [bytes([i]) * (1000 + i) for i in range(5)]
+    write_seq(tmp_path / "a", "plate", frames)
+    write_seq(tmp_path / "b" / "c", "copy", frames)
+
+    # same sizes, different contents in the middle of a frame.
+    changed = list(frames)
+    changed[2] = changed[2][:500] + b"x" + changed[2][501:]
+    write_seq(tmp_path / "d", "changed", changed)
+
+    # same sizes and contents except for the first frame.
+    write_seq(tmp_path / "e", "other", [b"y" * 1000] + frames[1:])
+
+    (tmp_path / "a" / "notes.txt").write_bytes(b"notes")
+    (tmp_path / "b" / "notes_copy.txt").write_bytes(b"notes")
+    (tmp_path / "b" / "empty_1.txt").touch()
+    (tmp_path / "b" / "empty_2.txt").touch()
+    return tmp_path
+
+
+def names(groups: list) -> list:
+    return [[str(item.path.name) for item in group] for group in groups]
+
+
+@pytest.mark.parametrize("block_size", [16, 1 << 16])
+def test_find_duplicates(project, block_size):
+    groups = find_duplicates([project], workers=2, block_size=block_size)
+
+    assert names(groups) == [
+        ["notes.txt", "notes_copy.txt"],
+        ["plate.0001.exr", "copy.0001.exr"],
+    ]
+    assert isinstance(groups[0][0], File)
+    assert isinstance(groups[1][0], FileSequence)
+    assert len(groups[1][0]) == 5
+
+
+def test_find_duplicates_partial_only(project, monkeypatch):
+    full_hashed = list()
+    original = _duplicates.full_digest
+
+    def spy(item, algorithm):
+        full_hashed.append(item)
+        return original(item, algorithm)
+
+    monkeypatch.setattr(_duplicates, "full_digest", spy)
+
+    find_duplicates([project / "a", project / "b"], block_size=1 << 16)
+    assert not full_hashed
+
+    find_duplicates([project / "a", project / "b"], block_size=16)
+    assert len(full_hashed) == 2
+
+
+def test_find_duplicates_linked(project):
+    groups = find_duplicates([project])
+    keep, duplicate = groups[1]
+
+    list(LinkEngine("hard").copy_pairs(zip(keep, duplicate)))
+
+    assert all(os.path.samefile(a, b) for a, b in zip(keep, duplicate))
+    assert names(find_duplicates([project])) == [["notes.txt", "notes_copy.txt"]]
+
+
+def test_find_duplicates_none(tmp_path):
+    write_seq(tmp_path, "plate", [b"a", b"b"])
+    assert find_duplicates([tmp_path]) == []
@@ -0,0 +1,138 @@
+import pytest
+from pathlib import Path
+
+from perfsprocket import Durability, FileSequence, MemoryStorage
+from perfsprocket import _durability, _storage
+
+
+@pytest.fixture
+def flush_calls(monkeypatch):
+    """records fsync and syncfs calls instead of making them"""
+    calls = {"file": list(), "folder": list(), "syncfs": list()}
+
+    monkeypatch.setattr(_storage, "fsync_path", calls["file"].append)
+    monkeypatch.setattr(_storage, "fsync_folder", calls["folder"].append)
+
+    def syncfs_path(path: Path) -> bool:
+        calls["syncfs"].append(path)
+        return True
+
+    monkeypatch.setattr(_storage, "syncfs_path", syncfs_path)
+    return calls
+
+
+class TestDurability:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"mode": "sometimes"},
+            {"mode": "batch", "batch_frames": 0},
+            {"mode": "batch", "batch_bytes": -1},
+        ],
+    )
+    def test_invalid_raises(self, kwargs):
+        with pytest.raises(ValueError):
+            Durability(**kwargs)
+
+    def test_default_batch_limits(self):
+        durability = Durability("batch")
+        assert durability.batch_frames == _durability.DEFAULT_BATCH_FRAMES
+        assert durability.batch_bytes == _durability.DEFAULT_BATCH_BYTES
+
+    def test_none(self, file_seq_for_operation, flush_calls):
+        src, dst = file_seq_for_operation
+        src.copy(dst, durability=Durability("none"))
+
+        assert flush_calls == {"file": [], "folder": [], "syncfs": []}
+
+    def test_fsync_each(self, file_seq_for_operation, flush_calls):
+        src, dst = file_seq_for_operation
+        new_seq = src.copy(dst, durability=Durability("fsync"))
+
+        assert flush_calls["file"] == list(new_seq)
+        assert flush_calls["folder"] == [Path(dst)] * len(new_seq)
+        assert flush_calls["syncfs"] == []
+
+    def test_batch_frames(self, file_seq_for_operation, flush_calls):
+        src, dst = file_seq_for_operation
+        copying = src.copy_iter(dst, durability=Durability("batch", batch_frames=40))
+
+        # Frames are only reported once their whole batch is flushed.
+        next(copying)
+        assert len(list(Path(dst).iterdir())) == 40
+        assert len(flush_calls["syncfs"]) == 1
+
+        items = list(copying)
+        assert isinstance(items[-1], FileSequence)
+        # 101 frames: two full batches and the remainder.
+        assert len(flush_calls["syncfs"]) == 3
+        assert flush_calls["folder"] == [Path(dst)] * 3
+        assert flush_calls["file"] == []
+
+    def test_batch_bytes(self, file_seq_for_operation, flush_calls):
+        src, dst = file_seq_for_operation
+        for path in src:
+            path.write_bytes(b"x" * 10)
+
+        src.copy(dst, durability=Durability("batch", batch_bytes=500))
+
+        # 50 frames per batch: two full batches and the remainder.
+        assert len(flush_calls["syncfs"]) == 3
+
+    def test_batch_fsync_fallback(
+        self, file_seq_for_operation, flush_calls, monkeypatch
+    ):
+        monkeypatch.setattr(_storage, "syncfs_path", lambda path: False)
+
+        src, dst = file_seq_for_operation
+        new_seq = src.copy(dst, durability=Durability("batch", batch_frames=40))
+
+        assert flush_calls["file"] == list(new_seq)
+
+    @pytest.mark.parametrize("mode", ["fsync", "batch"])
+    def test_move_flushes_folders(self, file_seq_for_operation, flush_calls, mode):
+        src, dst = file_seq_for_operation
+        src_folder = src.path.parent
+
+        src.move(dst, durability=Durability(mode))
+
+        assert flush_calls["file"] == []
+        assert flush_calls["syncfs"] == []
+        assert set(flush_calls["folder"]) == {Path(dst), src_folder}
+
+    @pytest.mark.parametrize("mode", ["none", "fsync", "batch"])
+    def test_real_flush(self, file_seq_for_operation, mode):
+        src, dst = file_seq_for_operation
+        new_seq = src.copy(dst, durability=Durability(mode, batch_frames=30))
+
+        for old, new in zip(src, new_seq):
+            assert new.read_text() == old.read_text()
+
+    @pytest.mark.parametrize("mode", ["fsync", "batch"])
+    def test_other_storage(self, flush_calls, mode):
+        storage = RecordingStorage()
+        storage.create_files(Path(f"/src/plate.{frame:04}.exr") for frame in range(10))
+        storage.mkdir("/dst")
+        src = FileSequence("/src/plate.####.exr", 0, 9, storage=storage)
+
+        new_seq = src.copy("/dst", durability=Durability(mode, batch_frames=4))
+
+        # flushed through the storage, not with local fsyncs.
+        assert storage.synced == list(new_seq)
+        assert set(storage.folders) == {Path("/dst")}
+        assert flush_calls == {"file": [], "folder": [], "syncfs": []}
+
+
+class RecordingStorage(MemoryStorage):
+    """records the paths and folders it is asked to flush"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.synced: list = list()
+        self.folders: list = list()
+
+    def sync(self, path: Path) -> None:
+        self.synced.append(path)
+
+    def sync_folder(self, folder: Path) -> None:
+        self.folders.append(folder)
@@ -3,7 +3,17 @@ from pathlib import Path
 from unittest import mock
 from dataclasses import fields, Field
 
-from perfsprocket import ARROW, PAREN, BRACKET, CURLY, SeqName, Braces, FileName, KEEP
+from perfsprocket import (
+    ARROW,
+    PAREN,
+    BRACKET,
+    CURLY,
+    SeqName,
+    Braces,
+    FileName,
+    KEEP,
+    FrameSet,
+)
 from perfsprocket._file_name import (
     _num_end_from_match,
     _padding_from_match,
@@ -445,3 +455,61 @@ class TestSequenceName:
         seq_name = SeqName("name", "exr")
         with pytest.raises(AttributeError):
             seq_name.base = "file"
+
+
+class TestFormatFrames:
+    @staticmethod
+    def expected(name: SeqName, frames) -> list:
+        return [str(name.alter(start=int(num), end=None)) for num in frames]
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            SeqName("plate", ".exr", start=1001, pad=4),
+            SeqName("plate", ".exr", start="#", end="#", pad=4, brackets=BRACKET),
+            SeqName("plate", None, delim="_", pad=0),
+            SeqName("100%_plate", ".exr", pad=3),
+            SeqName("pläte", ".exr", pad=3),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "frames",
+        [
+            range(1, 11),
+            range(990, 10010),
+            range(10010, 990, -7),
+            [5, 100000, 3, 42] * 2000,
+            [-5, 3],
+            [],
+            FrameSet([(1, 3), (7, 9)]),
+            FrameSet([(1, 5000), (9000, 12000)]),
+        ],
+    )
+    def test_matches_alter(self, name, frames):
+        assert name.format_frames(frames) == self.expected(name, frames)
+
+    def test_iterator(self):
+        name = SeqName("plate", ".exr", pad=4)
+        frames = (x for x in range(1, 10))
+        assert name.format_frames(frames) == self.expected(name, range(1, 10))
+
+    @pytest.mark.parametrize("frames", [range(98, 103), range(1, 10001)])
+    @pytest.mark.parametrize("join", ["\n", ",", ""])
+    def test_join(self, frames, join):
+        name = SeqName("plate", ".exr", pad=3)
+        assert name.format_frames(frames, join=join) == join.join(
+            self.expected(name, frames)
+        )
+
+    def test_numpy_array(self):
+        np = pytest.importorskip("numpy")
+        name = SeqName("plate", ".exr", pad=4)
+        frames = np.arange(1, 20001, 3)
+        assert name.format_frames(frames) == self.expected(name, frames)
+
+    def test_numpy_array_fallback(self):
+        # below the numpy threshold, arrays take the python path.
+        np = pytest.importorskip("numpy")
+        name = SeqName("plate", ".exr", pad=4)
+        frames = np.array([3, 1, 2])
+        assert name.format_frames(frames) == self.expected(name, [3, 1, 2])
@@ -4,7 +4,7 @@ import os
 from itertools import count
 from pathlib import Path
 
-from perfsprocket import FileSequence, SeqName, FileName
+from perfsprocket import FileSequence, SeqName, FileName, FrameSet, MemoryStorage
 
 
 class TestSeqDunder:
@@ -112,6 +112,209 @@ class TestSeqDunder:
         assert i == 200
 
 
+class TestSeqStep:
+    @pytest.fixture
+    def stepped(self, seq_path) -> FileSequence:
+        return FileSequence(seq_path, start=100, end=201, step=2)
+
+    def test_init(self, stepped: FileSequence):
+        assert stepped.start == 100
+        assert stepped.end == 200
+        assert stepped.step == 2
+        assert len(stepped) == 51
+
+    def test_init_raises(self, seq_path):
+        with pytest.raises(ValueError):
+            FileSequence(seq_path, start=100, end=200, step=0)
+
+    @pytest.mark.parametrize("index,num", [(0, 100), (1, 102), (-1, 200), (-2, 198)])
+    def test_get_index(self, stepped: FileSequence, index: int, num: int):
+        assert stepped[index] == Path(f"/Volumes/disk/folder/file.{num}.txt")
+
+    @pytest.mark.parametrize("index", [51, -52])
+    def test_get_index_raises(self, stepped: FileSequence, index: int):
+        with pytest.raises(IndexError):
+            stepped[index]
+
+    @pytest.mark.parametrize(
+        "bounds,start,end,step",
+        [
+            (slice(1, 4), 102, 106, 2),
+            (slice(None, None, 2), 100, 200, 4),
+            (slice(None, None, -1), 100, 200, 2),
+        ],
+    )
+    def test_get_slice(self, stepped, bounds, start, end, step):
+        sub_seq = stepped[bounds]
+        assert (sub_seq.start, sub_seq.end, sub_seq.step) == (start, end, step)
+
+    def test_get_file_num(self, stepped: FileSequence):
+        assert stepped.files[102] == Path("/Volumes/disk/folder/file.102.txt")
+        with pytest.raises(IndexError):
+            stepped.files[101]
+
+    def test_filenum_get_slice(self, stepped: FileSequence):
+        sub_seq = stepped.files[101:107]
+        assert (sub_seq.start, sub_seq.end, sub_seq.step) == (102, 106, 2)
+
+    def test_iter(self, stepped: FileSequence):
+        nums = [int(path.name.split(".")[1]) for path in stepped]
+        assert nums == list(range(100, 201, 2))
+
+    def test_frames(self, stepped: FileSequence):
+        assert list(stepped.frames) == list(range(100, 201, 2))
+        assert stepped.frames == FrameSet.from_frames(range(100, 201, 2))
+        assert stepped.frames is stepped.frames
+
+    def test_repr(self, stepped: FileSequence):
+        assert repr(stepped) == (
+            "<FileSequence: '/Volumes/disk/folder/file.[100-200].txt' step 2>"
+        )
+
+    def test_copy_and_sync(self, file_seq_for_operation):
+        src, dst = file_seq_for_operation
+        stepped = FileSequence(src.path, 100, 200, step=10)
+
+        copied = stepped.copy(dst)
+        assert copied.step == 10
+        assert sorted(path.name for path in dst.iterdir()) == [
+            f"file.{i}.txt" for i in range(100, 201, 10)
+        ]
+
+        stepped.sync_to(dst)
+        (dst / "file.150.txt").unlink()
+        actions = [item.action for item in list(stepped.sync_to_iter(dst))[:-1]]
+        assert actions.count("new") == 1
+        assert actions.count("unchanged") == 10
+
+    def test_rename_in_place(self, tmp_path):
+        for num in (1, 3, 5):
+            (tmp_path / f"plate.{num:04}.exr").write_text(str(num))
+        stepped = FileSequence(tmp_path / "plate.####.exr", 1, 5, step=2)
+
+        # new names of frames are old names of others.
+        same = stepped.rename("plate.####.exr")
+        assert same.to_spec() == stepped.to_spec()
+        assert [path.read_text() for path in same] == ["1", "3", "5"]
+
+        renamed = stepped.rename("plate.0002.exr")
+
+        assert (renamed.start, renamed.end, renamed.step) == (2, 6, 2)
+        assert [path.read_text() for path in renamed] == ["1", "3", "5"]
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "plate.0002.exr",
+            "plate.0004.exr",
+            "plate.0006.exr",
+        ]
+
+        renamed = renamed.rename("plate.0001.exr")
+        assert renamed.to_spec() == stepped.to_spec()
+        assert [path.read_text() for path in renamed] == ["1", "3", "5"]
+
+
+class TestSeqRenumber:
+    @staticmethod
+    def names(folder: Path) -> list:
+        return sorted(path.name for path in folder.iterdir())
+
+    @pytest.mark.parametrize(
+        "kwargs,first,last,step,template",
+        [
+            ({"start": 150}, 150, 250, 1, "file.{:03d}.txt"),
+            ({"start": 50}, 50, 150, 1, "file.{:03d}.txt"),
+            ({"start": 101}, 101, 201, 1, "file.{:03d}.txt"),
+            ({"start": 99}, 99, 199, 1, "file.{:03d}.txt"),
+            ({"pad": 4}, 100, 200, 1, "file.{:04d}.txt"),
+            ({"start": 1001, "pad": 4, "delim": "_"}, 1001, 1101, 1, "file_{:04d}.txt"),
+            ({"step": 2}, 100, 300, 2, "file.{:03d}.txt"),
+            ({"start": 0, "step": 3, "pad": 5}, 0, 300, 3, "file.{:05d}.txt"),
+        ],
+    )
+    @pytest.mark.parametrize("use_iter", [True, False])
+    def test_renumber(
+        self, file_seq_for_operation, kwargs, first, last, step, template, use_iter
+    ):
+        src, _ = file_seq_for_operation
+        folder = src.path.parent
+
+        if use_iter:
+            items = list(src.renumber_iter(**kwargs))
+            new_seq = items.pop(-1)
+            # files already on their new name are not renamed.
+            moved = [old != new for old, new in zip(src, new_seq)]
+            assert len(items) == sum(moved)
+            for old, new in items:
+                assert not old.exists() or old in set(new_seq)
+                assert new.read_text() == old.name.split(".")[1]
+        else:
+            new_seq = src.renumber(**kwargs)
+
+        assert isinstance(new_seq, FileSequence)
+        assert (new_seq.start, new_seq.end, new_seq.step) == (first, last, step)
+        assert self.names(folder) == sorted(path.name for path in new_seq)
+
+        # contents follow their frame in order.
+        for i, path in enumerate(new_seq):
+            assert path.name == template.format(first + i * step)
+            assert path.read_text() == str(100 + i)
+
+    def test_renumber_existing_raises(self, file_seq_for_operation):
+        src, _ = file_seq_for_operation
+        folder = src.path.parent
+        (folder / "file.250.txt").write_text("keep")
+        before = self.names(folder)
+
+        with pytest.raises(FileExistsError):
+            src.renumber(start=150)
+
+        assert self.names(folder) == before
+        assert (folder / "file.250.txt").read_text() == "keep"
+
+    def test_renumber_missing_raises(self, file_seq_for_operation):
+        src, _ = file_seq_for_operation
+        folder = src.path.parent
+        src.files[150].unlink()
+        before = self.names(folder)
+
+        with pytest.raises(FileNotFoundError):
+            src.renumber(start=150)
+
+        assert self.names(folder) == before
+
+
+class TestSeqFrameSets:
+    def test_frames(self, seq_theory: FileSequence):
+        assert seq_theory.frames == FrameSet([(100, 200)])
+
+    @pytest.mark.parametrize(
+        "method,answer",
+        [
+            (FileSequence.union, ((100, 250),)),
+            (FileSequence.intersection, ((150, 200),)),
+            (FileSequence.difference, ((100, 149),)),
+            (FileSequence.symmetric_difference, ((100, 149), (201, 250))),
+        ],
+    )
+    @pytest.mark.parametrize("other_is_seq", [True, False])
+    def test_set_operations(self, seq_theory, method, answer, other_is_seq):
+        other = FileSequence("/Volumes/disk/other/file.100.txt", 150, 250)
+        if not other_is_seq:
+            other = other.frames
+
+        assert method(seq_theory, other).ranges == answer
+
+    def test_subsequences(self, seq_theory: FileSequence):
+        delivered = FileSequence("/Volumes/disk/delivery/file.100.txt", 100, 200)
+        missing = seq_theory.difference(
+            FrameSet([(100, 120), (130, 180)]).intersection(delivered.frames)
+        )
+
+        subsequences = seq_theory.subsequences(missing)
+        assert [(x.start, x.end) for x in subsequences] == [(121, 129), (181, 200)]
+        assert all(x.name == seq_theory.name for x in subsequences)
+        assert subsequences[0].path == Path("/Volumes/disk/folder/file.121.txt")
+
+
 class TestSeqDisk:
     @pytest.mark.parametrize(
         "file_method,src_remains",
@@ -340,3 +543,128 @@ class TestSeqDisk:
             for path in src:
                 assert path.stat().st_mode != original_mode
                 assert stat.S_IMODE(path.stat().st_mode) == 0o777
+
+
+class TestSeqSync:
+    @staticmethod
+    def actions(src: FileSequence, dst: Path, **kwargs) -> dict:
+        by_action = dict()
+        for item in src.sync_to_iter(dst, **kwargs):
+            if isinstance(item, FileSequence):
+                continue
+            by_action.setdefault(item.action, list()).append(item)
+        return by_action
+
+    def test_sync_empty(self, file_seq_for_operation):
+        src, dst = file_seq_for_operation
+
+        items = list(src.sync_to_iter(dst))
+        new_seq = items.pop(-1)
+
+        assert isinstance(new_seq, FileSequence)
+        assert new_seq.path == dst / src.path.name
+        assert [x.action for x in items] == ["new"] * len(src)
+        assert [x.src for x in items] == list(src)
+        assert [x.dst for x in items] == list(new_seq)
+
+        for old, new in zip(src, new_seq):
+            assert new.read_text() == old.read_text()
+            assert new.stat().st_mtime_ns == old.stat().st_mtime_ns
+
+    def test_sync_unchanged(self, file_seq_for_operation):
+        src, dst = file_seq_for_operation
+        src.sync_to(dst)
+
+        assert list(self.actions(src, dst)) == ["unchanged"]
+
+    def test_sync_changed(self, file_seq_for_operation):
+        src, dst = file_seq_for_operation
+        src.sync_to(dst)
+
+        for frame in (120, 121, 150):
+            src.files[frame].write_text("re-rendered")
+        (dst / src.files[200].name).unlink()
+
+        by_action = self.actions(src, dst)
+        assert [x.src for x in by_action["changed"]] == [
+            src.files[120],
+            src.files[121],
+            src.files[150],
+        ]
+        assert [x.src for x in by_action["new"]] == [src.files[200]]
+        assert len(by_action["unchanged"]) == len(src) - 4
+        assert (dst / src.files[150].name).read_text() == "re-rendered"
+
+    def test_sync_in_frame_order(self, file_seq_for_operation):
+        src, dst = file_seq_for_operation
+        src.sync_to(dst)
+        src.files[150].write_text("re-rendered")
+
+        srcs = [x.src for x in src.sync_to_iter(dst) if not isinstance(x, FileSequence)]
+        assert srcs == list(src)
+
+    @pytest.mark.parametrize("checksum", [True, False])
+    def test_sync_checksum(self, file_seq_for_operation, checksum):
+        src, dst = file_seq_for_operation
+        src.sync_to(dst)
+
+        # same size and mtime, different contents.
+        dst_path = dst / src.files[110].name
+        dst_stat = dst_path.stat()
+        dst_path.write_text("999")
+        os.utime(str(dst_path), ns=(dst_stat.st_atime_ns, dst_stat.st_mtime_ns))
+
+        by_action = self.actions(src, dst, checksum=checksum)
+        if checksum:
+            assert [x.src for x in by_action["changed"]] == [src.files[110]]
+            assert dst_path.read_text() == "110"
+        else:
+            assert list(by_action) == ["unchanged"]
+
+    @pytest.mark.parametrize("delete_extra", [True, False])
+    def test_sync_delete_extra(self, file_seq_for_operation, delete_extra):
+        src, dst = file_seq_for_operation
+        extras = [dst / "file.099.txt", dst / "file.1000.txt", dst / "file.300.txt"]
+        others = [dst / "file.txt", dst / "other.150.txt", dst / "file.150.exr"]
+        # padded differently, so frames of other sequences.
+        others += [dst / "file.99.txt", dst / "file.0300.txt"]
+        for path in extras + others:
+            path.write_text("extra")
+
+        by_action = self.actions(src, dst, delete_extra=delete_extra)
+
+        if delete_extra:
+            assert [x.dst for x in by_action["deleted"]] == extras
+            assert all(x.src is None for x in by_action["deleted"])
+            assert not any(x.exists() for x in extras)
+        else:
+            assert "deleted" not in by_action
+            assert all(x.exists() for x in extras)
+
+        assert all(x.exists() for x in others)
+
+    @pytest.mark.parametrize("checksum", [True, False])
+    def test_sync_other_storage(self, checksum):
+        storage = MemoryStorage()
+        storage.create_files(Path(f"/src/plate.{i:04}.exr") for i in range(1, 11))
+        storage.create_files([Path("/dst/plate.0011.exr"), Path("/dst/plate.0012")])
+        storage.mkdir("/dst/plate.0013.exr")
+        src = FileSequence("/src/plate.####.exr", 1, 10, storage=storage)
+
+        dst = Path("/dst")
+        by_action = self.actions(src, dst, checksum=checksum, delete_extra=True)
+        assert len(by_action["new"]) == 10
+        assert [x.dst for x in by_action["deleted"]] == [Path("/dst/plate.0011.exr")]
+
+        storage.write_bytes("/src/plate.0005.exr", b"re-rendered")
+        by_action = self.actions(src, dst, checksum=checksum)
+        assert [x.src for x in by_action["changed"]] == [src.files[5]]
+        assert len(by_action["unchanged"]) == 9
+        assert storage.read_bytes("/dst/plate.0005.exr") == b"re-rendered"
+
+    def test_sync_missing_source_raises(self, file_seq_for_operation):
+        src, dst = file_seq_for_operation
+        src.files[150].unlink()
+
+        with pytest.raises(FileNotFoundError):
+            src.sync_to(dst)
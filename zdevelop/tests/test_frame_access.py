@@ -0,0 +1,185 @@
+import pytest
+import mmap
+import os
+import time
+from pathlib import Path
+
+from perfsprocket import FileSequence, FrameAccessor, MemoryStorage
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    """polls ``condition`` while a background thread catches up"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.001)
+    return False
+
+
+def read_handle(handle) -> str:
+    if isinstance(handle, mmap.mmap):
+        return handle[:].decode()
+    return os.pread(handle, 100, 0).decode()
+
+
+class TestFrameName:
+    @pytest.mark.parametrize(
+        "path,num,answer",
+        [
+            ("/folder/file.100.txt", 150, "file.150.txt"),
+            ("/folder/file.####.exr", 7, "file.0007.exr"),
+            ("/folder/file.####.exr", -7, "file.-0007.exr"),
+            ("/folder/file_####_v001.exr", 12, "file_0012_v001.exr"),
+            ("/folder/50%_####.exr", 12, "50%_0012.exr"),
+            ("/folder/file.[0001-0010].exr", 3, "file.0003.exr"),
+        ],
+    )
+    def test_frame_name(self, path, num, answer):
+        seq = FileSequence(path, 1, 10)
+        assert seq.frame_name(num) == answer
+        assert seq.frame_name(num) == str(seq.name.alter(start=num, end=None))
+
+
+class TestFrameAccessor:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"handles": "file"},
+            {"max_open": 0},
+            {"prefetch": -1},
+            {"max_open": 4, "prefetch": 4},
+        ],
+    )
+    def test_invalid_raises(self, seq_theory, kwargs):
+        with pytest.raises(ValueError):
+            FrameAccessor(seq_theory, **kwargs)
+
+    def test_other_storage_raises(self):
+        seq = FileSequence("/shots/plate.####.exr", 1, 10, storage=MemoryStorage())
+        with pytest.raises(ValueError):
+            seq.accessor()
+
+    def test_path(self, seq_theory):
+        accessor = seq_theory.accessor()
+        assert accessor.path(150) == str(Path("/Volumes/disk/folder/file.150.txt"))
+
+    @pytest.mark.parametrize("frame", [99, 201, -1])
+    def test_path_raises(self, seq_theory, frame):
+        with pytest.raises(IndexError):
+            seq_theory.accessor().path(frame)
+
+    def test_path_step(self, seq_path):
+        accessor = FileSequence(seq_path, 100, 200, step=5).accessor()
+        assert accessor.path(105).endswith("file.105.txt")
+        with pytest.raises(IndexError):
+            accessor.path(101)
+
+    @pytest.mark.parametrize("handles", ["fd", "mmap"])
+    def test_open(self, file_seq_for_operation, handles):
+        src, _ = file_seq_for_operation
+
+        with src.accessor(max_open=8, handles=handles) as accessor:
+            for frame in range(100, 201):
+                assert read_handle(accessor.open(frame)) == str(frame)
+                accessor.release(frame)
+
+            # cache bounded, holding the most recent frames.
+            assert [accessor.cached(frame) for frame in (192, 193, 200)] == [
+                False,
+                True,
+                True,
+            ]
+            assert accessor.open(200) is accessor.open(200)
+
+        assert not accessor.cached(200)
+
+    def test_pinned_not_evicted(self, file_seq_for_operation):
+        src, _ = file_seq_for_operation
+
+        with src.accessor(max_open=2) as accessor:
+            fd = accessor.open(100)
+            for frame in range(110, 120):
+                accessor.open(frame)
+                accessor.release(frame)
+
+            assert accessor.cached(100)
+            assert read_handle(fd) == "100"
+
+            accessor.release(100)
+            accessor.open(120)
+            assert not accessor.cached(100)
+
+    def test_prefetch_keeps_pinned(self, file_seq_for_operation):
+        # prefetched frames must not evict, and close, a handle still in use.
+        src, _ = file_seq_for_operation
+
+        with src.accessor(max_open=3, prefetch=1) as accessor:
+            fd = accessor.open(100)
+            for frame in range(150, 160):
+                accessor.open(frame)
+                assert wait_for(lambda: accessor.cached(frame + 1))
+                accessor.release(frame)
+
+            assert read_handle(fd) == "100"
+
+    def test_release_unpinned_raises(self, file_seq_for_operation):
+        src, _ = file_seq_for_operation
+
+        with src.accessor() as accessor:
+            accessor.open(100)
+            accessor.release(100)
+            with pytest.raises(ValueError):
+                accessor.release(100)
+
+    def test_close_closes_fds(self, file_seq_for_operation):
+        src, _ = file_seq_for_operation
+
+        accessor = src.accessor(max_open=4)
+        fd = accessor.open(100)
+        accessor.close()
+
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+    def test_open_missing_raises(self, file_seq_for_operation):
+        src, _ = file_seq_for_operation
+        src.files[150].unlink()
+
+        with src.accessor() as accessor:
+            with pytest.raises(FileNotFoundError):
+                accessor.open(150)
+
+    @pytest.mark.parametrize("handles", ["fd", "mmap"])
+    def test_prefetch_forward(self, file_seq_for_operation, handles):
+        src, _ = file_seq_for_operation
+
+        with src.accessor(max_open=16, handles=handles, prefetch=4) as accessor:
+            accessor.open(150)
+            assert wait_for(lambda: all(accessor.cached(f) for f in range(151, 155)))
+            assert not accessor.cached(155)
+            assert read_handle(accessor.open(153)) == "153"
+
+    def test_prefetch_reverse(self, file_seq_for_operation):
+        src, _ = file_seq_for_operation
+
+        with src.accessor(max_open=16, prefetch=3) as accessor:
+            accessor.open(150)
+            accessor.open(149)
+            assert wait_for(lambda: all(accessor.cached(f) for f in range(146, 149)))
+
+    def test_prefetch_stops_at_end(self, file_seq_for_operation):
+        src, _ = file_seq_for_operation
+
+        with src.accessor(max_open=16, prefetch=4) as accessor:
+            accessor.open(199)
+            assert wait_for(lambda: accessor.cached(200))
+
+    def test_prefetch_skips_missing(self, file_seq_for_operation):
+        src, _ = file_seq_for_operation
+        src.files[151].unlink()
+
+        with src.accessor(max_open=16, prefetch=3) as accessor:
+            accessor.open(150)
+            assert wait_for(lambda: accessor.cached(153))
+            assert not accessor.cached(151)
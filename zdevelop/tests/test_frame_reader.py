@@ -0,0 +1,156 @@
+import pytest
+
+from perfsprocket import FileSequence, FrameBuffer, MappingPool, MemoryStorage
+
+
+@pytest.fixture
+def binary_seq(tmp_path) -> FileSequence:
+    """sequence of frames with a 4 byte header and a frame sized body"""
+    for i in range(1, 11):
+        (tmp_path / f"frame.{i:04d}.bin").write_bytes(b"HEAD" + bytes([i]) * i * 1000)
+    return FileSequence(tmp_path / "frame.####.bin", 1, 10)
+
+
+class TestMappingPool:
+    def test_invalid_raises(self):
+        with pytest.raises(ValueError):
+            MappingPool(0)
+
+    def test_reuse(self, binary_seq):
+        path = str(binary_seq.files[1])
+        with MappingPool(2) as pool:
+            first = pool.acquire(path)
+            second = pool.acquire(path)
+            assert first is second
+
+            pool.release(path)
+            pool.release(path)
+            assert path in pool
+            assert pool.acquire(path) is first
+            pool.release(path)
+
+        assert len(pool) == 0
+        assert first.closed
+
+    def test_evicts_idle_only(self, binary_seq):
+        paths = [str(path) for path in binary_seq]
+        pool = MappingPool(2)
+
+        in_use = pool.acquire(paths[0])
+        for path in paths[1:5]:
+            pool.acquire(path)
+            pool.release(path)
+
+        assert len(pool) == 2
+        assert paths[0] in pool
+        assert not in_use.closed
+
+        pool.release(paths[0])
+        pool.close()
+        assert in_use.closed
+
+    def test_close_waits_for_release(self, binary_seq):
+        path = str(binary_seq.files[1])
+        pool = MappingPool()
+
+        mapping = pool.acquire(path)
+        pool.close()
+        assert not mapping.closed
+
+        pool.release(path)
+        assert mapping.closed
+
+        with pytest.raises(ValueError):
+            pool.acquire(path)
+
+
+class TestOpenFrame:
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_open_frame(self, binary_seq, use_mmap):
+        with binary_seq.open_frame(3, mmap=use_mmap) as view:
+            assert isinstance(view, memoryview)
+            assert view.readonly
+            assert bytes(view[:4]) == b"HEAD"
+            assert len(view) == 3004
+
+        with pytest.raises(ValueError):
+            view[0]
+
+    def test_open_frame_closes_mapping(self, binary_seq):
+        buffer = binary_seq.open_frame(3)
+        mapping = buffer._mapping
+
+        buffer.close()
+        buffer.close()
+        assert mapping.closed
+
+    def test_open_frame_pool(self, binary_seq):
+        with MappingPool(4) as pool:
+            with binary_seq.open_frame(3, pool=pool) as view:
+                assert view[4] == 3
+
+            assert str(binary_seq.files[3]) in pool
+            with binary_seq.open_frame(3, pool=pool) as view:
+                assert view[4] == 3
+
+    def test_open_frame_empty(self, tmp_path):
+        (tmp_path / "empty.1.bin").touch()
+        seq = FileSequence(tmp_path / "empty.1.bin", 1, 1)
+
+        with seq.open_frame(1) as view:
+            assert len(view) == 0
+
+    @pytest.mark.parametrize("frame", [0, 11])
+    def test_open_frame_raises(self, binary_seq, frame):
+        with pytest.raises(IndexError):
+            binary_seq.open_frame(frame)
+
+    def test_open_frame_other_storage_raises(self):
+        storage = MemoryStorage()
+        storage.create_files(["/shots/frame.0001.bin"], data=b"HEAD")
+        seq = FileSequence("/shots/frame.####.bin", 1, 1, storage=storage)
+
+        with pytest.raises(ValueError):
+            seq.open_frame(1)
+        with pytest.raises(ValueError):
+            next(seq.iter_buffers())
+
+    def test_repr(self, binary_seq):
+        buffer = FrameBuffer(str(binary_seq.files[1]))
+        assert repr(buffer).startswith("<FrameBuffer: '")
+        buffer.close()
+
+
+class TestIterBuffers:
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    @pytest.mark.parametrize("readahead", [True, False])
+    def test_iter_buffers(self, binary_seq, use_mmap, readahead):
+        seen = list()
+        for frame, view in binary_seq.iter_buffers(mmap=use_mmap, readahead=readahead):
+            assert bytes(view[:4]) == b"HEAD"
+            assert view[-1] == frame
+            seen.append(frame)
+
+        assert seen == list(range(1, 11))
+
+    def test_iter_buffers_releases_views(self, binary_seq):
+        views = list()
+        for _, view in binary_seq.iter_buffers():
+            views.append(view)
+
+        for view in views:
+            with pytest.raises(ValueError):
+                len(view)
+
+    def test_iter_buffers_close_early(self, binary_seq):
+        buffers = binary_seq.iter_buffers()
+        frame, view = next(buffers)
+        assert frame == 1
+
+        buffers.close()
+        with pytest.raises(ValueError):
+            view[0]
+
+    def test_iter_buffers_step(self, binary_seq):
+        seq = FileSequence(binary_seq.path, 1, 10, step=3)
+        assert [frame for frame, _ in seq.iter_buffers()] == [1, 4, 7, 10]
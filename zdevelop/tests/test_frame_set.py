@@ -0,0 +1,127 @@
+import pytest
+import random
+
+from perfsprocket import FrameSet
+
+
+def random_frame_set(rng: random.Random) -> FrameSet:
+    ranges = list()
+    for _ in range(rng.randint(0, 8)):
+        first = rng.randint(-20, 80)
+        ranges.append((first, first + rng.randint(0, 15)))
+    return FrameSet(ranges)
+
+
+class TestInit:
+    @pytest.mark.parametrize(
+        "ranges,answer",
+        [
+            ([], ()),
+            ([(1, 10)], ((1, 10),)),
+            ([(20, 30), (1, 10)], ((1, 10), (20, 30))),
+            ([(1, 10), (5, 15)], ((1, 15),)),
+            ([(1, 10), (11, 15)], ((1, 15),)),
+            ([(1, 10), (12, 15)], ((1, 10), (12, 15))),
+            ([(1, 20), (5, 10)], ((1, 20),)),
+            ([(5, 5), (-3, -1)], ((-3, -1), (5, 5))),
+        ],
+    )
+    def test_normalize(self, ranges, answer):
+        assert FrameSet(ranges).ranges == answer
+
+    def test_backwards_range_raises(self):
+        with pytest.raises(ValueError):
+            FrameSet([(10, 1)])
+
+    def test_from_frames(self):
+        assert FrameSet.from_frames([5, 1, 2, 3, 7, 6]).ranges == ((1, 3), (5, 7))
+
+    @pytest.mark.parametrize(
+        "text,answer",
+        [
+            ("1001-1100", ((1001, 1100),)),
+            ("1001-1100, 1150,1200-1300", ((1001, 1100), (1150, 1150), (1200, 1300))),
+            ("-10--5,-1", ((-10, -5), (-1, -1))),
+            ("", ()),
+        ],
+    )
+    def test_from_str(self, text, answer):
+        frame_set = FrameSet.from_str(text)
+        assert frame_set.ranges == answer
+        assert FrameSet.from_str(str(frame_set)) == frame_set
+
+    @pytest.mark.parametrize("text", ["1001-", "a-b", "1001:1100"])
+    def test_from_str_raises(self, text):
+        with pytest.raises(ValueError):
+            FrameSet.from_str(text)
+
+
+class TestDunder:
+    def test_len_iter(self):
+        frame_set = FrameSet([(1, 3), (7, 8)])
+        assert len(frame_set) == 5
+        assert list(frame_set) == [1, 2, 3, 7, 8]
+        assert list(reversed(frame_set)) == [8, 7, 3, 2, 1]
+
+    @pytest.mark.parametrize(
+        "frame,answer",
+        [
+            (0, False),
+            (1, True),
+            (3, True),
+            (4, False),
+            (7, True),
+            (8, True),
+            (9, False),
+        ],
+    )
+    def test_contains(self, frame, answer):
+        assert (frame in FrameSet([(1, 3), (7, 8)])) is answer
+
+    def test_str_repr(self):
+        frame_set = FrameSet([(1, 3), (5, 5)])
+        assert str(frame_set) == "1-3,5"
+        assert repr(frame_set) == "FrameSet('1-3,5')"
+
+    def test_bool_start_end(self):
+        assert not FrameSet()
+        assert FrameSet().start is None
+        assert FrameSet().end is None
+        assert FrameSet([(3, 4), (8, 9)]).start == 3
+        assert FrameSet([(3, 4), (8, 9)]).end == 9
+
+    def test_eq_hash(self):
+        assert FrameSet([(1, 5)]) == FrameSet([(1, 2), (3, 5)])
+        assert hash(FrameSet([(1, 5)])) == hash(FrameSet([(1, 2), (3, 5)]))
+        assert FrameSet([(1, 5)]) != (1, 5)
+
+
+class TestOperations:
+    @pytest.mark.parametrize(
+        "method,operator,python_method",
+        [
+            (FrameSet.union, "__or__", set.union),
+            (FrameSet.intersection, "__and__", set.intersection),
+            (FrameSet.difference, "__sub__", set.difference),
+            (FrameSet.symmetric_difference, "__xor__", set.symmetric_difference),
+        ],
+    )
+    def test_matches_python_sets(self, method, operator, python_method):
+        rng = random.Random(method.__name__)
+
+        for _ in range(300):
+            ours, theirs = random_frame_set(rng), random_frame_set(rng)
+            answer = python_method(set(ours), set(theirs))
+
+            result = method(ours, theirs)
+            assert set(result) == answer
+            assert result == FrameSet.from_frames(answer)
+            assert getattr(ours, operator)(theirs) == result
+
+    def test_large_ranges(self):
+        ours = FrameSet([(1, 10**12)])
+        theirs = FrameSet([(500, 600), (10**9, 10**13)])
+
+        assert (ours - theirs).ranges == ((1, 499), (601, 10**9 - 1))
+        assert (ours & theirs).ranges == ((500, 600), (10**9, 10**12))
+        assert (ours | theirs).ranges == ((1, 10**13),)
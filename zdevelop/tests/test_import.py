@@ -0,0 +1,67 @@
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+
+import perfsprocket
+
+
+REPO = str(Path(__file__).parents[2])
+
+# microseconds. Measured around 3ms; the budget leaves room for slow CI machines.
+IMPORT_BUDGET = 25_000
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        cwd=REPO,
+        check=True,
+    )
+
+
+def import_time() -> int:
+    """cumulative microseconds to import perfsprocket, from python -X importtime"""
+    result = run_python("-X", "importtime", "-c", "import perfsprocket")
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "perfsprocket":
+            return int(cumulative)
+    raise AssertionError("perfsprocket not found in import times")
+
+
+def test_import_time():
+    # best of a few runs, to ignore a busy machine.
+    assert min(import_time() for _ in range(3)) < IMPORT_BUDGET
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, perfsprocket; "
+        "print(sorted(m for m in sys.modules if m.startswith('perfsprocket')))"
+    )
+    assert run_python("-c", code).stdout.strip() == str(
+        ["perfsprocket", "perfsprocket._version"]
+    )
+
+
+def test_import_loads_only_used_modules():
+    code = (
+        "import sys; from perfsprocket import FrameSet; "
+        "print('perfsprocket._class_file_sequence' in sys.modules)"
+    )
+    assert run_python("-c", code).stdout.strip() == "False"
+
+
+@pytest.mark.parametrize("name", perfsprocket.__all__)
+def test_exports(name):
+    assert getattr(perfsprocket, name) is not None
+    assert name in dir(perfsprocket)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        perfsprocket.NotAName
@@ -0,0 +1,175 @@
+import errno
+import os
+import pytest
+from pathlib import Path
+
+from perfsprocket import FileSequence, MemoryStorage, Transaction
+
+
+FOLDER = Path("/shots")
+
+
+@pytest.fixture
+def storage() -> MemoryStorage:
+    storage = MemoryStorage()
+    storage.create_files(FOLDER / f"plate.{frame:04}.exr" for frame in range(1, 11))
+    return storage
+
+
+@pytest.fixture
+def seq(storage) -> FileSequence:
+    return FileSequence(FOLDER / "plate.####.exr", 1, 10, storage=storage)
+
+
+def test_missing_folder(storage, seq):
+    with pytest.raises(FileNotFoundError):
+        seq.move("/missing")
+    with pytest.raises(FileNotFoundError):
+        storage.list_names(Path("/missing"))
+    assert len(storage.list_names(FOLDER)) == 10
+
+
+def test_mkdir(storage):
+    with pytest.raises(FileNotFoundError):
+        storage.mkdir("/a/b")
+    storage.mkdir("/a/b", parents=True)
+    with pytest.raises(FileExistsError):
+        storage.mkdir("/a/b")
+    storage.mkdir("/a/b", exist_ok=True)
+    assert storage.list_names(Path("/a")) == ["b"]
+
+
+def test_rename_between_devices(storage, seq):
+    device = storage.mount("/mnt/delivery")
+    assert storage.stat(Path("/mnt/delivery")).st_dev == device
+
+    with pytest.raises(OSError) as info:
+        storage.rename(FOLDER / "plate.0001.exr", Path("/mnt/delivery/plate.0001.exr"))
+    assert info.value.errno == errno.EXDEV
+
+    # moves fall back to copying then deleting each file.
+    moved = seq.move("/mnt/delivery")
+    assert storage.list_names(FOLDER) == []
+    assert [storage.stat(path).st_dev for path in moved] == [device] * 10
+
+
+def test_move_between_devices_syncs_first(storage, seq, monkeypatch):
+    storage.mount("/mnt/delivery")
+    events = list()
+    delete = storage.delete
+
+    def record_delete(path):
+        events.append(("delete", path.name))
+        delete(path)
+
+    monkeypatch.setattr(
+        storage, "sync", lambda path: events.append(("sync", path.name))
+    )
+    monkeypatch.setattr(storage, "delete", record_delete)
+    seq.move("/mnt/delivery")
+
+    assert events == [
+        (event, f"plate.{frame:04}.exr")
+        for frame in range(1, 11)
+        for event in ("sync", "delete")
+    ]
+
+
+@pytest.mark.parametrize("mounted", [False, True])
+def test_move_pairs_streams(storage, mounted):
+    storage.mkdir("/mnt/delivery", parents=True)
+    if mounted:
+        storage.mount("/mnt/other")
+    dst_folder = Path("/mnt/other" if mounted else "/mnt/delivery")
+    taken = list()
+
+    def pairs():
+        for frame in range(1, 11):
+            taken.append(frame)
+            name = f"plate.{frame:04}.exr"
+            yield FOLDER / name, dst_folder / name
+
+    moving = storage.move_pairs(pairs())
+    next(moving)
+    assert taken == [1]
+    next(moving)
+    assert taken == [1, 2]
+    assert len(list(moving)) == 8
+
+
+def test_rollback_between_devices(storage, seq):
+    storage.mount("/mnt/delivery")
+    with pytest.raises(RuntimeError):
+        with Transaction() as transaction:
+            seq.move("/mnt/delivery", transaction=transaction)
+            raise RuntimeError
+
+    assert len(storage.list_names(FOLDER)) == 10
+    assert storage.list_names(Path("/mnt/delivery")) == []
+
+
+def test_local_move_between_devices(file_seq_for_operation, monkeypatch):
+    seq, dst = file_seq_for_operation
+
+    def rename(src, dst):
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV), src)
+
+    synced = list()
+    monkeypatch.setattr("perfsprocket._storage.os.rename", rename)
+    monkeypatch.setattr("perfsprocket._storage.fsync_path", synced.append)
+    moved = seq.move(dst)
+
+    assert not list(seq.path.parent.iterdir())
+    assert all(path.is_file() for path in moved)
+    assert synced == list(moved)
+
+
+def test_folder_permissions(storage, seq):
+    storage.mkdir("/delivery", mode=0o555)
+
+    with pytest.raises(PermissionError):
+        seq.move("/delivery")
+    with pytest.raises(PermissionError):
+        seq.copy("/delivery")
+
+    storage.chmod(FOLDER, 0o555)
+    with pytest.raises(PermissionError):
+        seq.delete()
+    with pytest.raises(PermissionError):
+        seq.renumber(start=2)
+    assert len(storage) == 10
+
+
+def test_file_permissions(storage, seq):
+    storage.mkdir("/delivery")
+    seq.chmod(0o200)
+    with pytest.raises(PermissionError):
+        seq.copy("/delivery")
+
+    seq.chmod(0o444)
+    copied = seq.copy("/delivery")
+    with pytest.raises(PermissionError):
+        seq.copy("/delivery")
+    with pytest.raises(PermissionError):
+        storage.open(copied.path.parent / "plate.0001.exr", "wb")
+
+
+def test_replace_folder(storage, seq):
+    storage.mkdir(FOLDER / "plate.0011.exr")
+    with pytest.raises(IsADirectoryError):
+        storage.rename(FOLDER / "plate.0001.exr", FOLDER / "plate.0011.exr")
+    with pytest.raises(IsADirectoryError):
+        storage.delete(FOLDER / "plate.0011.exr")
+
+
+def test_large_renumber():
+    storage = MemoryStorage()
+    storage.create_files(FOLDER / f"plate.{frame:06}.exr" for frame in range(20_000))
+    seq = FileSequence(FOLDER / "plate.######.exr", 0, 19_999, storage=storage)
+
+    # every new name but the last collides with a frame still to be renamed.
+    renumbered = seq.renumber(start=1)
+
+    assert len(storage) == 20_000
+    assert renumbered.du().files == 20_000
+    assert sorted(storage.list_names(FOLDER))[0] == "plate.000001.exr"
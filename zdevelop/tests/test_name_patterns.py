@@ -0,0 +1,179 @@
+import pytest
+
+from perfsprocket import SeqName, NamePatterns, SEQ_PATTERNS, BRACKET
+
+
+@pytest.mark.parametrize(
+    "text,convention,start,end,pad,extension",
+    [
+        ("shot.0100.exr", "default", 100, None, 4, ".exr"),
+        ("shot.[0100-0200].exr", "default", 100, 200, 4, ".exr"),
+        ("shot.####.exr", "default", "#", None, 4, ".exr"),
+        ("shot.-0005.exr", "negative", -5, None, 4, ".exr"),
+        ("shot_-5", "negative", -5, None, 1, None),
+        ("shot.[-0010-0010].exr", "negative", -10, 10, 4, ".exr"),
+        ("shot.[-0010--0005].exr", "negative", -10, -5, 4, ".exr"),
+        ("shot.%04d.exr", "printf", "%", None, 4, ".exr"),
+        ("shot_%d.exr", "printf", "%", None, 0, ".exr"),
+        ("shot.@@@@.exr", "at", "@", None, 4, ".exr"),
+        ("shot_0100_v001.exr", "mid_name", 100, None, 4, ".exr"),
+        ("shot_####_v001.exr", "mid_name", "#", None, 4, ".exr"),
+    ],
+)
+def test_builtin_conventions(text, convention, start, end, pad, extension):
+    name, matched = SeqName.from_path_with_convention(text)
+
+    assert matched == convention
+    assert name.base == "shot"
+    assert name.start == start
+    assert name.end == end
+    assert name.pad == pad
+    assert name.extension == extension
+    assert str(name) == text
+
+
+def test_mid_name_tail():
+    name = SeqName.from_path("shot_[0100-0200]_v001.exr")
+    assert name.tail == "_v001"
+    assert name.alter(start=5, end=None, pad=1).formatted() == "shot_5_v001.exr"
+    assert SeqName.from_path("shot_0100_v001").extension is None
+
+
+def test_extension_underscore():
+    # extensions are always normalized, even those starting with '_'
+    assert SeqName("x", "_foo").extension == "._foo"
+    assert str(SeqName("x", "_foo", start=1)) == "x.1._foo"
+
+
+def test_brackets_negative():
+    name = SeqName.from_path("shot.[-0010-0010].exr")
+    assert name.brackets is BRACKET
+
+
+@pytest.mark.parametrize(
+    "start,pad,answer",
+    [
+        ("#", 4, "shot.####.exr"),
+        ("@", 4, "shot.@@@@.exr"),
+        ("%", 4, "shot.%04d.exr"),
+        ("%", 0, "shot.%d.exr"),
+        (-5, 4, "shot.-0005.exr"),
+        (-12345, 4, "shot.-12345.exr"),
+    ],
+)
+def test_format_placeholders(start, pad, answer):
+    assert str(SeqName("shot", "exr", start=start, pad=pad)) == answer
+
+
+def test_format_frames_negative():
+    name = SeqName("shot", "exr", pad=3)
+    assert name.format_frames([-2, 0, 2]) == [
+        "shot.-002.exr",
+        "shot.000.exr",
+        "shot.002.exr",
+    ]
+
+
+class TestRegistry:
+    def test_default_registry(self):
+        assert SEQ_PATTERNS.conventions == [
+            "default",
+            "negative",
+            "printf",
+            "at",
+            "mid_name",
+        ]
+
+    def test_match_groups(self):
+        result = NamePatterns().match("shot.[0100-0200].exr")
+        assert result.convention == "default"
+        assert result.groups == {
+            "base": "shot",
+            "sep": ".",
+            "open": "[",
+            "start": "0100",
+            "end": "0200",
+            "close": "]",
+            "extension": ".exr",
+            "tail": None,
+        }
+
+    def test_undefined_groups_none(self):
+        result = NamePatterns().match("shot.@@@@.exr")
+        assert result.convention == "at"
+        assert result.groups["open"] is None
+        assert result.groups["end"] is None
+
+    def test_no_match(self):
+        assert NamePatterns().match("movie.mov") is None
+        assert NamePatterns([]).match("shot.0100.exr") is None
+
+    def test_register(self):
+        patterns = NamePatterns()
+        patterns.register(
+            "frame_first", r"(?P<start>\d+)(?P<sep>_)(?P<base>.+?)(?P<extension>\..+)"
+        )
+
+        name, convention = SeqName.from_path_with_convention(
+            "0100_shot.exr", patterns=patterns
+        )
+        assert convention == "frame_first"
+        assert name.base == "shot"
+        assert name.start == 100
+
+        with pytest.raises(ValueError):
+            SeqName.from_path("0100_shot.exr")
+
+    def test_register_index(self):
+        patterns = NamePatterns()
+        patterns.register("everything", r"(?P<base>.+)(?P<sep>\.)(?P<start>\d+)", 0)
+
+        assert patterns.conventions[0] == "everything"
+        assert patterns.match("shot.0100").convention == "everything"
+        assert patterns.match("shot.0100.exr").convention == "default"
+
+    def test_register_backreference(self):
+        patterns = NamePatterns([])
+        patterns.register(
+            "doubled", r"(?P<base>\w+)(?P<sep>\.)(?P<start>\d+)\.(?P=base)"
+        )
+        patterns.register("default", r"(?P<base>\w+)(?P<sep>\.)(?P<start>\d+)")
+
+        assert patterns.match("shot.0100.shot").convention == "doubled"
+        assert patterns.match("shot.0100.plate") is None
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"(?P<base>\w+)(?P<sep>\.)(?P<start>\d+)\.\1",
+            r"(?P<base>\w+)(?P<sep>\.)(?P<start>\d+)(?(1)x|y)",
+        ],
+    )
+    def test_register_numbered_reference_raises(self, pattern):
+        # group numbers change once conventions are combined into one regex.
+        with pytest.raises(ValueError):
+            NamePatterns([]).register("numbered", pattern)
+
+    def test_register_escaped_backslash(self):
+        patterns = NamePatterns([])
+        patterns.register("slash", r"(?P<base>\w+)\\1(?P<sep>\.)(?P<start>\d+)")
+        assert patterns.match("shot\\1.0100").convention == "slash"
+
+    def test_register_duplicate_raises(self):
+        with pytest.raises(ValueError):
+            NamePatterns().register("default", r"(?P<base>.+)(?P<sep>\.)(?P<start>\d+)")
+
+    def test_register_missing_group_raises(self):
+        with pytest.raises(ValueError):
+            NamePatterns().register("bad", r"(?P<base>.+)\.(?P<start>\d+)")
+
+    def test_unregister(self):
+        patterns = NamePatterns()
+        assert patterns.match("shot.@@@@.exr") is not None
+
+        patterns.unregister("at")
+        assert "at" not in patterns.conventions
+        assert patterns.match("shot.@@@@.exr") is None
+
+        with pytest.raises(KeyError):
+            patterns.unregister("at")
@@ -0,0 +1,190 @@
+import threading
+import time
+import pytest
+from concurrent.futures import CancelledError, TimeoutError
+from pathlib import Path
+
+from perfsprocket import FileSequence, MemoryStorage, Transaction, WorkerPool
+
+
+FOLDER = Path("/shots")
+
+
+@pytest.fixture
+def seq() -> FileSequence:
+    storage = MemoryStorage()
+    storage.create_files(FOLDER / f"plate.{frame:04}.exr" for frame in range(1, 11))
+    storage.mkdir("/delivery")
+    return FileSequence(FOLDER / "plate.####.exr", 1, 10, storage=storage)
+
+
+def steps(name: str, log: list, count: int, gate=None):
+    """generator standing in for an operation, logging each frame it does"""
+    for frame in range(count):
+        if gate is not None:
+            gate.wait()
+        log.append(name)
+        yield frame
+
+
+def running(operation):
+    """waits for a worker to take ``operation``"""
+    while operation.state != "running":
+        time.sleep(0.001)
+    return operation
+
+
+def test_copy(seq):
+    with WorkerPool() as pool:
+        operation = pool.submit(seq.copy_iter("/delivery"))
+        copied = operation.result(timeout=5)
+
+    assert copied.path.parent == Path("/delivery")
+    assert operation.state == "done"
+    assert operation.completed == 11
+    assert len(seq.storage) == 20
+
+
+def test_failed(seq):
+    seq.storage.chmod(Path("/delivery"), 0o555)
+    with WorkerPool() as pool:
+        operation = pool.submit(seq.move_iter("/delivery"))
+        with pytest.raises(PermissionError):
+            operation.result(timeout=5)
+
+    assert operation.state == "failed"
+
+
+def test_priority_preempts():
+    log: list = list()
+    gate = threading.Event()
+
+    with WorkerPool(workers=1) as pool:
+        bulk = running(pool.submit(steps("bulk", log, 4, gate)))
+        urgent = pool.submit(steps("urgent", log, 3), priority=10)
+        gate.set()
+
+    # the bulk job yields the only worker to the urgent one after its first frame.
+    assert log == ["bulk", "urgent", "urgent", "urgent", "bulk", "bulk", "bulk"]
+    assert bulk.result() == 3
+    assert urgent.result() == 2
+
+
+def test_equal_priority_take_turns():
+    log: list = list()
+    gate = threading.Event()
+
+    with WorkerPool(workers=1) as pool:
+        running(pool.submit(steps("a", log, 3, gate)))
+        pool.submit(steps("b", log, 3))
+        gate.set()
+
+    assert log == ["a", "b", "a", "b", "a", "b"]
+
+
+def test_change_priority():
+    log: list = list()
+    gate = threading.Event()
+
+    with WorkerPool(workers=1) as pool:
+        running(pool.submit(steps("a", log, 3, gate)))
+        later = pool.submit(steps("b", log, 3), priority=-1)
+        later.priority = 1
+        gate.set()
+
+    assert log == ["a", "b", "b", "b", "a", "a"]
+
+
+def test_pause_resume():
+    log: list = list()
+    gate = threading.Event()
+
+    with WorkerPool(workers=1) as pool:
+        operation = pool.submit(steps("a", log, 3, gate))
+        assert operation.pause()
+        gate.set()
+        assert not operation.wait(0.05)
+        assert operation.state == "paused"
+        assert operation.completed <= 1
+
+        assert operation.resume()
+        assert operation.result(timeout=5) == 2
+
+
+def test_cancel_closes_generator():
+    gate = threading.Event()
+    closed = threading.Event()
+
+    def operation_steps():
+        try:
+            for frame in range(1000):
+                gate.wait()
+                yield frame
+        finally:
+            closed.set()
+
+    with WorkerPool() as pool:
+        operation = running(pool.submit(operation_steps()))
+        assert operation.cancel()
+        gate.set()
+
+        with pytest.raises(CancelledError):
+            operation.result(timeout=5)
+
+    assert operation.cancelled()
+    assert operation.completed <= 1
+    assert closed.is_set()
+    assert not operation.cancel()
+
+
+def test_cancel_rollback(seq):
+    gate = threading.Event()
+    transaction = Transaction()
+
+    def gated(moves):
+        for item in moves:
+            gate.wait()
+            yield item
+
+    with WorkerPool() as pool:
+        operation = pool.submit(gated(seq.move_iter("/delivery", None, transaction)))
+        operation.pause()
+        gate.set()
+        operation.wait(0.05)
+        operation.cancel()
+
+    transaction.rollback()
+    assert len(seq.storage.list_names(FOLDER)) == 10
+
+
+def test_timeout():
+    gate = threading.Event()
+    with WorkerPool() as pool:
+        operation = pool.submit(steps("a", list(), 1, gate))
+        with pytest.raises(TimeoutError):
+            operation.result(timeout=0.01)
+        gate.set()
+
+
+def test_close_cancels_paused():
+    pool = WorkerPool()
+    gate = threading.Event()
+    operation = pool.submit(steps("a", list(), 3, gate))
+    operation.pause()
+    gate.set()
+
+    pool.close()
+    assert operation.cancelled()
+    with pytest.raises(RuntimeError):
+        pool.submit(steps("a", list(), 3))
+
+
+def test_close_cancel():
+    gate = threading.Event()
+    pool = WorkerPool()
+    operation = pool.submit(steps("a", list(), 1000, gate))
+    gate.set()
+
+    pool.close(cancel=True)
+    assert operation.cancelled()
+    assert operation.completed < 1000
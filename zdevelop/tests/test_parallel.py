@@ -0,0 +1,88 @@
+import pytest
+from functools import partial
+
+from perfsprocket import NamePatterns, ProcessBackend, SeqName
+from perfsprocket._hashing import hash_file
+
+
+NAMES = [
+    "plate.0100.exr",
+    "plate.[0100-0200].exr",
+    "plate.{0100-0200}.exr",
+    "plate.-0005.exr",
+    "plate.%04d.exr",
+    "shot_0100_v001.exr",
+    "plate.[0100-0200}.exr",
+    "notes.txt",
+]
+
+
+@pytest.fixture(scope="module")
+def backend():
+    with ProcessBackend(workers=2, chunk_size=3, hash_chunk_size=2) as backend:
+        yield backend
+
+
+def _double_all(offset, chunk):
+    return [item * 2 + offset for item in chunk]
+
+
+class TestProcessBackend:
+    @pytest.mark.parametrize(
+        "kwargs", [{"workers": 0}, {"chunk_size": 0}, {"hash_chunk_size": 0}]
+    )
+    def test_invalid_raises(self, kwargs):
+        with pytest.raises(ValueError):
+            ProcessBackend(**kwargs)
+
+    def test_map_iter(self, backend):
+        results = dict()
+        for chunk, result in backend.map_iter(partial(_double_all, 1), range(10)):
+            assert len(chunk) <= 3
+            results.update(zip(chunk, result))
+
+        assert results == {i: i * 2 + 1 for i in range(10)}
+
+    def test_map_iter_lazy(self, backend):
+        items = (i for i in range(10))
+        results = [
+            result for _, result in backend.map_iter(partial(_double_all, 0), items)
+        ]
+        assert sorted(sum(results, [])) == [i * 2 for i in range(10)]
+
+    def test_parse_iter(self, backend):
+        parsed = dict(backend.parse_iter(NAMES))
+
+        assert set(parsed) == set(NAMES)
+        for name in NAMES[:6]:
+            assert parsed[name] == SeqName.from_path(name)
+            assert str(parsed[name]) == name
+        assert parsed["plate.[0100-0200}.exr"] is None
+        assert parsed["notes.txt"] is None
+
+    def test_parse_iter_patterns(self, backend):
+        patterns = NamePatterns(
+            [("version", r"(?P<base>.+)(?P<sep>-v)(?P<start>\d+)(?P<extension>\..+)")]
+        )
+        parsed = dict(
+            backend.parse_iter(["plate-v001.exr", "plate.0001.exr"], patterns)
+        )
+
+        assert parsed["plate-v001.exr"].start == 1
+        assert parsed["plate-v001.exr"].pad == 3
+        assert parsed["plate.0001.exr"] is None
+
+    def test_hash_iter(self, backend, tmp_path):
+        paths = list()
+        for i in range(5):
+            path = tmp_path / f"file.{i}.bin"
+            path.write_bytes(bytes([i]) * (i * 1000))
+            paths.append(path)
+
+        digests = dict(backend.hash_iter(paths, algorithm="md5"))
+
+        assert digests == {path: hash_file(path, "md5") for path in paths}
+
+    def test_hash_iter_missing_raises(self, backend, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            list(backend.hash_iter([tmp_path / "missing.bin"]))
@@ -0,0 +1,109 @@
+import time
+import pytest
+from pathlib import Path
+
+from perfsprocket import FileSequence, MemoryStorage, RateLimit
+from perfsprocket._rate_limit import limits_for
+
+
+FOLDER = Path("/shots")
+
+
+@pytest.fixture
+def seq() -> FileSequence:
+    storage = MemoryStorage()
+    storage.create_files(
+        (FOLDER / f"plate.{frame:04}.exr" for frame in range(1, 12)), data=b"x" * 100
+    )
+    storage.mkdir("/delivery")
+    return FileSequence(FOLDER / "plate.####.exr", 1, 11, storage=storage)
+
+
+def timed(func, *args, **kwargs) -> float:
+    start = time.monotonic()
+    func(*args, **kwargs)
+    return time.monotonic() - start
+
+
+def test_unlimited_does_not_wait():
+    limit = RateLimit()
+    assert limit.acquire(1 << 30, 1000) == 0.0
+
+
+def test_files_per_second(seq):
+    # one file is let through at once, the other ten wait 10ms each.
+    limit = RateLimit(files_per_second=100, burst=0.01)
+    assert timed(seq.copy, "/delivery", rate_limit=limit) >= 0.09
+
+
+def test_bytes_per_second(seq):
+    # eleven 100 byte frames, 100 bytes of burst.
+    limit = RateLimit(bytes_per_second=10_000, burst=0.01)
+    assert timed(seq.copy, "/delivery", rate_limit=limit) >= 0.09
+
+    # renames move no data, so bytes are not limited.
+    assert timed(seq.move, "/delivery", rate_limit=limit) < 0.05
+
+
+def test_move_paced_between_yields(seq):
+    # waits come between moves, rather than all before the first.
+    limit = RateLimit(files_per_second=50, burst=0.02)
+    times = [time.monotonic()]
+    for _ in seq.move_iter("/delivery", rate_limit=limit):
+        times.append(time.monotonic())
+
+    gaps = [later - earlier for earlier, later in zip(times[1:], times[2:-1])]
+    assert len(gaps) == 10
+    assert min(gaps) >= 0.015
+
+
+def test_move_between_devices_bytes_per_second(seq):
+    # moves between devices copy data, so bytes are limited.
+    seq.storage.mount("/mnt/delivery")
+    limit = RateLimit(bytes_per_second=10_000, burst=0.01)
+    assert timed(seq.move, "/mnt/delivery", rate_limit=limit) >= 0.09
+
+
+def test_change_rate():
+    limit = RateLimit(files_per_second=1)
+    limit.acquire(files=1)
+    assert limit.acquire(files=1) > 0.5
+
+    limit.files_per_second = 1000
+    assert limit.acquire(files=1) < 0.01
+    limit.files_per_second = None
+    assert limit.acquire(files=1000) == 0.0
+
+    with pytest.raises(ValueError):
+        limit.bytes_per_second = 0
+
+
+def test_apply_to(seq):
+    outer = RateLimit(files_per_second=10)
+    inner = RateLimit(files_per_second=100, burst=0.01)
+    outer.apply_to("/delivery")
+    inner.apply_to("/delivery/plates")
+    try:
+        assert limits_for(Path("/delivery/plates/left"), None) == [inner]
+        assert limits_for(Path("/delivery"), inner) == [inner, outer]
+        assert limits_for(Path("/shots"), None) == []
+
+        seq.storage.mkdir("/delivery/plates")
+        assert timed(seq.copy, "/delivery/plates") >= 0.09
+    finally:
+        RateLimit.remove_from("/delivery")
+        RateLimit.remove_from("/delivery/plates")
+
+    assert limits_for(Path("/delivery"), None) == []
+
+
+def test_set_global(seq):
+    limit = RateLimit(files_per_second=100, burst=0.01)
+    RateLimit.set_global(limit)
+    try:
+        assert limits_for(Path("/delivery"), None) == [limit]
+        assert timed(seq.copy, "/delivery") >= 0.09
+    finally:
+        RateLimit.set_global(None)
+
+    assert limits_for(Path("/delivery"), None) == []
@@ -0,0 +1,65 @@
+import pytest
+
+from perfsprocket._rename_plan import plan_renames, RenameStep
+
+
+def run_in_memory(files: dict, plan: list) -> dict:
+    """applies a plan to a name -> content dict, failing on any overwrite"""
+    files = dict(files)
+    for step in plan:
+        assert step.dst not in files, f"overwrote {step.dst}"
+        files[step.dst] = files.pop(step.src)
+    return files
+
+
+@pytest.mark.parametrize(
+    "pairs",
+    [
+        # shift up, shift down, no overlap
+        [("1", "2"), ("2", "3"), ("3", "4")],
+        [("2", "1"), ("3", "2"), ("4", "3")],
+        [("1", "a"), ("2", "b")],
+        # swap and longer cycles
+        [("1", "2"), ("2", "1")],
+        [("1", "2"), ("2", "3"), ("3", "1")],
+        # chain feeding into a cycle's neighbour, plus an unchanged name
+        [("0", "1"), ("1", "2"), ("2", "1x"), ("3", "3"), ("4", "5"), ("5", "4")],
+    ],
+)
+def test_plan_renames(pairs):
+    files = {src: f"content {src}" for src, _ in pairs}
+    plan = plan_renames(pairs, list(files) + ["other"])
+
+    result = run_in_memory(files, plan)
+
+    assert result == {dst: f"content {src}" for src, dst in pairs}
+    originals = [step.original for step in plan if step.original is not None]
+    assert sorted(originals) == sorted(src for src, dst in pairs if src != dst)
+
+
+def test_plan_cycle_uses_one_temp_name():
+    plan = plan_renames([("1", "2"), ("2", "3"), ("3", "1")], ["1", "2", "3"])
+
+    assert len(plan) == 4
+    assert plan[0] == RenameStep("1", plan[0].dst, None)
+    assert plan[0].dst not in {"1", "2", "3"}
+
+
+def test_plan_temp_name_avoids_existing():
+    existing = ["1", "2", ".1.renaming-0"]
+    plan = plan_renames([("1", "2"), ("2", "1")], existing)
+
+    assert plan[0].dst == ".1.renaming-1"
+
+
+@pytest.mark.parametrize(
+    "pairs,existing,error",
+    [
+        ([("1", "2")], ["2"], FileNotFoundError),
+        ([("1", "2")], ["1", "2"], FileExistsError),
+        ([("1", "3"), ("2", "3")], ["1", "2"], ValueError),
+    ],
+)
+def test_plan_renames_raises(pairs, existing, error):
+    with pytest.raises(error):
+        plan_renames(pairs, existing)
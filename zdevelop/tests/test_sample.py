@@ -0,0 +1,155 @@
+import pytest
+from pathlib import Path
+
+from perfsprocket import (
+    FileSequence,
+    FrameSet,
+    MemoryStorage,
+    ProcessBackend,
+    SampledSequence,
+)
+
+
+FOLDER = Path("/shots")
+
+
+@pytest.fixture
+def storage() -> MemoryStorage:
+    storage = MemoryStorage()
+    storage.create_files(
+        (FOLDER / f"plate.{frame:04}.exr" for frame in range(1, 101)), data=b"xx"
+    )
+    storage.mkdir("/review")
+    return storage
+
+
+@pytest.fixture
+def seq(storage) -> FileSequence:
+    return FileSequence(FOLDER / "plate.####.exr", 1, 100, storage=storage)
+
+
+def test_step():
+    seq = FileSequence("/shots/plate.######.exr", 1, 200_000)
+    sample = seq.sample(step=24)
+
+    assert isinstance(sample, SampledSequence)
+    assert len(sample) == 8334
+    assert sample[1] == Path("/shots/plate.000025.exr")
+    assert sample[-1] == Path("/shots/plate.199993.exr")
+    assert repr(sample) == (
+        "<SampledSequence: '/shots/plate.[000001-200000].exr' 8334 frames>"
+    )
+
+
+def test_step_of_stepped():
+    sample = FileSequence("/shots/plate.####.exr", 1, 99, step=2).sample(step=3)
+    assert sample.frames == FrameSet.from_frames(range(1, 98, 6))
+
+
+@pytest.mark.parametrize(
+    "count, frames",
+    [(1, "1"), (3, "1,6,10"), (4, "1,4,7,10"), (10, "1-10"), (50, "1-10")],
+)
+def test_count(count, frames):
+    sample = FileSequence("/shots/plate.####.exr", 1, 10).sample(count=count)
+    assert sample.frames == FrameSet.from_str(frames)
+
+
+def test_frames(seq):
+    sample = seq.sample(frames=[48, 12, 12, 96])
+    assert [path.name for path in sample] == [
+        "plate.0012.exr",
+        "plate.0048.exr",
+        "plate.0096.exr",
+    ]
+    assert [path.name for path in reversed(sample)][0] == "plate.0096.exr"
+    assert len(seq.sample(frames=FrameSet.from_str("10-19"))) == 10
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(), dict(step=2, count=2), dict(step=0), dict(count=0)],
+)
+def test_invalid(seq, kwargs):
+    with pytest.raises(ValueError):
+        seq.sample(**kwargs)
+
+
+@pytest.mark.parametrize("frames", [[0], [101], [50, 200]])
+def test_frames_outside(seq, frames):
+    with pytest.raises(IndexError):
+        seq.sample(frames=frames)
+
+
+def test_slice(seq):
+    sample = seq.sample(step=10)
+    assert sample[2:4].frames == FrameSet.from_str("21,31")
+    assert sample[::-1][0] == sample[0]
+
+
+def test_copy_du(seq, storage):
+    sample = seq.sample(step=24)
+
+    copied = sample.copy("/review")
+
+    assert isinstance(copied, SampledSequence)
+    assert copied.frames == sample.frames
+    assert copied.path == Path("/review/plate.0001.exr")
+    assert len(storage.list_names(Path("/review"))) == 5
+    assert copied.du().apparent == 10
+
+
+def test_move_delete(seq, storage):
+    moved = seq.sample(count=3).move("/review")
+    assert sorted(storage.list_names(Path("/review"))) == [
+        "plate.0001.exr",
+        "plate.0051.exr",
+        "plate.0100.exr",
+    ]
+
+    moved.delete()
+    assert storage.list_names(Path("/review")) == []
+    assert len(storage) == 97
+
+
+def test_hash(file_seq_for_operation):
+    seq = file_seq_for_operation[0]
+    sample = seq.sample(step=50)
+    with ProcessBackend(workers=1) as backend:
+        digests = dict(backend.hash_iter(sample))
+    assert list(digests) == list(sample)
+
+
+def test_rename(seq, storage):
+    renamed = seq.sample(frames=[10, 20, 25]).rename("review.0001.exr")
+
+    assert isinstance(renamed, SampledSequence)
+    assert str(renamed.frames) == "1,11,16"
+    assert storage.read_bytes(FOLDER / "review.0016.exr") == b"xx"
+
+
+def test_compact(seq, storage):
+    review = seq.sample(step=10).copy("/review")
+
+    compacted = review.compact("review.1001.exr")
+
+    assert compacted.to_spec() == "/review/review.[1001-1010].exr"
+    assert len(storage.list_names(Path("/review"))) == 10
+
+
+def test_compact_in_place(seq, storage):
+    # new names of sampled frames land on frames left out of the sample.
+    with pytest.raises(FileExistsError):
+        seq.sample(step=2).compact()
+    assert len(storage) == 100
+
+    compacted = seq[90:].sample(step=3).copy("/review").compact()
+    assert compacted.to_spec() == "/review/plate.[0091-0094].exr"
+
+
+def test_subsequences(seq):
+    sample = seq.sample(frames=FrameSet.from_str("1-10,50-59"))
+    assert [sub.to_spec() for sub in sample.subsequences()] == [
+        "/shots/plate.[0001-0010].exr",
+        "/shots/plate.[0050-0059].exr",
+    ]
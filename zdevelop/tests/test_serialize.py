@@ -0,0 +1,126 @@
+import json
+import pickle
+import pytest
+from pathlib import Path
+
+from perfsprocket import (
+    Braces,
+    BRACKET,
+    CURLY,
+    File,
+    FileName,
+    FileSequence,
+    SeqName,
+    decode_files,
+    encode_files,
+)
+
+
+@pytest.fixture
+def items() -> list:
+    folder = Path("/Volumes/disk/shots")
+    return [
+        FileSequence(folder / "shot.####.exr", 1001, 1100),
+        FileSequence(folder / "shot.####.exr", 1001, 1100, step=2),
+        FileSequence(folder / "render_#.tif", 5, 11),
+        FileSequence(folder / "plate_{####}_v001.exr", 100, 102),
+        FileSequence(Path("/other") / "noext.###", 1, 3),
+        File(folder / "notes.txt"),
+    ]
+
+
+def assert_same_item(decoded, item) -> None:
+    assert type(decoded) is type(item)
+    assert repr(decoded) == repr(item)
+    assert list(decoded) == list(item)
+    assert decoded.name == item.name
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        FileName.from_path("notes.txt"),
+        SeqName.from_path("shot.1001.exr"),
+        SeqName.from_path("shot.[1001-1100].exr"),
+        SeqName.from_path("shot_{0100-0102}_v001.exr"),
+        SeqName.from_path("shot.####.exr"),
+        SeqName(base="shot", extension=".exr", brackets=Braces("|", "|")),
+    ],
+)
+def test_name_round_trips(name):
+    data = name.to_dict()
+    assert json.loads(json.dumps(data)) == data
+    assert type(name).from_dict(data) == name
+    assert pickle.loads(pickle.dumps(name)) == name
+
+
+def test_pickled_braces_are_constants():
+    assert pickle.loads(pickle.dumps(BRACKET)) is BRACKET
+    name = SeqName.from_path("shot.{0001-0010}.exr")
+    assert pickle.loads(pickle.dumps(name)).brackets is CURLY
+
+
+def test_file_round_trips(items):
+    for item in items:
+        data = item.to_dict()
+        assert data["type"] == type(item).__name__
+        assert json.loads(json.dumps(data)) == data
+
+        assert_same_item(type(item).from_dict(data), item)
+        assert_same_item(pickle.loads(pickle.dumps(item)), item)
+
+
+def test_spec(items):
+    seq = items[0]
+    assert seq.to_spec() == "/Volumes/disk/shots/shot.[1001-1100].exr"
+    assert items[1].to_spec() == "/Volumes/disk/shots/shot.[1001-1099x2].exr"
+    assert items[3].to_spec() == "/Volumes/disk/shots/plate_{0100-0102}_v001.exr"
+
+    for item in items[:-1]:
+        parsed = FileSequence.from_spec(item.to_spec())
+        assert parsed.to_spec() == item.to_spec()
+        assert list(parsed) == list(item)
+
+
+def test_spec_not_range():
+    with pytest.raises(ValueError):
+        FileSequence.from_spec("/shots/shot.1001.exr")
+
+
+def test_encode_decode(items):
+    data = encode_files(items)
+    decoded = decode_files(data)
+
+    assert len(decoded) == len(items)
+    for found, item in zip(decoded, items):
+        assert_same_item(found, item)
+
+    # Sequences of one name share the decoded name.
+    assert decoded[0].name is decoded[1].name
+
+
+def test_encode_shares_strings():
+    folder = Path("/Volumes/disk/shots")
+    seqs = [FileSequence(folder / "shot.####.exr", i, i + 10) for i in range(1000)]
+    assert len(encode_files(seqs)) < 50 * len(seqs)
+
+
+def test_encode_empty():
+    assert decode_files(encode_files([])) == []
+
+
+def test_encode_bad_item():
+    with pytest.raises(TypeError):
+        encode_files([SeqName.from_path("shot.1001.exr")])
+
+
+@pytest.mark.parametrize("cut", [3, 8, -1])
+def test_decode_corrupt(items, cut):
+    data = encode_files(items)
+    with pytest.raises(ValueError):
+        decode_files(data[:cut])
+
+
+def test_decode_not_encoded():
+    with pytest.raises(ValueError):
+        decode_files(b"not encoded at all")
@@ -0,0 +1,299 @@
+import datetime
+import io
+import itertools
+import pytest
+from pathlib import Path
+
+from perfsprocket import (
+    File,
+    FileSequence,
+    LocalStorage,
+    MemoryStorage,
+    ObjectStorage,
+    Transaction,
+)
+
+
+FOLDER = Path("/shots")
+
+
+@pytest.fixture
+def memory() -> MemoryStorage:
+    storage = MemoryStorage()
+    for frame in range(1, 11):
+        storage.write_bytes(FOLDER / f"plate.{frame:04}.exr", str(frame).encode())
+    storage.mkdir("/delivery")
+    return storage
+
+
+def seq_on(storage) -> FileSequence:
+    return FileSequence(FOLDER / "plate.####.exr", 1, 10, storage=storage)
+
+
+def test_local_default(file_seq_for_operation):
+    seq, dst = file_seq_for_operation
+    assert isinstance(seq.storage, LocalStorage)
+    assert seq.copy(dst).storage is seq.storage
+    assert seq.du().files == 101
+
+
+def test_memory_copy(memory):
+    copied = seq_on(memory).copy("/delivery")
+
+    assert copied.storage is memory
+    assert memory.read_bytes(Path("/delivery/plate.0005.exr")) == b"5"
+    assert len(memory) == 20
+
+
+def test_memory_move_rename(memory):
+    seq = seq_on(memory)
+
+    moved = seq.move("/delivery")
+    renamed = moved.rename("shot_0101.exr")
+
+    assert renamed.storage is memory
+    assert memory.list_names(Path("/shots")) == []
+    assert sorted(memory.list_names(Path("/delivery")))[0] == "shot_0101.exr"
+    assert [memory.read_bytes(path) for path in renamed][-1] == b"10"
+
+
+def test_memory_renumber(memory):
+    renumbered = seq_on(memory).renumber(start=2, pad=2)
+
+    assert renumbered.storage is memory
+    assert memory.read_bytes(FOLDER / "plate.02.exr") == b"1"
+    assert memory.read_bytes(FOLDER / "plate.11.exr") == b"10"
+    assert len(memory) == 10
+
+
+def test_memory_delete_chmod_du(memory):
+    seq = seq_on(memory)
+    seq.chmod(0o600)
+    assert memory.stat(FOLDER / "plate.0001.exr").st_mode & 0o777 == 0o600
+
+    seq[:3].delete()
+    usage = seq.du()
+    assert usage.files == 7
+    assert usage.missing == 3
+    # frame 10 holds two bytes.
+    assert usage.apparent == 8
+
+
+def test_memory_file(memory):
+    file = File(FOLDER / "plate.0001.exr", storage=memory)
+    renamed = file.rename("notes.txt")
+    assert renamed.storage is memory
+    assert memory.read_bytes(FOLDER / "notes.txt") == b"1"
+
+    with pytest.raises(FileNotFoundError):
+        file.delete()
+
+
+def test_memory_open(memory):
+    with memory.open(FOLDER / "new.txt", "wb") as f:
+        f.write(b"data")
+    with memory.open(FOLDER / "new.txt") as f:
+        assert f.read() == b"data"
+
+
+def test_memory_transaction(memory):
+    seq = seq_on(memory)
+    with pytest.raises(RuntimeError):
+        with Transaction() as transaction:
+            seq.move("/delivery", transaction=transaction)
+            raise RuntimeError
+
+    assert len(memory.list_names(FOLDER)) == 10
+
+
+def test_engine_needs_local(memory):
+    with pytest.raises(ValueError):
+        seq_on(memory).copy("/delivery", link="hard")
+
+
+class ClientError(Exception):
+    def __init__(self, code: str):
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+class FakeClient:
+    """
+    S3 client double holding objects of one bucket in a dict. Multipart uploads are
+    shared between clients, as a request may use any client of the pool.
+    """
+
+    created = 0
+    uploads: dict = dict()
+    ids = itertools.count()
+
+    def __init__(self, objects: dict, log: list):
+        FakeClient.created += 1
+        self.objects = objects
+        self.log = log
+
+    def _get(self, key: str) -> bytes:
+        if key not in self.objects:
+            raise ClientError("404")
+        return self.objects[key]
+
+    def head_object(self, Bucket, Key):
+        self.log.append("head")
+        modified = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        return {"ContentLength": len(self._get(Key)), "LastModified": modified}
+
+    def get_object(self, Bucket, Key):
+        return {"Body": io.BytesIO(self._get(Key))}
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects[Key] = Body
+
+    def copy_object(self, Bucket, Key, CopySource):
+        self.log.append("copy")
+        self.objects[Key] = self._get(CopySource["Key"])
+
+    def delete_objects(self, Bucket, Delete):
+        self.log.append("delete")
+        for obj in Delete["Objects"]:
+            self.objects.pop(obj["Key"], None)
+        return {}
+
+    def list_objects_v2(self, Bucket, Prefix, Delimiter, ContinuationToken="0"):
+        self.log.append("list")
+        keys = sorted(key for key in self.objects if key.startswith(Prefix))
+        start = int(ContinuationToken)
+        page = keys[start : start + 4]  # noqa: E203
+        return {
+            "Contents": [
+                {"Key": key, "Size": len(self.objects[key])}
+                for key in page
+                if Delimiter not in key[len(Prefix) :]  # noqa: E203
+            ],
+            "IsTruncated": start + 4 < len(keys),
+            "NextContinuationToken": str(start + 4),
+        }
+
+    def create_multipart_upload(self, Bucket, Key):
+        upload_id = str(next(self.ids))
+        self.uploads[upload_id] = dict()
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.log.append("part")
+        self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": str(PartNumber)}
+
+    def upload_part_copy(
+        self, Bucket, Key, UploadId, PartNumber, CopySource, CopySourceRange
+    ):
+        self.log.append("part")
+        first, last = CopySourceRange[len("bytes=") :].split("-")  # noqa: E203
+        data = self._get(CopySource["Key"])[int(first) : int(last) + 1]  # noqa: E203
+        self.uploads[UploadId][PartNumber] = data
+        return {"CopyPartResult": {"ETag": str(PartNumber)}}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        self.objects[Key] = b"".join(parts[number] for number in numbers)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId)
+
+
+@pytest.fixture
+def objects() -> dict:
+    return {f"shots/plate.{frame:04}.exr": b"x" * frame for frame in range(1, 11)}
+
+
+@pytest.fixture
+def log() -> list:
+    return list()
+
+
+@pytest.fixture
+def store(objects, log) -> ObjectStorage:
+    FakeClient.created = 0
+    FakeClient.uploads.clear()
+    return ObjectStorage(
+        lambda: FakeClient(objects, log),
+        "bucket",
+        workers=2,
+        multipart_threshold=8,
+        part_size=3,
+    )
+
+
+def test_object_du(store, log):
+    usage = seq_on(store).du()
+
+    assert usage.files == 10
+    assert usage.apparent == sum(range(1, 11))
+    # one listing of the folder, three pages long.
+    assert log == ["list"] * 3
+
+
+def test_object_copy(store, objects, log):
+    copied = seq_on(store).copy("/delivery")
+
+    assert copied.storage is store
+    assert objects["delivery/plate.0010.exr"] == b"x" * 10
+    assert objects["delivery/plate.0007.exr"] == b"x" * 7
+    # frames from 8 bytes are copied in 3 byte parts.
+    assert log.count("copy") == 7
+    assert log.count("part") == 3 + 3 + 4
+    assert FakeClient.created <= 2
+
+
+def test_object_move_delete(store, objects, log):
+    moved = seq_on(store).move("/delivery")
+
+    assert not any(key.startswith("shots/") for key in objects)
+    assert log.count("delete") == 1
+
+    moved.delete()
+    assert not objects
+
+
+def test_object_renumber(store, objects):
+    seq_on(store).renumber(start=11)
+    assert sorted(objects)[0] == "shots/plate.0011.exr"
+    assert objects["shots/plate.0020.exr"] == b"x" * 10
+
+
+def test_object_renumber_overlap(store, objects):
+    # every frame but the first lands on the key of another frame.
+    seq_on(store).renumber(start=2)
+    assert sorted(objects) == [f"shots/plate.{frame:04}.exr" for frame in range(2, 12)]
+    for frame in range(2, 12):
+        assert objects[f"shots/plate.{frame:04}.exr"] == b"x" * (frame - 1)
+
+
+def test_object_rename_overlap(store, objects):
+    renamed = seq_on(store).rename("/shots/plate.0002.exr")
+
+    assert renamed.start == 2
+    assert sorted(objects) == [f"shots/plate.{frame:04}.exr" for frame in range(2, 12)]
+    assert objects["shots/plate.0011.exr"] == b"x" * 10
+    assert objects["shots/plate.0002.exr"] == b"x"
+
+
+def test_object_missing(store):
+    with pytest.raises(FileNotFoundError):
+        store.stat(Path("/shots/missing.exr"))
+    with pytest.raises(FileNotFoundError):
+        File("/shots/missing.exr", storage=store).copy("/delivery")
+
+
+def test_object_open(store, objects, log):
+    with store.open(Path("/shots/small.txt"), "wb") as f:
+        f.write(b"ab")
+    assert objects["shots/small.txt"] == b"ab"
+
+    with store.open(Path("/shots/large.txt"), "wb") as f:
+        f.write(b"abcdefg")
+    assert objects["shots/large.txt"] == b"abcdefg"
+    assert log.count("part") == 3
+
+    with store.open(Path("/shots/large.txt")) as f:
+        assert f.read() == b"abcdefg"
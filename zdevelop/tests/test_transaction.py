@@ -0,0 +1,110 @@
+import pytest
+
+from perfsprocket import FileSequence, Transaction
+
+
+def names_in(folder) -> set:
+    return {path.name for path in folder.iterdir()}
+
+
+def test_move_rolls_back_on_failure(file_seq_for_operation):
+    seq, dst = file_seq_for_operation
+    before = names_in(seq.path.parent)
+    # renaming a file onto a folder fails partway through the sequence.
+    (dst / "file.150.txt").mkdir()
+
+    with pytest.raises(OSError):
+        with Transaction() as transaction:
+            seq.move(dst, transaction=transaction)
+
+    assert names_in(seq.path.parent) == before
+    assert names_in(dst) == {"file.150.txt"}
+    assert len(transaction) == 0
+
+
+def test_rename_rolls_back_on_failure(file_seq_for_operation):
+    seq, _ = file_seq_for_operation
+    folder = seq.path.parent
+    before = names_in(folder)
+    (folder / "renamed.150.txt").mkdir()
+
+    with pytest.raises(OSError):
+        with Transaction() as transaction:
+            seq.rename("renamed.###.txt", transaction=transaction)
+
+    assert names_in(folder) == before | {"renamed.150.txt"}
+
+
+def test_chained_operations(file_seq_for_operation):
+    seq, dst = file_seq_for_operation
+    before = names_in(seq.path.parent)
+
+    transaction = Transaction()
+    moved = seq.move(dst, transaction=transaction)
+    renamed = moved.rename("renamed.###.txt", transaction=transaction)
+    renamed.renumber(start=1, pad=4, transaction=transaction)
+    assert len(transaction) == 303
+    assert not names_in(seq.path.parent)
+
+    restored = list(transaction.rollback_iter())
+
+    assert len(restored) == 303
+    assert restored[-1] == (moved.path, seq.path)
+    assert names_in(seq.path.parent) == before
+    assert not names_in(dst)
+    assert all(path.is_file() for path in seq)
+
+
+def test_renumber_rolls_back(tmp_path):
+    for i in range(1, 4):
+        (tmp_path / f"file.{i}.txt").write_text(str(i))
+    seq = FileSequence(tmp_path / "file.#.txt", 1, 3)
+
+    # new names overlap old ones, so renames run in a planned order.
+    transaction = Transaction()
+    seq.renumber(start=2, transaction=transaction)
+    assert names_in(tmp_path) == {"file.2.txt", "file.3.txt", "file.4.txt"}
+
+    transaction.rollback()
+    assert [path.read_text() for path in seq] == ["1", "2", "3"]
+    assert names_in(tmp_path) == {"file.1.txt", "file.2.txt", "file.3.txt"}
+
+
+def test_commit(file_seq_for_operation):
+    seq, dst = file_seq_for_operation
+
+    with Transaction() as transaction:
+        moved = seq.move(dst, transaction=transaction)
+
+    assert len(transaction) == 0
+    transaction.rollback()
+    assert all(path.is_file() for path in moved)
+
+
+def test_file_rename(single_file_for_operation):
+    single, _ = single_file_for_operation
+    transaction = Transaction()
+    renamed = single.rename("renamed.txt", transaction=transaction)
+    assert not single.path.exists()
+
+    transaction.rollback()
+    assert single.path.is_file()
+    assert not renamed.path.exists()
+
+
+def test_rollback_failure_keeps_steps(file_seq_for_operation):
+    seq, dst = file_seq_for_operation
+    transaction = Transaction()
+    seq.move(dst, transaction=transaction)
+
+    # frame 150 cannot be moved back while its original name is taken by a folder.
+    (seq.path.parent / "file.150.txt").mkdir()
+    with pytest.raises(OSError):
+        transaction.rollback()
+
+    assert len(transaction) == 1
+    assert names_in(dst) == {"file.150.txt"}
+
+    (seq.path.parent / "file.150.txt").rmdir()
+    transaction.rollback()
+    assert all(path.is_file() for path in seq)
@@ -0,0 +1,67 @@
+import os
+import pytest
+from pathlib import Path
+
+from perfsprocket import File, FileSequence, Usage, usage, usage_iter
+
+
+@pytest.fixture
+def tree(tmp_path) -> Path:
+    """nested folders of sequences of known sizes"""
+    shot = tmp_path / "show" / "shot"
+    shot.mkdir(parents=True)
+    for i in range(1, 11):
+        (shot / f"plate.{i:04d}.exr").write_bytes(b"x" * i * 100)
+    (tmp_path / "show" / "notes.txt").write_bytes(b"notes")
+    (tmp_path / "empty").mkdir()
+    os.symlink(str(shot), str(tmp_path / "link"))
+    return tmp_path
+
+
+def test_du_sequence(tree):
+    seq = FileSequence(tree / "show" / "shot" / "plate.####.exr", 1, 12)
+    found = seq.du()
+
+    assert found.files == 10
+    assert found.missing == 2
+    assert found.apparent == sum(i * 100 for i in range(1, 11))
+    assert found.min_size == 100
+    assert found.max_size == 1000
+    assert found.mean_size == 550
+    assert found.allocated >= 0
+
+
+def test_du_file(tree):
+    found = File(tree / "show" / "notes.txt").du()
+    assert found == Usage(1, 0, 5, found.allocated, 5, 5)
+
+
+def test_du_missing(tmp_path):
+    found = FileSequence(tmp_path / "nope" / "file.#.exr", 1, 3).du()
+    assert found == Usage(0, 3, 0, 0, None, None)
+    assert found.mean_size is None
+
+
+def test_usage(tree):
+    found = usage(tree, workers=2)
+
+    assert [str(item.path.relative_to(tree)) for item, _ in found] == [
+        "show/notes.txt",
+        "show/shot/plate.0001.exr",
+    ]
+    assert isinstance(found[1][0], FileSequence)
+    assert len(found[1][0]) == 10
+    assert found[1][1] == FileSequence(found[1][0].path, 1, 10).du()
+
+
+def test_usage_total(tree):
+    total = Usage.total(found for _, found in usage_iter(tree))
+
+    assert total.files == 11
+    assert total.apparent == 5505
+    assert total.min_size == 5
+    assert total.max_size == 1000
+
+
+def test_total_empty():
+    assert Usage.total([]) == Usage(0, 0, 0, 0, None, None)